@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Compare transcription backends by real-time factor on the same audio
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import ffmpeg
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from src.core.transcription import ENGINES, create_engine
+
+
+def load_audio(path: str, max_seconds: float = None) -> np.ndarray:
+    """Decode any media file to 16 kHz mono float32"""
+    stream = ffmpeg.input(path, t=max_seconds) if max_seconds else ffmpeg.input(path)
+    out, _ = (
+        stream
+        .output('-', format='s16le', acodec='pcm_s16le', ac=1, ar='16k')
+        .run(capture_stdout=True, capture_stderr=True)
+    )
+    return np.frombuffer(out, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcription backends")
+    parser.add_argument("input", help="Audio or video file")
+    parser.add_argument("--backends", nargs="+", default=list(ENGINES), help="Backends to compare")
+    parser.add_argument("--model", default="base", help="Model size")
+    parser.add_argument("--language", default=None, help="Language code (default: detect)")
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads per backend")
+    parser.add_argument("--batch-size", type=int, default=1, help="Batched decoding size where supported")
+    parser.add_argument("--compute-type", default="int8", help="faster-whisper quantization")
+    parser.add_argument("--seconds", type=float, default=None, help="Only use the first N seconds")
+    args = parser.parse_args()
+
+    audio = load_audio(args.input, args.seconds)
+    audio_seconds = len(audio) / 16000
+    print(f"🎧 {args.input}: {audio_seconds:.1f}s of audio")
+
+    results = []
+    for backend in args.backends:
+        whisper_config = {
+            'backend': backend,
+            'model': args.model,
+            'threads': args.threads,
+            'batch_size': args.batch_size,
+            'compute_type': args.compute_type,
+        }
+
+        try:
+            load_start = time.perf_counter()
+            engine = create_engine(whisper_config)
+            load_seconds = time.perf_counter() - load_start
+
+            run_start = time.perf_counter()
+            transcript = engine.transcribe(audio, args.language)
+            run_seconds = time.perf_counter() - run_start
+        except Exception as e:
+            print(f"❌ {backend}: {e}")
+            continue
+
+        words = sum(len(segment['words']) for segment in transcript['segments'])
+        results.append((backend, load_seconds, run_seconds, run_seconds / audio_seconds,
+                        len(transcript['segments']), words))
+
+    print()
+    print(f"{'backend':<16} {'load s':>8} {'run s':>8} {'RTF':>7} {'segments':>9} {'words':>7}")
+    for backend, load_seconds, run_seconds, rtf, segments, words in results:
+        print(f"{backend:<16} {load_seconds:>8.1f} {run_seconds:>8.1f} {rtf:>7.3f} {segments:>9} {words:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -407,6 +407,8 @@ class ClippyGUI:
 
     def run(self):
         self.root.mainloop()
+        if self.agent:
+            self.agent.shutdown()
 
 
 def main():
@@ -15,8 +15,10 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.core.video_processor import VideoProcessor
 from src.core.content_analyzer import ContentAnalyzer
 from src.core.platform_manager import PlatformManager
+from src.core.batch_pipeline import BatchPipeline
 from src.utils.config import Config
 from src.utils.scheduler import ClippyScheduler
+from src.utils.executors import get_executor_manager
 
 
 class ClippyAgent:
@@ -77,66 +79,117 @@ class ClippyAgent:
         try:
             logger.info(f"🎯 Starting video processing: {input_source}")
             
-            # Step 1: Download and transcribe video
-            logger.info("📥 Step 1: Video intake and transcription")
-            video_data = await self.video_processor.process_input(input_source)
-            
-            if not video_data:
-                logger.error("❌ Failed to process video input")
-                return []
-            
-            # Step 2: Analyze content and detect highlights
-            logger.info("🧠 Step 2: Content analysis and highlight detection")
-            highlights = await self.content_analyzer.find_highlights(
-                video_data["transcript"],
-                video_data["metadata"]
-            )
-            
-            if not highlights:
-                logger.warning("⚠️ No highlights found in video")
-                return []
-            
-            logger.info(f"✨ Found {len(highlights)} potential clips")
-            
-            # Step 3: Generate clips
-            logger.info("🎞️ Step 3: Video clipping and editing")
-            clips = []
-            
-            for i, highlight in enumerate(highlights, 1):
-                logger.info(f"🔄 Processing clip {i}/{len(highlights)}")
-                
-                clip_data = await self.video_processor.create_clip(
-                    video_data,
-                    highlight,
-                    title_override=title
-                )
-                
-                if clip_data:
-                    clips.append(clip_data)
-                    logger.success(f"✅ Clip {i} created successfully")
-                else:
-                    logger.warning(f"⚠️ Failed to create clip {i}")
-            
-            # Step 4: Platform posting
-            if clips and self.config.get("platforms", {}).get("auto_post", True):
-                logger.info("📱 Step 4: Platform-specific posting")
-                posting_results = await self.platform_manager.post_clips(clips)
-                
-                # Step 5: Cleanup files after successful posting
-                if self.config.get("cleanup", {}).get("enabled", True):
-                    await self._cleanup_files(video_data, clips, posting_results)
+            job = {"source": input_source, "title": title}
+            for _, stage, _ in self._pipeline_stages():
+                if not await stage(job):
+                    break
             
-            logger.success(f"🎉 Video processing complete! Generated {len(clips)} clips")
-            return clips
+            return job.get("clips", [])
             
         except Exception as e:
             logger.error(f"❌ Error processing video: {str(e)}")
             return []
     
+    def _pipeline_stages(self) -> list:
+        """Ordered (name, handler, worker_count) stages of the processing pipeline"""
+        workers = self.config.get("app.pipeline.workers", {}) or {}
+        
+        return [
+            ("download", self._stage_intake, workers.get("download", 2)),
+            ("transcribe", self._stage_transcribe, workers.get("transcribe", 1)),
+            ("analyze", self._stage_analyze, workers.get("analyze", 1)),
+            ("render", self._stage_render, workers.get("render", 1)),
+            ("post", self._stage_post, workers.get("post", 2)),
+        ]
+    
+    async def _stage_intake(self, job: dict) -> bool:
+        """Step 1a: download or locate the source video"""
+        logger.info(f"📥 Step 1: Video intake and transcription ({job['source']})")
+        video_data = await self.video_processor.prepare_input(job["source"])
+        
+        if not video_data:
+            logger.error("❌ Failed to process video input")
+            return False
+        
+        job["video_data"] = video_data
+        return True
+    
+    async def _stage_transcribe(self, job: dict) -> bool:
+        """Step 1b: transcribe the source video"""
+        video_data = await self.video_processor.transcribe_input(job["video_data"])
+        
+        if not video_data:
+            logger.error("❌ Failed to process video input")
+            return False
+        
+        job["video_data"] = video_data
+        return True
+    
+    async def _stage_analyze(self, job: dict) -> bool:
+        """Step 2: analyze content and detect highlights"""
+        logger.info("🧠 Step 2: Content analysis and highlight detection")
+        video_data = job["video_data"]
+        highlights = await self.content_analyzer.find_highlights(
+            video_data["transcript"],
+            video_data["metadata"],
+            audio=video_data.get("audio")
+        )
+        
+        # The decoded PCM is not needed past analysis
+        video_data.pop("audio", None)
+        
+        if not highlights:
+            logger.warning("⚠️ No highlights found in video")
+            return False
+        
+        logger.info(f"✨ Found {len(highlights)} potential clips")
+        job["highlights"] = highlights
+        return True
+    
+    async def _stage_render(self, job: dict) -> bool:
+        """Step 3: generate clips"""
+        logger.info("🎞️ Step 3: Video clipping and editing")
+        clips = []
+        
+        # Render every highlight from a single open of the source
+        rendered = await self.video_processor.create_clips(
+            job["video_data"],
+            job["highlights"],
+            title_override=job.get("title")
+        )
+        
+        for i, clip_data in enumerate(rendered, 1):
+            if clip_data:
+                clips.append(clip_data)
+                logger.success(f"✅ Clip {i} created successfully")
+            else:
+                logger.warning(f"⚠️ Failed to create clip {i}")
+        
+        job["clips"] = clips
+        return True
+    
+    async def _stage_post(self, job: dict) -> bool:
+        """Steps 4 and 5: platform posting and cleanup"""
+        clips = job["clips"]
+        
+        if clips and self.config.get("platforms", {}).get("auto_post", True):
+            logger.info("📱 Step 4: Platform-specific posting")
+            posting_results = await self.platform_manager.post_clips(clips)
+            
+            # Step 5: Cleanup files after successful posting
+            if self.config.get("cleanup", {}).get("enabled", True):
+                await self._cleanup_files(job["video_data"], clips, posting_results)
+        
+        logger.success(f"🎉 Video processing complete! Generated {len(clips)} clips")
+        return True
+    
     async def batch_process(self, input_list: list) -> dict:
         """
         Process multiple videos in batch
         
+        Videos flow through a staged pipeline so that different videos can be
+        downloading, transcribing, analyzing, rendering and posting at once.
+        
         Args:
             input_list: List of video sources (URLs or file paths)
             
@@ -153,10 +206,15 @@ class ClippyAgent:
             "clips": []
         }
         
-        for i, video_source in enumerate(input_list, 1):
-            logger.info(f"📹 Processing video {i}/{len(input_list)}: {video_source}")
-            
-            clips = await self.process_video(video_source)
+        pipeline = BatchPipeline(
+            self._pipeline_stages(),
+            queue_size=self.config.get("app.pipeline.queue_size", 2),
+            max_in_flight=self.config.get("app.max_concurrent_jobs", 3)
+        )
+        jobs = [{"source": video_source, "title": None} for video_source in input_list]
+        
+        for job in await pipeline.run(jobs):
+            clips = job.get("clips", [])
             
             if clips:
                 results["successful"] += 1
@@ -267,6 +325,12 @@ class ClippyAgent:
         """Stop the automated scheduling system"""
         logger.info("⏹️ Stopping Clippy scheduler")
         self.scheduler.stop()
+    
+    def shutdown(self):
+        """Stop the scheduler and release worker threads and processes"""
+        if self.scheduler.is_running:
+            self.stop_scheduler()
+        get_executor_manager().shutdown()
 
 
 async def main():
@@ -339,6 +403,9 @@ async def main():
     except Exception as e:
         logger.error(f"❌ Fatal error: {str(e)}")
         sys.exit(1)
+    
+    finally:
+        clippy.shutdown()
 
 
 if __name__ == "__main__":
@@ -18,6 +18,10 @@ except ImportError:
     logger.warning("⚠️ GPT4All not available. Install with: pip install gpt4all")
 
 from ..utils.config import Config
+from ..utils.cache import DiskCache
+from ..utils.executors import get_executor_manager
+from ..utils.intervals import IntervalIndex
+from .llm_pool import LLMWorkerPool, resolve_pool_size
 
 
 class LLMAnalyzer:
@@ -28,11 +32,24 @@ class LLMAnalyzer:
         self.config = config
         self.ai_config = config.get_ai_config()
         self.llm_config = self.ai_config.get("llm", {})
+        self.executors = get_executor_manager(config)
         
         self.model = None
+        self.model_pool = None
         self.model_path = Path("./models")
         self.model_path.mkdir(exist_ok=True)
         
+        # Raw response cache keyed by model, prompt and sampling settings
+        storage_config = config.get_storage_config()
+        self.response_cache = None
+        if storage_config.get("cache_analysis", False):
+            self.response_cache = DiskCache(
+                storage_config.get("cache_path", "./cache"),
+                "llm_responses",
+                ttl_hours=storage_config.get("cache_duration_hours", 168),
+                max_size_mb=storage_config.get("cache_max_size_mb", 500)
+            )
+        
         # Initialize model if available
         if GPT4ALL_AVAILABLE:
             self._initialize_model()
@@ -51,18 +68,30 @@ class LLMAnalyzer:
                 logger.info(f"📥 Downloading LLM model: {model_name}")
                 # GPT4All will download automatically
             
-            self.model = GPT4All(
-                model_name=model_name,
-                model_path=str(self.model_path),
-                allow_download=True,
-                n_threads=4
-            )
+            workers, threads_per_worker = resolve_pool_size(self.llm_config)
+            # Chunks are packed to this window, so the model must be loaded with it
+            context_window = self.llm_config.get("context_window", 4096)
+            
+            def load_model(n_threads: int):
+                return GPT4All(
+                    model_name=model_name,
+                    model_path=str(self.model_path),
+                    allow_download=True,
+                    n_threads=n_threads,
+                    n_ctx=context_window
+                )
+            
+            self.model_pool = LLMWorkerPool(load_model, self.executors, workers, threads_per_worker)
+            if not self.model_pool.load():
+                raise RuntimeError("no model instance could be loaded")
+            self.model = self.model_pool.primary
             
             logger.success(f"✅ LLM model loaded: {model_name}")
             
         except Exception as e:
             logger.error(f"❌ Failed to initialize LLM model: {e}")
             self.model = None
+            self.model_pool = None
     
     async def analyze_content(self, full_transcript: str, segments: List[Dict[str, Any]], 
                             video_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -85,12 +114,15 @@ class LLMAnalyzer:
             logger.info("🤖 Running LLM content analysis...")
             
             # Split transcript into analyzable chunks
-            chunks = self._split_transcript(full_transcript, segments)
+            chunks = self._split_transcript(full_transcript, segments, video_metadata)
             
-            highlights = []
+            # Dispatch chunks to the model pool concurrently; gather keeps chunk order
+            chunk_results = await asyncio.gather(*[
+                self._analyze_chunk(chunk, video_metadata) for chunk in chunks
+            ])
             
-            for chunk in chunks:
-                chunk_highlights = await self._analyze_chunk(chunk, video_metadata)
+            highlights = []
+            for chunk_highlights in chunk_results:
                 highlights.extend(chunk_highlights)
             
             # Rank and filter highlights
@@ -103,49 +135,69 @@ class LLMAnalyzer:
             logger.error(f"❌ Error in LLM analysis: {e}")
             return await self._fallback_analysis(full_transcript, segments)
     
-    def _split_transcript(self, transcript: str, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Split transcript into analyzable chunks"""
-        chunks = []
-        chunk_size = 1000  # Characters per chunk
-        overlap = 200      # Overlap between chunks
+    def _count_tokens(self, text: str) -> int:
+        """
+        Estimate the token count of text for the configured model
         
-        # Group segments into chunks
-        current_chunk = {
-            'text': '',
-            'segments': [],
-            'start_time': 0,
-            'end_time': 0
-        }
+        GPT4All does not expose its tokenizer, so this uses a characters-per-token
+        ratio; 3.5 is slightly pessimistic for English with llama-family
+        tokenizers, which keeps packed chunks from overflowing the context.
+        """
+        chars_per_token = self.llm_config.get("chars_per_token", 3.5)
+        return int(len(text) / chars_per_token) + 1
+    
+    def _chunk_token_budget(self, video_metadata: Dict[str, Any]) -> int:
+        """Tokens available for transcript text once prompt and response are reserved"""
+        context_window = self.llm_config.get("context_window", 4096)
+        max_tokens = self.llm_config.get("max_tokens", 500)
+        prompt_tokens = self._count_tokens(self._create_analysis_prompt("", video_metadata))
+        safety_margin = 64
         
-        for segment in segments:
-            segment_text = segment['text']
-            
-            # Check if adding this segment would exceed chunk size
-            if len(current_chunk['text'] + segment_text) > chunk_size and current_chunk['text']:
-                # Finalize current chunk
-                current_chunk['end_time'] = current_chunk['segments'][-1]['end'] if current_chunk['segments'] else 0
-                chunks.append(current_chunk.copy())
-                
-                # Start new chunk with overlap
-                overlap_text = current_chunk['text'][-overlap:] if len(current_chunk['text']) > overlap else current_chunk['text']
-                current_chunk = {
-                    'text': overlap_text + ' ' + segment_text,
-                    'segments': [segment],
-                    'start_time': segment['start'],
-                    'end_time': segment['end']
-                }
-            else:
-                # Add to current chunk
-                if not current_chunk['segments']:
-                    current_chunk['start_time'] = segment['start']
-                
-                current_chunk['text'] += ' ' + segment_text
-                current_chunk['segments'].append(segment)
-                current_chunk['end_time'] = segment['end']
+        return max(256, context_window - prompt_tokens - max_tokens - safety_margin)
+    
+    def _split_transcript(self, transcript: str, segments: List[Dict[str, Any]],
+                          video_metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Split transcript into analyzable chunks
+        
+        Segments are packed until the chunk fills the model's context budget.
+        Consecutive chunks share whole trailing segments as overlap.
+        """
+        budget = self._chunk_token_budget(video_metadata or {})
+        overlap_budget = int(budget * self.llm_config.get("chunk_overlap_ratio", 0.1))
+        
+        segment_tokens = [self._count_tokens(segment['text']) + 1 for segment in segments]
+        
+        chunks = []
+        chunk_start = 0
         
-        # Add final chunk
-        if current_chunk['text']:
-            chunks.append(current_chunk)
+        while chunk_start < len(segments):
+            # Pack as many whole segments as fit the budget (always at least one)
+            chunk_end = chunk_start
+            used = 0
+            while chunk_end < len(segments) and (chunk_end == chunk_start or used + segment_tokens[chunk_end] <= budget):
+                used += segment_tokens[chunk_end]
+                chunk_end += 1
+            
+            chunk_segments = segments[chunk_start:chunk_end]
+            chunks.append({
+                'text': ' '.join(segment['text'] for segment in chunk_segments),
+                'segments': chunk_segments,
+                'start_time': chunk_segments[0]['start'],
+                'end_time': chunk_segments[-1]['end']
+            })
+            
+            if chunk_end >= len(segments):
+                break
+            
+            # Carry trailing segments into the next chunk, always moving forward
+            next_start = chunk_end
+            overlap_used = 0
+            while next_start - 1 > chunk_start and overlap_used + segment_tokens[next_start - 1] <= overlap_budget:
+                next_start -= 1
+                overlap_used += segment_tokens[next_start]
+            
+            chunk_start = next_start
         
         return chunks
     
@@ -156,11 +208,10 @@ class LLMAnalyzer:
             prompt = self._create_analysis_prompt(chunk['text'], video_metadata)
             
             # Generate response
-            response = self.model.generate(
+            response = await self._generate(
                 prompt,
                 max_tokens=self.llm_config.get("max_tokens", 500),
-                temp=self.llm_config.get("temperature", 0.7),
-                streaming=False
+                temp=self.llm_config.get("temperature", 0.7)
             )
             
             # Parse LLM response
@@ -172,6 +223,33 @@ class LLMAnalyzer:
             logger.warning(f"⚠️ Error analyzing chunk: {e}")
             return []
     
+    async def _generate(self, prompt: str, max_tokens: int, temp: float) -> str:
+        """Generate a response, reusing a cached one for an identical request"""
+        cache_key = None
+        if self.response_cache:
+            cache_key = DiskCache.make_key(
+                self.llm_config.get("model", "mistral-7b-instruct-v0.1.q4_0.gguf"),
+                prompt,
+                temp,
+                max_tokens
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("💾 LLM response loaded from cache")
+                return cached
+        
+        response = await self.model_pool.generate(
+            prompt,
+            max_tokens=max_tokens,
+            temp=temp,
+            streaming=False
+        )
+        
+        if cache_key:
+            self.response_cache.set(cache_key, response)
+        
+        return response
+    
     def _create_analysis_prompt(self, text: str, video_metadata: Dict[str, Any]) -> str:
         """Create prompt for LLM analysis"""
         video_context = f"Video Title: {video_metadata.get('title', 'Unknown')}\n"
@@ -258,10 +336,9 @@ Only identify segments with high viral potential. Quality over quantity."""
                         start_time = max(chunk['start_time'], start_time - needed_time / 2)
                         end_time = min(chunk['end_time'], end_time + needed_time / 2)
                     elif duration > max_duration:
-                        # Trim clip
-                        excess_time = duration - max_duration
-                        start_time += excess_time / 2
-                        end_time -= excess_time / 2
+                        # Quotes spread over a long chunk; keep the clip on the first one
+                        end_time = start_time + max_duration
+                        matching_segments = [seg for seg in matching_segments if seg['start'] < end_time]
                     
                     # Get text for this time range
                     highlight_text = ' '.join([
@@ -291,21 +368,22 @@ Only identify segments with high viral potential. Quality over quantity."""
         if not key_quotes:
             return segments[:3] if len(segments) >= 3 else segments  # Return first few segments as fallback
         
-        matching_segments = []
+        # Matches are indexed by position, which dedupes them and keeps them in time order
+        matches = IntervalIndex()
         
         for quote in key_quotes:
-            quote_lower = quote.lower()
+            quote_lower = quote.lower().strip()
+            if not quote_lower:
+                continue
             
-            for segment in segments:
+            for position, segment in enumerate(segments):
                 segment_text = segment['text'].lower()
                 
-                # Check for quote match
-                if quote_lower in segment_text or any(word in segment_text for word in quote_lower.split()):
-                    if segment not in matching_segments:
-                        matching_segments.append(segment)
+                # Only whole quotes count here; single shared words match most of a packed chunk
+                if quote_lower in segment_text and position not in matches:
+                    matches.add(position, segment['start'], segment['end'])
         
-        # Sort by timestamp
-        matching_segments.sort(key=lambda x: x['start'])
+        matching_segments = [segments[position] for position in matches]
         
         # If no matches found, return segments with highest word overlap
         if not matching_segments:
@@ -450,7 +528,7 @@ Examples of good viral titles:
 Generate 3 title options and pick the best one. Response format:
 TITLE: [your best title here]"""
 
-            response = self.model.generate(prompt, max_tokens=100, temp=0.8)
+            response = await self._generate(prompt, max_tokens=100, temp=0.8)
             
             # Extract title from response
             title_match = re.search(r'TITLE:\s*(.+)', response)
@@ -0,0 +1,101 @@
+"""
+Pool of offline LLM instances for concurrent chunk analysis
+"""
+
+import os
+import queue
+import time
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+
+from ..utils.executors import ExecutorManager
+
+
+def resolve_pool_size(llm_config: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Work out how many model instances to load and how many threads each gets
+
+    "auto" values are derived from the core count so that all workers together
+    use every core without oversubscribing it.
+
+    Returns:
+        (workers, threads_per_worker)
+    """
+    cores = os.cpu_count() or 4
+
+    workers = llm_config.get("workers", "auto")
+    if workers == "auto":
+        # Below ~4 threads per instance llama.cpp throughput drops off sharply
+        workers = max(1, min(4, cores // 4))
+    workers = max(1, int(workers))
+
+    threads = llm_config.get("threads_per_worker", "auto")
+    if threads == "auto":
+        threads = max(1, cores // workers)
+    threads = max(1, int(threads))
+
+    return workers, threads
+
+
+class LLMWorkerPool:
+    """Holds N GPT4All instances and lends one to each concurrent generate call
+
+    GPT4All runs inference in native code with the GIL released, so separate
+    instances driven from separate threads generate in parallel.
+    """
+
+    def __init__(self, model_factory, executors: ExecutorManager,
+                 workers: int = 1, threads_per_worker: int = 4):
+        """
+        Initialize pool
+
+        Args:
+            model_factory: Callable taking n_threads and returning a loaded model
+            executors: Executor manager providing the 'llm' thread pool
+            workers: Number of model instances
+            threads_per_worker: Inference threads per instance
+        """
+        self.model_factory = model_factory
+        self.executors = executors
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker
+
+        self.models: List[Any] = []
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+
+    def load(self) -> bool:
+        """Load every model instance; returns True if at least one loaded"""
+        for i in range(self.workers):
+            try:
+                load_start = time.perf_counter()
+                model = self.model_factory(self.threads_per_worker)
+                self.models.append(model)
+                self._idle.put(model)
+                logger.debug(f"🤖 LLM worker {i + 1}/{self.workers} loaded in {time.perf_counter() - load_start:.1f}s")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to load LLM worker {i + 1}/{self.workers}: {e}")
+                break
+
+        if self.models:
+            # One executor thread per model instance
+            self.executors.thread_pool('llm', max_workers=len(self.models))
+            logger.info(f"🧠 LLM pool ready: {len(self.models)} worker(s) × {self.threads_per_worker} threads")
+
+        return bool(self.models)
+
+    @property
+    def primary(self):
+        """First loaded model, or None"""
+        return self.models[0] if self.models else None
+
+    def _generate_blocking(self, prompt: str, **kwargs) -> str:
+        model = self._idle.get()
+        try:
+            return model.generate(prompt, **kwargs)
+        finally:
+            self._idle.put(model)
+
+    async def generate(self, prompt: str, **kwargs) -> str:
+        """Generate with whichever model instance is free"""
+        return await self.executors.run_in_thread('llm', self._generate_blocking, prompt, **kwargs)
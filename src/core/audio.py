@@ -0,0 +1,97 @@
+"""
+In-memory audio extraction: 16 kHz mono PCM streamed from an ffmpeg pipe into NumPy
+"""
+
+import hashlib
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000
+READ_BYTES = 1 << 20  # ~33 s of 16-bit audio per read
+
+
+def _allocate(samples: int, memmap_dir: Optional[Path]) -> np.ndarray:
+    """Float32 buffer in RAM, or backed by an anonymous temp file when memmap_dir is set"""
+    if memmap_dir is None:
+        return np.empty(samples, dtype=np.float32)
+
+    # The temp file is removed as soon as the mapping is dropped
+    backing = tempfile.TemporaryFile(dir=memmap_dir, prefix="pcm_", suffix=".f32")
+    return np.memmap(backing, dtype=np.float32, mode='w+', shape=(samples,))
+
+
+def extract_pcm(source_path: str, ffmpeg_binary: str = "ffmpeg", duration_hint: float = 0,
+                memmap_dir: Optional[Path] = None, memmap_min_seconds: float = 1800) -> np.ndarray:
+    """
+    Decode the audio of a media file to 16 kHz mono float32 without a temp WAV
+
+    Args:
+        source_path: Audio or video file
+        ffmpeg_binary: ffmpeg executable
+        duration_hint: Expected duration in seconds, used to size the buffer up front
+        memmap_dir: Directory for a memory-mapped buffer on long inputs
+        memmap_min_seconds: Inputs at least this long use the memory-mapped buffer
+
+    Returns:
+        Samples in [-1, 1]
+    """
+    command = [
+        ffmpeg_binary, '-hide_banner', '-loglevel', 'error', '-nostdin',
+        '-i', str(source_path),
+        '-vn', '-ac', '1', '-ar', str(SAMPLE_RATE), '-f', 's16le', '-acodec', 'pcm_s16le', '-'
+    ]
+
+    use_memmap = memmap_dir is not None and duration_hint >= memmap_min_seconds
+    # A little headroom so container durations that round down do not force a regrow
+    capacity = int((duration_hint + 5) * SAMPLE_RATE) if duration_hint else 600 * SAMPLE_RATE
+    buffer = _allocate(capacity, memmap_dir if use_memmap else None)
+    filled = 0
+    leftover = b''
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        while True:
+            data = process.stdout.read(READ_BYTES)
+            if not data:
+                break
+
+            data = leftover + data
+            usable = len(data) - len(data) % 2
+            leftover = data[usable:]
+            chunk = np.frombuffer(data[:usable], dtype=np.int16)
+
+            if filled + len(chunk) > len(buffer):
+                capacity = max(len(buffer) * 2, filled + len(chunk))
+                # Stay on disk once mapped, and move there when the input turns out to be long
+                use_memmap = use_memmap or (memmap_dir is not None and capacity >= memmap_min_seconds * SAMPLE_RATE)
+                grown = _allocate(capacity, memmap_dir if use_memmap else None)
+                grown[:filled] = buffer[:filled]
+                buffer = grown
+
+            np.multiply(chunk, 1 / 32768.0, out=buffer[filled:filled + len(chunk)], casting='unsafe')
+            filled += len(chunk)
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        process.wait()
+
+    if process.returncode != 0:
+        error = stderr.decode(errors='replace').strip().splitlines()
+        raise RuntimeError(f"ffmpeg audio extraction failed: {error[-1] if error else process.returncode}")
+
+    return buffer[:filled]
+
+
+def hash_pcm(audio: np.ndarray) -> str:
+    """SHA-256 of the decoded samples, stable across containers holding the same audio"""
+    digest = hashlib.sha256()
+    step = READ_BYTES
+    for start in range(0, len(audio), step):
+        digest.update(np.ascontiguousarray(audio[start:start + step]).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,108 @@
+"""
+Per-segment audio features (loudness, intonation, energy bursts) from transcription PCM
+"""
+
+from typing import Dict, Any, List
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000
+
+
+def _frame_features(audio: np.ndarray, frame_length: int, chunk_frames: int = 8192):
+    """Frame energy and zero-crossing rate, computed in chunks to bound temporary memory"""
+    n_frames = len(audio) // frame_length
+    energy = np.empty(n_frames, dtype=np.float64)
+    zcr = np.empty(n_frames, dtype=np.float64)
+
+    for first in range(0, n_frames, chunk_frames):
+        last = min(n_frames, first + chunk_frames)
+        frames = np.asarray(audio[first * frame_length:last * frame_length], dtype=np.float32)
+        frames = frames.reshape(last - first, frame_length)
+        energy[first:last] = np.mean(frames * frames, axis=1)
+        zcr[first:last] = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+    return energy, zcr
+
+
+def _normalize(values: np.ndarray, min_spread: float = 1e-9) -> np.ndarray:
+    """Z-score across segments, clipped to [0, 2] and scaled to [0, 1]; only above-average counts"""
+    std = values.std()
+    # Spread this small is measurement noise, not a difference between segments
+    if std <= min_spread + 0.05 * abs(values.mean()):
+        return np.zeros_like(values)
+    return np.clip((values - values.mean()) / std, 0, 2) / 2
+
+
+def segment_audio_features(audio: np.ndarray, segments: List[Dict[str, Any]],
+                           sample_rate: int = SAMPLE_RATE, frame_ms: int = 25,
+                           burst_db: float = 12.0) -> Dict[str, np.ndarray]:
+    """
+    Compute audio features for every transcript segment in one pass
+
+    Frame-level energy and zero-crossing rate are computed once; per-segment
+    means and variances then come from prefix sums, so the cost is one scan
+    of the audio plus O(1) per segment.
+
+    Args:
+        audio: Mono float32 PCM
+        segments: Transcript segments with 'start' and 'end' in seconds
+        sample_rate: Sample rate of the audio
+        frame_ms: Analysis frame length
+        burst_db: Frames this far above the track's median level count as bursts
+
+    Returns:
+        Arrays aligned with segments: 'rms_db', 'loudness' (dB relative to the
+        track median), 'pitch_variance' (variance of zero-crossing rate over
+        voiced frames, an intonation proxy), 'burst_ratio' (share of burst
+        frames, e.g. laughter or applause), and the same three scores
+        normalized to [0, 1] under 'loudness_score', 'pitch_score' and
+        'burst_score'
+    """
+    frame_length = int(sample_rate * frame_ms / 1000)
+    energy, zcr = _frame_features(audio, frame_length)
+    if len(energy) == 0 or not segments:
+        empty = np.zeros(len(segments))
+        return {name: empty for name in ('rms_db', 'loudness', 'pitch_variance', 'burst_ratio',
+                                         'loudness_score', 'pitch_score', 'burst_score')}
+
+    energy_db = 10.0 * np.log10(energy + 1e-10)
+    median_db = np.median(energy_db)
+    bursts = energy_db > median_db + burst_db
+    # Intonation is only measured on frames louder than the median, i.e. mostly voiced speech
+    voiced = energy_db > median_db
+
+    def prefix(values):
+        return np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+
+    energy_sum, burst_sum, voiced_sum = prefix(energy), prefix(bursts), prefix(voiced)
+    zcr_sum, zcr_sq_sum = prefix(zcr * voiced), prefix(zcr * zcr * voiced)
+
+    frame_seconds = frame_length / sample_rate
+    starts = np.array([segment['start'] for segment in segments]) / frame_seconds
+    ends = np.array([segment['end'] for segment in segments]) / frame_seconds
+    starts = np.clip(starts.astype(np.int64), 0, len(energy))
+    ends = np.clip(np.ceil(ends).astype(np.int64), 0, len(energy))
+    ends = np.maximum(ends, np.minimum(starts + 1, len(energy)))
+    counts = np.maximum(ends - starts, 1)
+
+    mean_energy = (energy_sum[ends] - energy_sum[starts]) / counts
+    voiced_counts = np.maximum(voiced_sum[ends] - voiced_sum[starts], 1)
+    mean_zcr = (zcr_sum[ends] - zcr_sum[starts]) / voiced_counts
+    pitch_variance = np.maximum((zcr_sq_sum[ends] - zcr_sq_sum[starts]) / voiced_counts - mean_zcr ** 2, 0)
+    burst_ratio = (burst_sum[ends] - burst_sum[starts]) / counts
+
+    rms_db = 10.0 * np.log10(mean_energy + 1e-10)
+    loudness = rms_db - median_db
+
+    return {
+        'rms_db': rms_db,
+        'loudness': loudness,
+        'pitch_variance': pitch_variance,
+        'burst_ratio': burst_ratio,
+        # Loudness is relative to the median, so its mean is near zero; judge its spread in dB
+        'loudness_score': _normalize(loudness, min_spread=0.1),
+        'pitch_score': _normalize(pitch_variance),
+        'burst_score': _normalize(burst_ratio),
+    }
@@ -0,0 +1,95 @@
+"""
+Staged batch pipeline with per-stage workers and bounded queues between stages
+"""
+
+import asyncio
+from typing import Dict, Any, List, Callable, Awaitable, Tuple
+
+from loguru import logger
+
+
+# A stage receives the job dictionary, updates it in place and returns True
+# when the job should continue to the next stage
+StageHandler = Callable[[Dict[str, Any]], Awaitable[bool]]
+
+
+class BatchPipeline:
+    """Runs jobs through a chain of asynchronous stages
+
+    Every stage has its own worker count and reads from a bounded queue fed by
+    the previous stage, so different jobs occupy different stages at the same
+    time (job N+1 downloads while job N transcribes and job N-1 renders).
+    """
+
+    def __init__(self, stages: List[Tuple[str, StageHandler, int]],
+                 queue_size: int = 2, max_in_flight: int = 3):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Ordered (name, handler, worker_count) tuples
+            queue_size: Capacity of the queue in front of each stage
+            max_in_flight: Maximum number of jobs admitted at once
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.max_in_flight = max(1, max_in_flight)
+
+    async def run(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run all jobs through the pipeline
+
+        Jobs that fail or are finished early by a stage get their 'failed_stage'
+        or 'completed' keys set; the list is returned in input order.
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        def finish(job: Dict[str, Any]):
+            job.setdefault('completed', False)
+            in_flight.release()
+
+        async def worker(stage_index: int):
+            name, handler, _ = self.stages[stage_index]
+            queue = queues[stage_index]
+
+            while True:
+                job = await queue.get()
+                try:
+                    try:
+                        proceed = await handler(job)
+                    except Exception as e:
+                        logger.error(f"❌ Pipeline stage '{name}' failed for {job.get('source')}: {e}")
+                        job['failed_stage'] = name
+                        proceed = False
+
+                    if proceed and stage_index + 1 < len(self.stages):
+                        await queues[stage_index + 1].put(job)
+                    else:
+                        if proceed:
+                            job['completed'] = True
+                        finish(job)
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker(stage_index))
+            for stage_index, (_, _, count) in enumerate(self.stages)
+            for _ in range(max(1, count))
+        ]
+
+        try:
+            for job in jobs:
+                await in_flight.acquire()
+                await queues[0].put(job)
+
+            # Each stage only hands work forward before marking it done, so
+            # draining the queues in order drains the whole pipeline
+            for queue in queues:
+                await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return jobs
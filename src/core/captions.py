@@ -0,0 +1,266 @@
+"""
+Word-timed caption tracks rendered as ASS subtitles and burned in by libass
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+
+NAMED_COLORS = {
+    'white': 'FFFFFF',
+    'black': '000000',
+    'yellow': 'FFFF00',
+    'red': 'FF0000',
+    'green': '00FF00',
+    'blue': '0000FF',
+}
+
+
+def to_ass_color(color: str, default: str = 'FFFFFF') -> str:
+    """Convert '#RRGGBB' or a basic color name to ASS '&H00BBGGRR'"""
+    value = NAMED_COLORS.get(str(color).lower(), str(color).lstrip('#'))
+    if len(value) != 6:
+        value = default
+    rr, gg, bb = value[0:2], value[2:4], value[4:6]
+    return f"&H00{bb}{gg}{rr}".upper()
+
+
+def format_ass_time(seconds: float) -> str:
+    """Format seconds as ASS 'H:MM:SS.cc'"""
+    centiseconds = max(0, int(round(seconds * 100)))
+    hours, remainder = divmod(centiseconds, 360000)
+    minutes, remainder = divmod(remainder, 6000)
+    secs, cs = divmod(remainder, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{cs:02d}"
+
+
+def escape_ass_text(text: str) -> str:
+    """Keep user text from being read as ASS override tags"""
+    return text.replace('\\', '').replace('{', '(').replace('}', ')').replace('\n', ' ')
+
+
+def subtitles_filter(subtitle_file: Path) -> str:
+    """ffmpeg 'subtitles' filter for a track file, escaped for filter graphs"""
+    from .ffmpeg_renderer import FFmpegRenderer  # Imported here: the renderer imports this module
+
+    path = str(subtitle_file).replace('\\', '/')
+    return f"subtitles=filename={FFmpegRenderer._escape_option(path)}"
+
+
+class CaptionTrackBuilder:
+    """Builds an ASS caption track for one clip from Whisper word timestamps"""
+
+    MAX_LINE_CHARS = 40
+    MAX_PAUSE_SECONDS = 1.0  # A longer pause starts a new line
+    HOLD_SECONDS = 1.0       # How long a line stays up after its last word
+
+    def __init__(self, caption_config: Dict[str, Any], resolution: Tuple[int, int]):
+        """
+        Initialize builder
+
+        Args:
+            caption_config: The 'captions' configuration section
+            resolution: Output width and height
+        """
+        self.caption_config = caption_config
+        self.width, self.height = resolution
+
+    def collect_words(self, segments: List[Dict[str, Any]], start_time: float,
+                      end_time: float) -> List[Dict[str, Any]]:
+        """
+        Gather words spoken inside the clip, with times relative to the clip start
+
+        Segments without word timestamps have their words spread evenly across
+        the segment.
+        """
+        words = []
+
+        for segment in segments:
+            if segment['end'] <= start_time or segment['start'] >= end_time:
+                continue
+
+            segment_words = segment.get('words') or []
+            if not segment_words:
+                tokens = segment['text'].split()
+                if not tokens:
+                    continue
+                step = (segment['end'] - segment['start']) / len(tokens)
+                segment_words = [
+                    {'word': token, 'start': segment['start'] + i * step, 'end': segment['start'] + (i + 1) * step}
+                    for i, token in enumerate(tokens)
+                ]
+
+            for word in segment_words:
+                text = str(word.get('word', '')).strip()
+                if not text or word['start'] < start_time or word['start'] >= end_time:
+                    continue
+                words.append({
+                    'word': text,
+                    'start': word['start'] - start_time,
+                    'end': min(word['end'], end_time) - start_time
+                })
+
+        return words
+
+    def _group_lines(self, words: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group words into caption lines of roughly one line each"""
+        lines = []
+        current = []
+        length = 0
+
+        for word in words:
+            added = len(word['word']) + (1 if current else 0)
+            paused = current and word['start'] - current[-1]['end'] > self.MAX_PAUSE_SECONDS
+            if current and (paused or length + added > self.MAX_LINE_CHARS):
+                lines.append(current)
+                current = []
+                added = len(word['word'])
+                length = 0
+            current.append(word)
+            length += added
+
+        if current:
+            lines.append(current)
+
+        return lines
+
+    def _styles(self) -> List[str]:
+        """Caption and title style definitions"""
+        font_family = self.caption_config.get("font_family", "Arial Bold")
+        bold = -1 if 'bold' in font_family.lower() else 0
+        font_name = font_family.replace('Bold', '').replace('-', ' ').strip() or 'Arial'
+
+        position = self.caption_config.get("position", "bottom")
+        alignment = {'top': 8, 'center': 5}.get(position, 2)
+        margin_v = self.caption_config.get("margin_bottom", 100) if alignment == 2 else 50
+        margin_h = int(self.width * (1 - self.caption_config.get("max_width", 0.8)) / 2)
+
+        text_color = to_ass_color(self.caption_config.get("text_color", "#FFFFFF"))
+        stroke_color = to_ass_color(self.caption_config.get("stroke_color", "#000000"), '000000')
+        stroke_width = self.caption_config.get("stroke_width", 3)
+        font_size = self.caption_config.get("font_size", 48)
+
+        fields = "Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, " \
+                 "Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, " \
+                 "Alignment, MarginL, MarginR, MarginV, Encoding"
+
+        return [
+            f"Format: Name, {fields}",
+            f"Style: Caption,{font_name},{font_size},{text_color},{text_color},{stroke_color},&H80000000,"
+            f"{bold},0,0,0,100,100,0,0,1,{stroke_width},0,{alignment},{margin_h},{margin_h},{margin_v},1",
+            f"Style: Title,Arial,36,&H00FFFFFF,&H00FFFFFF,&H00000000,&H80000000,"
+            f"-1,0,0,0,100,100,0,0,1,2,0,8,{margin_h},{margin_h},30,1",
+        ]
+
+    def _highlight_events(self, line: List[Dict[str, Any]], line_start: float,
+                          line_end: float) -> List[Tuple[float, float, str]]:
+        """
+        Split a line's display time into (start, end, text) events where only
+        the word being spoken is recoloured
+
+        Karaoke \\k timing would leave every spoken word in the highlight colour,
+        so each word gets its own event with a colour override instead. Pauses
+        between words show the line uncoloured.
+        """
+        # \1c takes the colour without the alpha byte of a style colour
+        highlight = to_ass_color(self.caption_config.get("highlight_color", "#FFFF00"), 'FFFF00')
+        colour = f"&H{highlight[4:]}&"
+        texts = [escape_ass_text(word['word']) for word in line]
+
+        def text(highlighted: Optional[int] = None) -> str:
+            return ' '.join(
+                f"{{\\1c{colour}}}{word}{{\\r}}" if k == highlighted else word
+                for k, word in enumerate(texts)
+            )
+
+        events = []
+        cursor = line_start
+        for k, word in enumerate(line):
+            next_start = line[k + 1]['start'] if k + 1 < len(line) else line_end
+            word_start = max(word['start'], cursor)
+            word_end = min(max(word['end'], word_start + 0.01), next_start, line_end)
+            if word_start > cursor:
+                events.append((cursor, word_start, text()))
+            if word_end > word_start:
+                events.append((word_start, word_end, text(k)))
+                cursor = word_end
+        if line_end > cursor:
+            events.append((cursor, line_end, text()))
+
+        return events
+
+    def build(self, words: List[Dict[str, Any]], duration: float, title: Optional[str] = None) -> str:
+        """
+        Build the ASS document
+
+        Args:
+            words: Clip-relative words from collect_words
+            duration: Clip duration in seconds
+            title: Optional title shown for the first three seconds
+
+        Returns:
+            ASS subtitle text
+        """
+        highlight_words = self.caption_config.get("keyword_highlighting", True)
+        lines = self._group_lines(words)
+
+        events = ["Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"]
+
+        if title:
+            events.append(
+                f"Dialogue: 1,{format_ass_time(0)},{format_ass_time(min(3.0, duration))},Title,,0,0,0,,"
+                f"{escape_ass_text(title)}"
+            )
+
+        for i, line in enumerate(lines):
+            line_start = line[0]['start']
+            # Hold each line briefly, up to the next one, so captions do not flicker
+            line_end = max(line[-1]['end'] + self.HOLD_SECONDS, line_start + 0.5)
+            if i + 1 < len(lines):
+                line_end = min(line_end, lines[i + 1][0]['start'])
+            line_end = min(line_end, duration)
+            if line_end <= line_start:
+                continue
+
+            if highlight_words:
+                spans = self._highlight_events(line, line_start, line_end)
+            else:
+                spans = [(line_start, line_end, ' '.join(escape_ass_text(word['word']) for word in line))]
+
+            for span_start, span_end, text in spans:
+                events.append(
+                    f"Dialogue: 0,{format_ass_time(span_start)},{format_ass_time(span_end)},Caption,,0,0,0,,{text}"
+                )
+
+        header = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {self.width}",
+            f"PlayResY: {self.height}",
+            "WrapStyle: 0",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            *self._styles(),
+            "",
+            "[Events]",
+        ]
+
+        return '\n'.join(header + events) + '\n'
+
+    def write(self, output_file: Path, segments: List[Dict[str, Any]], start_time: float,
+              end_time: float, title: Optional[str] = None) -> Optional[Path]:
+        """Build and write the caption track for a clip; returns the file or None"""
+        try:
+            words = self.collect_words(segments, start_time, end_time)
+            if not words and not title:
+                return None
+
+            output_file.write_text(self.build(words, end_time - start_time, title), encoding='utf-8')
+            return output_file
+
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to build caption track: {e}")
+            return None
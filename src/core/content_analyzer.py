@@ -2,21 +2,29 @@
 Content analysis module for detecting viral moments and highlights in video transcripts
 """
 
-import re
 import asyncio
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 
+import numpy as np
 from loguru import logger
 
 from ..ai.llm_analyzer import LLMAnalyzer
 from ..utils.config import Config
+from ..utils.intervals import IntervalIndex
+from .audio_features import segment_audio_features
+from .phrase_matcher import PhraseMatcher
+from .highlight_selection import select_highlights
+from .segment_scoring import SegmentColumns, score_columns, candidate_windows
 
 
 class ContentAnalyzer:
     """Analyzes video content to identify viral moments and create highlights"""
     
+    COLUMNS_CACHE_SIZE = 4
+    
     def __init__(self, config: Config):
         """Initialize content analyzer with configuration"""
         self.config = config
@@ -50,7 +58,7 @@ class ContentAnalyzer:
             ]
         }
         
-        # Hook patterns that grab attention
+        # Hook patterns that grab attention (literal phrases, matched on word boundaries)
         self.hook_patterns = [
             r"you won't believe",
             r"secret that",
@@ -66,14 +74,24 @@ class ContentAnalyzer:
         
         # Engagement boost keywords
         self.boost_keywords = self.analysis_config.get("keywords_boost", [])
+        
+        # Every emotion keyword, hook and boost keyword compiled into one matcher
+        self.matcher = PhraseMatcher({
+            **{f"emotion:{emotion}": keywords for emotion, keywords in self.emotion_keywords.items()},
+            'hook': self.hook_patterns,
+            'boost': self.boost_keywords
+        })
+        self._columns_cache: OrderedDict = OrderedDict()
     
-    async def find_highlights(self, transcript: Dict[str, Any], video_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def find_highlights(self, transcript: Dict[str, Any], video_metadata: Dict[str, Any],
+                              audio: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Find viral highlights in video transcript
         
         Args:
             transcript: Video transcript with segments and timestamps
             video_metadata: Video metadata for context
+            audio: 16 kHz mono PCM from transcription, used for audio scoring when available
             
         Returns:
             List of highlight segments with metadata
@@ -87,7 +105,10 @@ class ContentAnalyzer:
                 return []
             
             # Step 1: Score all segments
-            scored_segments = await self._score_segments(segments)
+            audio_features = None
+            if audio is not None and self.analysis_config.get("audio_scoring", False):
+                audio_features = segment_audio_features(audio, segments)
+            scored_segments = await self._score_segments(segments, audio_features)
             
             # Step 2: Use LLM for intelligent analysis
             llm_highlights = await self.llm_analyzer.analyze_content(
@@ -116,55 +137,71 @@ class ContentAnalyzer:
             logger.error(f"❌ Error analyzing content: {e}")
             return []
     
-    async def _score_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _segment_columns(self, segments: List[Dict[str, Any]]) -> SegmentColumns:
+        """Columnar form of segments, built once per transcript and reused for rescoring"""
+        key = id(segments)
+        cached = self._columns_cache.get(key)
+        # The cache holds the list itself, so its id cannot be reused while cached
+        if cached is not None and cached[0] is segments and len(cached[1]) == len(segments):
+            self._columns_cache.move_to_end(key)
+            return cached[1]
+        
+        columns = SegmentColumns.from_segments(segments, self.matcher)
+        self._columns_cache[key] = (segments, columns)
+        while len(self._columns_cache) > self.COLUMNS_CACHE_SIZE:
+            self._columns_cache.popitem(last=False)
+        return columns
+    
+    def segment_scores(self, segments: List[Dict[str, Any]],
+                       audio_features: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """
+        Viral score of every segment as an array
+        
+        Emotion weights are read on every call, so rescoring after the
+        optimization engine updates them skips phrase matching entirely.
+        """
+        columns = self._segment_columns(segments)
+        
+        # Loud, animated or laughter-filled delivery adds to the text score
+        audio_scores = None
+        if audio_features is not None:
+            audio_weights = self.analysis_config.get("audio_weights", {})
+            audio_scores = (
+                audio_weights.get("loudness", 1.0) * audio_features['loudness_score'] +
+                audio_weights.get("pitch_variance", 0.5) * audio_features['pitch_score'] +
+                audio_weights.get("bursts", 1.0) * audio_features['burst_score']
+            )
+        
+        return score_columns(
+            columns,
+            self.analysis_config.get("emotion_weights", {}),
+            hook_weight=2.0,  # Hooks are very important
+            boost_weight=1.5,
+            audio_scores=audio_scores
+        )
+    
+    async def _score_segments(self, segments: List[Dict[str, Any]],
+                              audio_features: Optional[Dict[str, np.ndarray]] = None) -> List[Dict[str, Any]]:
         """Score segments based on viral indicators"""
-        scored_segments = []
+        scores = self.segment_scores(segments, audio_features)
+        columns = self._segment_columns(segments)
         
-        for i, segment in enumerate(segments):
-            text = segment['text'].lower()
-            score = 0.0
-            emotions = []
-            
-            # Emotion detection
-            for emotion, keywords in self.emotion_keywords.items():
-                emotion_score = sum(1 for keyword in keywords if keyword in text)
-                if emotion_score > 0:
-                    emotions.append(emotion)
-                    weight = self.analysis_config.get("emotion_weights", {}).get(emotion, 1.0)
-                    score += emotion_score * weight
-            
-            # Hook pattern detection
-            hook_score = sum(1 for pattern in self.hook_patterns if re.search(pattern, text, re.IGNORECASE))
-            score += hook_score * 2.0  # Hooks are very important
-            
-            # Boost keywords
-            boost_score = sum(1 for keyword in self.boost_keywords if keyword.lower() in text)
-            score += boost_score * 1.5
-            
-            # Length penalty (very short or very long segments are less viral)
-            text_length = len(text.split())
-            if text_length < 5:
-                score *= 0.5
-            elif text_length > 100:
-                score *= 0.7
-            
-            # Position bonus (beginning and end segments often contain hooks)
-            if i < len(segments) * 0.1:  # First 10%
-                score *= 1.2
-            elif i > len(segments) * 0.9:  # Last 10%
-                score *= 1.1
-            
-            scored_segments.append({
+        emotion_hits = {
+            emotion: columns.column(f"emotion:{emotion}") > 0 for emotion in self.emotion_keywords
+        }
+        
+        return [
+            {
                 'segment_index': i,
                 'start_time': segment['start'],
                 'end_time': segment['end'],
                 'text': segment['text'],
-                'score': score,
-                'emotions': emotions,
+                'score': float(scores[i]),
+                'emotions': [emotion for emotion, hit in emotion_hits.items() if hit[i]],
                 'duration': segment['end'] - segment['start']
-            })
-        
-        return scored_segments
+            }
+            for i, segment in enumerate(segments)
+        ]
     
     async def _combine_analyses(self, scored_segments: List[Dict[str, Any]], 
                                llm_highlights: List[Dict[str, Any]], 
@@ -176,100 +213,65 @@ class ContentAnalyzer:
         min_score = self.analysis_config.get("min_engagement_score", 0.6)
         clip_min_duration = self.config.get("video.clip_duration_min", 25)
         clip_max_duration = self.config.get("video.clip_duration_max", 65)
+        # Several targets give short and long variants around the same moment in one pass
+        target_durations = self.config.get("video.clip_target_durations") or [clip_min_duration]
+        
+        scores = np.array([segment['score'] for segment in scored_segments], dtype=np.float64)
+        windows = candidate_windows(
+            self._segment_columns(original_segments),
+            scores,
+            min_score,
+            clip_min_duration,
+            clip_max_duration,
+            target_durations
+        )
+        
+        # Every window is a candidate, ranked by the total score of the segments it holds
+        for window in windows:
+            peak = scored_segments[window['peak']]
+            combined.append({
+                'start_time': window['start_time'],
+                'end_time': window['end_time'],
+                'text': ' '.join(
+                    original_segments[i]['text'] for i in range(window['first'], window['last'] + 1)
+                ),
+                'score': window['total_score'],
+                'mean_score': window['mean_score'],
+                'emotions': peak['emotions'],
+                'source': 'rule_based',
+                'confidence': min(window['total_score'] / 3.0, 1.0)  # Normalize confidence
+            })
         
-        for segment in scored_segments:
-            if segment['score'] >= min_score:
-                # Extend segment to meet minimum duration
-                start_idx = segment['segment_index']
-                end_idx = start_idx
-                total_duration = segment['duration']
-                
-                # Extend forward if needed
-                while (end_idx < len(original_segments) - 1 and 
-                       total_duration < clip_min_duration):
-                    end_idx += 1
-                    total_duration = original_segments[end_idx]['end'] - original_segments[start_idx]['start']
-                
-                # Extend backward if still too short
-                while (start_idx > 0 and 
-                       total_duration < clip_min_duration):
-                    start_idx -= 1
-                    total_duration = original_segments[end_idx]['end'] - original_segments[start_idx]['start']
-                
-                # Trim if too long
-                while total_duration > clip_max_duration and end_idx > start_idx:
-                    end_idx -= 1
-                    total_duration = original_segments[end_idx]['end'] - original_segments[start_idx]['start']
-                
-                # Combine text from all segments in range
-                combined_text = ' '.join([
-                    original_segments[i]['text'] 
-                    for i in range(start_idx, end_idx + 1)
-                ])
-                
-                combined.append({
-                    'start_time': original_segments[start_idx]['start'],
-                    'end_time': original_segments[end_idx]['end'],
-                    'text': combined_text,
-                    'score': segment['score'],
-                    'emotions': segment['emotions'],
-                    'source': 'rule_based',
-                    'confidence': min(segment['score'] / 3.0, 1.0)  # Normalize confidence
-                })
-        
-        # Add LLM highlights
+        # Add LLM highlights, merging those that start or end within 10s of an existing one
+        index = IntervalIndex.from_spans(
+            (i, highlight['start_time'], highlight['end_time']) for i, highlight in enumerate(combined)
+        )
         for llm_highlight in llm_highlights:
-            # Check for overlap with existing highlights
-            overlap_found = False
-            for existing in combined:
-                if (abs(llm_highlight['start_time'] - existing['start_time']) < 10 or
-                    abs(llm_highlight['end_time'] - existing['end_time']) < 10):
-                    # Merge with existing highlight (take higher confidence)
-                    if llm_highlight.get('confidence', 0) > existing.get('confidence', 0):
-                        existing.update(llm_highlight)
-                        existing['source'] = 'combined'
-                    overlap_found = True
-                    break
-            
-            if not overlap_found:
+            matches = index.near(llm_highlight['start_time'], llm_highlight['end_time'], 10)
+            if matches:
+                # Merge with the earliest-added match (take higher confidence)
+                position = min(matches)
+                existing = combined[position]
+                if llm_highlight.get('confidence', 0) > existing.get('confidence', 0):
+                    existing.update(llm_highlight)
+                    existing['source'] = 'combined'
+                    index.add(position, existing['start_time'], existing['end_time'])
+            else:
                 llm_highlight['source'] = 'llm'
+                index.add(len(combined), llm_highlight['start_time'], llm_highlight['end_time'])
                 combined.append(llm_highlight)
         
         return combined
     
     async def _filter_highlights(self, highlights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter and rank highlights by quality"""
-        # Remove duplicates and overlaps
-        filtered = []
-        highlights.sort(key=lambda x: x.get('confidence', 0), reverse=True)
-        
-        for highlight in highlights:
-            # Check for significant overlap with existing highlights
-            overlap_found = False
-            for existing in filtered:
-                overlap_start = max(highlight['start_time'], existing['start_time'])
-                overlap_end = min(highlight['end_time'], existing['end_time'])
-                overlap_duration = max(0, overlap_end - overlap_start)
-                
-                highlight_duration = highlight['end_time'] - highlight['start_time']
-                overlap_ratio = overlap_duration / highlight_duration
-                
-                if overlap_ratio > 0.5:  # More than 50% overlap
-                    overlap_found = True
-                    break
-            
-            if not overlap_found:
-                filtered.append(highlight)
-        
-        # Limit to top highlights (configurable via video.max_highlights)
-        max_highlights = self.config.get("video.max_highlights", 5)
-        filtered = filtered[:max_highlights]
-        
-        # Ensure minimum quality threshold
-        min_confidence = 0.3
-        filtered = [h for h in filtered if h.get('confidence', 0) >= min_confidence]
-        
-        return filtered
+        # Best non-overlapping set, limited to video.max_highlights and a minimum quality
+        return select_highlights(
+            highlights,
+            self.config.get("video.max_highlights", 5),
+            max_overlap=0.5,  # At most 50% overlap
+            min_confidence=0.3
+        )
     
     async def _enrich_highlights(self, highlights: List[Dict[str, Any]], 
                                 video_metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
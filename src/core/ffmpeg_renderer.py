@@ -0,0 +1,336 @@
+"""
+FFmpeg filter-graph renderer for producing vertical clips without decoding frames in Python
+"""
+
+import asyncio
+import re
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+from ..utils.config import Config
+from .captions import subtitles_filter
+
+
+class FFmpegRenderer:
+    """Renders highlight clips as a single ffmpeg filter graph run in a subprocess"""
+
+    def __init__(self, config: Config):
+        """Initialize renderer with configuration"""
+        self.config = config
+        self.video_config = config.get_video_config()
+        self.caption_config = config.get_caption_config()
+
+        self.ffmpeg_binary = self.video_config.get("ffmpeg_binary", "ffmpeg")
+        self.preset = self.video_config.get("ffmpeg_preset", "medium")
+        # Decoding across a longer gap between clips costs more than reopening the source
+        self.max_decode_gap = self.video_config.get("ffmpeg_max_decode_gap", 30)
+
+    @staticmethod
+    def _escape_option(value: str) -> str:
+        """
+        Escape a filter option value for use inside -filter_complex
+
+        Two levels apply: the filter's own option parser treats backslash,
+        quote and ':' as special, and the filter graph parser (which runs
+        first and strips quoting) treats backslash, quote, ',', ';', '[' and
+        ']' as special.
+        """
+        value = re.sub(r"([\\':])", r"\\\1", value)
+        return re.sub(r"([\\',;\[\]])", r"\\\1", value)
+
+    @classmethod
+    def _escape_text(cls, text: str) -> str:
+        """Escape text for drawtext's text option, keeping '%' and backslashes literal"""
+        return cls._escape_option(re.sub(r"([\\%])", r"\\\1", text))
+
+    def _caption_y(self) -> str:
+        """Vertical caption position expression matching the MoviePy layout"""
+        position = self.caption_config.get("position", "bottom")
+        if position == "bottom":
+            return "h-150"
+        elif position == "top":
+            return "50"
+        return "(h-text_h)/2"
+
+    def _crop_filter(self, source_size: Tuple[int, int], target_size: Tuple[int, int],
+                     crop_x: Optional[str] = None) -> str:
+        """Build a crop to the target aspect ratio, centered unless a crop_x expression is given"""
+        original_width, original_height = source_size
+        width, height = target_size
+        target_aspect = width / height
+        original_aspect = original_width / original_height
+
+        if original_aspect > target_aspect:
+            # Video is wider than target - crop sides
+            new_width = int(original_height * target_aspect)
+            if crop_x:
+                # x is re-evaluated every frame, so the window follows the crop path
+                return f"crop={new_width}:{original_height}:'{crop_x}':0"
+            x1 = original_width // 2 - new_width // 2
+            return f"crop={new_width}:{original_height}:{x1}:0"
+
+        # Video is taller than target - crop top/bottom
+        new_height = int(original_width / target_aspect)
+        y1 = original_height // 2 - new_height // 2
+        return f"crop={original_width}:{new_height}:0:{y1}"
+
+    def _clip_filters(self, source_size: Tuple[int, int], duration: float,
+                      captions: Optional[List[str]] = None, title: Optional[str] = None,
+                      subtitle_file: Optional[Path] = None, crop_x: Optional[str] = None) -> List[str]:
+        """Filter chain turning clip-relative source frames into a finished vertical clip"""
+        target_resolution = self.video_config.get("resolution", "1080x1920")
+        width, height = map(int, target_resolution.split('x'))
+
+        filters = [
+            self._crop_filter(source_size, (width, height), crop_x),
+            f"scale={width}:{height}",
+            "setsar=1"
+        ]
+
+        if subtitle_file:
+            filters.append(subtitles_filter(subtitle_file))
+
+        if captions:
+            chunk_duration = duration / len(captions)
+            font = self._escape_option(self.caption_config.get("font_family", "Arial-Bold"))
+
+            for i, chunk in enumerate(captions):
+                start = i * chunk_duration
+                end = start + chunk_duration
+                filters.append(
+                    "drawtext="
+                    f"text={self._escape_text(chunk)}:font={font}"
+                    f":fontsize={self.caption_config.get('font_size', 48)}"
+                    f":fontcolor={self.caption_config.get('text_color', 'white')}"
+                    f":borderw={self.caption_config.get('stroke_width', 3)}"
+                    f":bordercolor={self.caption_config.get('stroke_color', 'black')}"
+                    f":x=(w-text_w)/2:y={self._caption_y()}"
+                    f":enable='between(t,{start:.3f},{end:.3f})'"
+                )
+
+        if title:
+            filters.append(
+                "drawtext="
+                f"text={self._escape_text(title)}:font=Arial-Bold"
+                ":fontsize=36:fontcolor=white:borderw=2:bordercolor=black"
+                ":x=(w-text_w)/2:y=30:enable='lt(t,3)'"
+            )
+
+        return filters
+
+    def build_filter_graph(self, source_size: Tuple[int, int], duration: float,
+                           captions: Optional[List[str]] = None, title: Optional[str] = None,
+                           subtitle_file: Optional[Path] = None, crop_x: Optional[str] = None) -> str:
+        """
+        Build the video filter graph for one clip
+
+        Args:
+            source_size: Source width and height
+            duration: Clip duration in seconds
+            captions: Caption chunks shown one after another for equal durations
+            title: Title shown for the first three seconds
+            subtitle_file: ASS track burned in with libass instead of drawtext
+            crop_x: ffmpeg expression in t for the crop's left edge (smart crop)
+
+        Returns:
+            Filter graph string reading [0:v] and producing [vout]
+        """
+        filters = self._clip_filters(source_size, duration, captions, title, subtitle_file, crop_x)
+        return "[0:v]" + ",".join(filters) + "[vout]"
+
+    def build_batch_filter_graph(self, source_size: Tuple[int, int], window_start: float,
+                                 clips: List[Dict[str, Any]], has_audio: bool = True) -> str:
+        """
+        Build one filter graph producing every clip of a source
+
+        The decoded source is split once per clip and each copy is trimmed to
+        its clip, so every frame is decoded a single time however many clips
+        share it.
+
+        Args:
+            source_size: Source width and height
+            window_start: Source time the input was seeked to
+            clips: Clip dicts as taken by build_batch_command
+            has_audio: Whether the source has an audio stream to trim alongside
+
+        Returns:
+            Filter graph producing [vout0], [vout1], ... (and [aout0], ... with audio)
+        """
+        count = len(clips)
+        graph = ["[0:v]split=" + str(count) + "".join(f"[v{i}]" for i in range(count))]
+        if has_audio:
+            graph.append("[0:a]asplit=" + str(count) + "".join(f"[a{i}]" for i in range(count)))
+
+        for i, clip in enumerate(clips):
+            start = clip['start_time'] - window_start
+            end = clip['end_time'] - window_start
+            filters = [f"trim=start={start:.3f}:end={end:.3f}", "setpts=PTS-STARTPTS"]
+            filters += self._clip_filters(
+                source_size, end - start, clip.get('captions'), clip.get('title'),
+                clip.get('subtitle_file'), clip.get('crop_x')
+            )
+            graph.append(f"[v{i}]" + ",".join(filters) + f"[vout{i}]")
+            if has_audio:
+                graph.append(f"[a{i}]atrim=start={start:.3f}:end={end:.3f},asetpts=PTS-STARTPTS[aout{i}]")
+
+        return ";".join(graph)
+
+    def _encode_options(self) -> List[str]:
+        """Encoder and muxer options for one output"""
+        return [
+            '-r', str(self.video_config.get("fps", 30)),
+            '-c:v', 'libx264',
+            '-preset', self.preset,
+            '-b:v', str(self.video_config.get("bitrate", "2M")),
+            '-pix_fmt', 'yuv420p',
+            '-c:a', 'aac',
+            '-b:a', str(self.video_config.get("audio_bitrate", "128k")),
+            '-movflags', '+faststart',
+        ]
+
+    def build_command(self, source_path: str, output_file: Path, start_time: float, end_time: float,
+                      source_size: Tuple[int, int], captions: Optional[List[str]] = None,
+                      title: Optional[str] = None, subtitle_file: Optional[Path] = None,
+                      crop_x: Optional[str] = None) -> List[str]:
+        """Build the complete ffmpeg command line for one clip"""
+        duration = end_time - start_time
+        filter_graph = self.build_filter_graph(source_size, duration, captions, title, subtitle_file, crop_x)
+
+        return [
+            self.ffmpeg_binary,
+            '-hide_banner', '-loglevel', 'error', '-y',
+            # Input seeking jumps straight to the nearest keyframe
+            '-ss', f"{start_time:.3f}",
+            '-t', f"{duration:.3f}",
+            '-i', str(source_path),
+            '-filter_complex', filter_graph,
+            '-map', '[vout]',
+            '-map', '0:a?',
+            *self._encode_options(),
+            str(output_file)
+        ]
+
+    def build_batch_command(self, source_path: str, clips: List[Dict[str, Any]],
+                            source_size: Tuple[int, int], has_audio: bool = True) -> List[str]:
+        """
+        Build one ffmpeg command line writing several clips of a source
+
+        The input is read once, from the earliest clip start to the latest clip
+        end, and each clip is encoded to its own output.
+
+        Args:
+            source_path: Path to the source video
+            clips: Dicts with 'output_file', 'start_time' and 'end_time' in source
+                seconds, plus optional 'captions', 'title', 'subtitle_file' and 'crop_x'
+            source_size: Source width and height
+            has_audio: Whether the source has an audio stream
+
+        Returns:
+            ffmpeg argument list
+        """
+        window_start = min(clip['start_time'] for clip in clips)
+        window_end = max(clip['end_time'] for clip in clips)
+        filter_graph = self.build_batch_filter_graph(source_size, window_start, clips, has_audio)
+
+        command = [
+            self.ffmpeg_binary,
+            '-hide_banner', '-loglevel', 'error', '-y',
+            '-ss', f"{window_start:.3f}",
+            '-to', f"{window_end:.3f}",
+            '-i', str(source_path),
+            '-filter_complex', filter_graph,
+        ]
+        for i, clip in enumerate(clips):
+            command += ['-map', f"[vout{i}]"]
+            if has_audio:
+                command += ['-map', f"[aout{i}]"]
+            command += [*self._encode_options(), str(clip['output_file'])]
+
+        return command
+
+    async def render(self, source_path: str, output_file: Path, start_time: float, end_time: float,
+                     source_size: Tuple[int, int], captions: Optional[List[str]] = None,
+                     title: Optional[str] = None, subtitle_file: Optional[Path] = None,
+                     crop_x: Optional[str] = None) -> bool:
+        """
+        Render a clip with ffmpeg
+
+        Args:
+            source_path: Path to the source video
+            output_file: Destination file
+            start_time: Clip start in source seconds
+            end_time: Clip end in source seconds
+            source_size: Source width and height
+            captions: Optional caption chunks
+            title: Optional title overlay
+            subtitle_file: Optional ASS caption track
+            crop_x: Optional crop position expression
+
+        Returns:
+            True if ffmpeg produced the output file
+        """
+        command = self.build_command(source_path, output_file, start_time, end_time,
+                                     source_size, captions, title, subtitle_file, crop_x)
+
+        return await self._run(command) and output_file.exists()
+
+    async def render_many(self, source_path: str, clips: List[Dict[str, Any]],
+                          source_size: Tuple[int, int], has_audio: bool = True) -> List[bool]:
+        """
+        Render several clips of one source, decoding each stretch of it once
+
+        Clips are rendered in as few ffmpeg passes as possible: one per run of
+        clips separated by no more than max_decode_gap seconds.
+
+        Args:
+            source_path: Path to the source video
+            clips: Clip dicts as taken by build_batch_command
+            source_size: Source width and height
+            has_audio: Whether the source has an audio stream
+
+        Returns:
+            Per clip, True if its output file was produced
+        """
+        rendered = [False] * len(clips)
+
+        for indices in self.plan_passes(clips):
+            batch = [clips[i] for i in indices]
+            command = self.build_batch_command(source_path, batch, source_size, has_audio)
+            if await self._run(command):
+                for i in indices:
+                    rendered[i] = Path(clips[i]['output_file']).exists()
+
+        return rendered
+
+    def plan_passes(self, clips: List[Dict[str, Any]]) -> List[List[int]]:
+        """Group clip indices into passes over runs of nearby clips, in start order"""
+        passes: List[List[int]] = []
+        window_end = None
+
+        for i in sorted(range(len(clips)), key=lambda i: clips[i]['start_time']):
+            if passes and clips[i]['start_time'] - window_end <= self.max_decode_gap:
+                passes[-1].append(i)
+                window_end = max(window_end, clips[i]['end_time'])
+            else:
+                passes.append([i])
+                window_end = clips[i]['end_time']
+
+        return passes
+
+    async def _run(self, command: List[str]) -> bool:
+        """Run ffmpeg, logging its last error line on failure"""
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            error = stderr.decode(errors='replace').strip().splitlines()
+            logger.warning(f"⚠️ FFmpeg render failed: {error[-1] if error else process.returncode}")
+            return False
+
+        return True
@@ -0,0 +1,117 @@
+"""
+Highlight selection as weighted interval scheduling
+"""
+
+from typing import Dict, Any, List, Tuple
+
+from ..utils.intervals import IntervalIndex
+
+
+class _PrefixMax:
+    """Fenwick tree over positions answering max (value, position) of a prefix"""
+
+    def __init__(self, size: int):
+        self.tree: List[Tuple[float, int]] = [(float('-inf'), -1)] * (size + 1)
+
+    def update(self, position: int, value: Tuple[float, int]):
+        position += 1
+        while position < len(self.tree):
+            if value > self.tree[position]:
+                self.tree[position] = value
+            position += position & -position
+
+    def query(self, count: int) -> Tuple[float, int]:
+        """Best entry among positions [0, count)"""
+        best = (float('-inf'), -1)
+        while count > 0:
+            if self.tree[count] > best:
+                best = self.tree[count]
+            count -= count & -count
+        return best
+
+
+def select_highlights(highlights: List[Dict[str, Any]], max_count: int,
+                      max_overlap: float = 0.5, min_confidence: float = 0.3) -> List[Dict[str, Any]]:
+    """
+    Pick the set of at most max_count highlights with the highest total confidence
+
+    Two selected clips may overlap by at most max_overlap of either clip's
+    duration, so a clip is never selected alongside one nested inside it.
+
+    Candidates are sorted by end time. A clip i can precede a later-ending
+    clip j when it ends no later than j's start plus max_overlap of j's
+    duration (a prefix of the sorted candidates, found by binary search) and
+    when j starts no earlier than i's end minus max_overlap of i's duration
+    (which also puts i's start first). Starts and ends then both increase
+    along a chain, so checking neighbours covers every pair. Each round of
+    the dynamic programme adds one clip to the best chains, answering the
+    two-sided condition with a sweep over a prefix-max Fenwick tree, for
+    O(max_count * n log n) overall.
+
+    Args:
+        highlights: Candidates with 'start_time', 'end_time' and 'confidence'
+        max_count: Maximum clips to select
+        max_overlap: Allowed overlap as a fraction of each clip's duration
+        min_confidence: Candidates below this are never selected
+
+    Returns:
+        Selected highlights, highest confidence first (earlier first on ties)
+    """
+    candidates = sorted(
+        (h for h in highlights
+         if h.get('confidence', 0) >= min_confidence and h['end_time'] > h['start_time']),
+        key=lambda h: h['end_time']
+    )
+    if not candidates or max_count <= 0:
+        return []
+
+    n = len(candidates)
+    starts = [h['start_time'] for h in candidates]
+    ends = [h['end_time'] for h in candidates]
+    weights = [h.get('confidence', 0) for h in candidates]
+
+    index = IntervalIndex.from_spans((j, starts[j], ends[j]) for j in range(n))
+    # previous[j]: how many earlier-ending candidates end early enough for candidate j;
+    # capped at j since with max_overlap >= 1 the count can include j and later ties
+    previous = [
+        min(index.count_ending_by(starts[j] + max_overlap * (ends[j] - starts[j])), j)
+        for j in range(n)
+    ]
+    # earliest_follow[i]: earliest start a clip following candidate i may have
+    earliest_follow = [
+        max(starts[i], ends[i] - max_overlap * (ends[i] - starts[i]))
+        for i in range(n)
+    ]
+    by_follow = sorted(range(n), key=lambda i: earliest_follow[i])
+    by_start = sorted(range(n), key=lambda j: starts[j])
+
+    # chain[j]: best total of a chain of at most k clips ending with candidate j
+    chain = list(weights)
+    parents = []
+    for _ in range(1, min(max_count, n)):
+        tree = _PrefixMax(n)
+        extended = list(chain)
+        parent = [-1] * n
+        added = 0
+        for j in by_start:
+            while added < n and earliest_follow[by_follow[added]] <= starts[j]:
+                i = by_follow[added]
+                tree.update(i, (chain[i], i))
+                added += 1
+            value, i = tree.query(previous[j])
+            if i >= 0 and value + weights[j] > extended[j]:
+                extended[j] = value + weights[j]
+                parent[j] = i
+        chain = extended
+        parents.append(parent)
+
+    # A round that did not extend j kept the previous round's chain for it
+    j = max(range(n), key=lambda j: chain[j])
+    selected = [candidates[j]]
+    for parent in reversed(parents):
+        if parent[j] >= 0:
+            j = parent[j]
+            selected.append(candidates[j])
+
+    selected.sort(key=lambda h: (-h.get('confidence', 0), h['start_time']))
+    return selected
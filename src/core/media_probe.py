@@ -0,0 +1,189 @@
+"""
+Lightweight media facts from ffprobe JSON, cached by file identity
+"""
+
+import json
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+
+def _parse_rate(rate: Optional[str]) -> float:
+    """Parse an ffprobe rational such as '30000/1001'"""
+    try:
+        numerator, _, denominator = str(rate).partition('/')
+        return float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _rotation(stream: Dict[str, Any]) -> int:
+    """Clockwise display rotation in degrees (0, 90, 180 or 270) from side data or tags"""
+    for side_data in stream.get('side_data_list', []):
+        if 'rotation' in side_data:
+            # Display matrix rotation is counter-clockwise
+            return int(round(-float(side_data['rotation']))) % 360
+    try:
+        return int(stream.get('tags', {}).get('rotate', 0)) % 360
+    except ValueError:
+        return 0
+
+
+class MediaProbe:
+    """Reads stream layout, duration, fps, resolution, codecs and keyframe spacing
+
+    Nothing is decoded: stream facts come from container headers, and the
+    keyframe interval from packet flags over the first minute.
+    """
+
+    # Packets scanned when estimating keyframe spacing
+    KEYFRAME_SCAN_SECONDS = 60
+
+    def __init__(self, ffprobe_binary: str = "ffprobe", max_entries: int = 256):
+        """
+        Initialize probe
+
+        Args:
+            ffprobe_binary: ffprobe executable
+            max_entries: Probe results kept in memory
+        """
+        self.ffprobe_binary = ffprobe_binary
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _run(self, *args: str) -> Dict[str, Any]:
+        result = subprocess.run(
+            [self.ffprobe_binary, '-v', 'error', '-print_format', 'json', *args],
+            capture_output=True, check=True
+        )
+        return json.loads(result.stdout or b'{}')
+
+    def _keyframe_interval(self, path: str) -> Optional[float]:
+        """Median spacing of video keyframes in seconds"""
+        data = self._run(
+            '-select_streams', 'v:0',
+            '-read_intervals', f"%+{self.KEYFRAME_SCAN_SECONDS}",
+            '-show_entries', 'packet=pts_time,flags',
+            path
+        )
+        times = sorted(
+            float(packet['pts_time']) for packet in data.get('packets', [])
+            if 'K' in packet.get('flags', '') and packet.get('pts_time') not in (None, 'N/A')
+        )
+        if len(times) < 2:
+            return None
+
+        gaps = sorted(b - a for a, b in zip(times, times[1:]))
+        return round(gaps[len(gaps) // 2], 3)
+
+    def _describe(self, path: str) -> Dict[str, Any]:
+        data = self._run('-show_format', '-show_streams', path)
+        streams: List[Dict[str, Any]] = data.get('streams', [])
+        container = data.get('format', {})
+
+        video_stream = next((s for s in streams if s.get('codec_type') == 'video'
+                             and not s.get('disposition', {}).get('attached_pic')), None)
+        audio_stream = next((s for s in streams if s.get('codec_type') == 'audio'), None)
+
+        info: Dict[str, Any] = {
+            'path': path,
+            'format': container.get('format_name', ''),
+            'duration': float(container.get('duration') or 0),
+            'size': int(container.get('size') or 0),
+            'bit_rate': int(container.get('bit_rate') or 0),
+            'streams': streams,
+            'video': None,
+            'audio': None,
+        }
+
+        if video_stream:
+            info['video'] = {
+                'codec': video_stream.get('codec_name'),
+                'width': int(video_stream.get('width') or 0),
+                'height': int(video_stream.get('height') or 0),
+                'fps': _parse_rate(video_stream.get('avg_frame_rate')) or _parse_rate(video_stream.get('r_frame_rate')),
+                'pix_fmt': video_stream.get('pix_fmt'),
+                'rotation': _rotation(video_stream),
+                'keyframe_interval': self._keyframe_interval(path),
+            }
+            if not info['duration']:
+                info['duration'] = float(video_stream.get('duration') or 0)
+
+        if audio_stream:
+            info['audio'] = {
+                'codec': audio_stream.get('codec_name'),
+                'sample_rate': int(audio_stream.get('sample_rate') or 0),
+                'channels': int(audio_stream.get('channels') or 0),
+                'channel_layout': audio_stream.get('channel_layout'),
+            }
+
+        return info
+
+    def probe(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a media file
+
+        Args:
+            path: Media file path
+
+        Returns:
+            Dictionary with 'duration', 'format', 'size', 'bit_rate', 'streams',
+            'video' (codec, width, height, fps, rotation, keyframe_interval) and 'audio'
+            (codec, sample_rate, channels, channel_layout), or None on failure
+        """
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.warning(f"⚠️ Cannot probe {path}: {e}")
+            return None
+
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        try:
+            info = self._describe(str(path))
+        except Exception as e:
+            logger.warning(f"⚠️ ffprobe failed for {path}: {e}")
+            return None
+
+        with self._lock:
+            self._cache[key] = info
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return info
+
+    @staticmethod
+    def resolution(info: Optional[Dict[str, Any]]) -> Optional[Tuple[int, int]]:
+        """Displayed (width, height) of the video stream, if any
+
+        ffmpeg applies rotation metadata when decoding, so a portrait phone
+        recording stored as landscape frames is reported portrait here.
+        """
+        if info and info.get('video') and info['video']['width'] and info['video']['height']:
+            width, height = info['video']['width'], info['video']['height']
+            if info['video'].get('rotation', 0) % 180 == 90:
+                return height, width
+            return width, height
+        return None
+
+
+_media_probe: Optional[MediaProbe] = None
+_probe_lock = threading.Lock()
+
+
+def get_media_probe(ffprobe_binary: str = "ffprobe") -> MediaProbe:
+    """Get the process-wide probe so every component shares one cache"""
+    global _media_probe
+    with _probe_lock:
+        if _media_probe is None:
+            _media_probe = MediaProbe(ffprobe_binary)
+        return _media_probe
@@ -0,0 +1,213 @@
+"""
+Parallel Whisper transcription over overlapping audio windows
+"""
+
+import os
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..utils.executors import ExecutorManager
+from ..utils.model_registry import ModelRegistry
+from .vad import frame_energy_db
+from .transcription import create_engine, engine_key
+
+
+SAMPLE_RATE = 16000
+
+# Set in each worker process by _init_worker
+_worker_engine = None
+
+
+def _init_worker(whisper_config: Dict[str, Any], threads: int):
+    """Load a private transcription engine in a pool process"""
+    global _worker_engine
+    # Keep workers from oversubscribing the cores between them
+    _worker_engine = create_engine({**whisper_config, 'threads': threads})
+
+
+def _transcribe_window(audio: np.ndarray, offset: float, language: Optional[str]) -> Dict[str, Any]:
+    """Transcribe one window in a worker and shift its timestamps to source time"""
+    result = _worker_engine.transcribe(audio, language)
+
+    segments = []
+    for segment in result['segments']:
+        words = [
+            {**word, 'start': word['start'] + offset, 'end': word['end'] + offset}
+            for word in segment['words']
+        ]
+        segments.append({
+            'start': segment['start'] + offset,
+            'end': segment['end'] + offset,
+            'text': segment['text'],
+            'words': words
+        })
+
+    return {'language': result['language'], 'segments': segments}
+
+
+def plan_windows(audio: np.ndarray, window_seconds: float = 300.0, overlap_seconds: float = 5.0,
+                 search_seconds: float = 15.0) -> List[Tuple[float, float, float, float]]:
+    """
+    Split audio into overlapping windows with cuts at the quietest nearby point
+
+    Args:
+        audio: Mono samples at 16 kHz
+        window_seconds: Target window length
+        overlap_seconds: Audio shared with each neighbouring window
+        search_seconds: How far around each target cut to look for silence; must be
+            shorter than window_seconds
+
+    Returns:
+        (window_start, window_end, keep_start, keep_end) tuples in seconds; segments
+        whose midpoint lies inside [keep_start, keep_end) belong to that window
+    """
+    if window_seconds <= search_seconds:
+        raise ValueError(f"window_seconds ({window_seconds}) must exceed search_seconds ({search_seconds})")
+
+    total = len(audio) / SAMPLE_RATE
+    if total <= window_seconds:
+        return [(0.0, total, 0.0, total)]
+
+    frame_seconds = 0.1
+    energy = frame_energy_db(audio, int(SAMPLE_RATE * frame_seconds))
+
+    cuts = [0.0]
+    while total - cuts[-1] > window_seconds:
+        target = cuts[-1] + window_seconds
+        # Every cut must move past the previous one or the loop never ends
+        low = max(int((target - search_seconds) / frame_seconds), int(round(cuts[-1] / frame_seconds)) + 1)
+        high = min(len(energy), int((target + search_seconds) / frame_seconds))
+        quietest = low + int(np.argmin(energy[low:high])) if high > low else int(target / frame_seconds)
+        cuts.append(quietest * frame_seconds)
+    cuts.append(total)
+
+    return [
+        (max(0.0, cuts[i] - overlap_seconds), min(total, cuts[i + 1] + overlap_seconds), cuts[i], cuts[i + 1])
+        for i in range(len(cuts) - 1)
+    ]
+
+
+def stitch_windows(results: List[Dict[str, Any]],
+                   windows: List[Tuple[float, float, float, float]]) -> List[Dict[str, Any]]:
+    """Join window results, keeping each overlapping segment from one window only"""
+    segments = []
+    for i, (result, (_, _, keep_start, keep_end)) in enumerate(zip(results, windows)):
+        if i == len(windows) - 1:
+            keep_end = float('inf')
+        for segment in result['segments']:
+            midpoint = (segment['start'] + segment['end']) / 2
+            if keep_start <= midpoint < keep_end:
+                segments.append(segment)
+
+    segments.sort(key=lambda s: s['start'])
+    return segments
+
+
+def resolve_workers(parallel_config: Dict[str, Any]) -> Tuple[int, int]:
+    """(worker processes, torch threads per worker) from the parallel config"""
+    cores = os.cpu_count() or 2
+
+    workers = parallel_config.get("workers", "auto")
+    if workers == "auto":
+        workers = max(1, min(4, cores // 2))
+    workers = max(1, int(workers))
+
+    return workers, max(1, cores // workers)
+
+
+class ParallelTranscriber:
+    """Transcribes long audio as overlapping windows in a process pool
+
+    Each worker process holds its own engine from the configured backend. The
+    pool is leased from the model registry like any other model, so idle
+    unloading shuts the workers down and frees their engines. The output has
+    the same shape as a single ``TranscriptionEngine.transcribe`` call.
+    """
+
+    POOL_WORKLOAD = 'transcribe_parallel'
+
+    def __init__(self, executors: ExecutorManager, whisper_config: Dict[str, Any],
+                 registry: ModelRegistry):
+        """
+        Initialize transcriber
+
+        Args:
+            executors: Executor manager providing the process pool
+            whisper_config: The 'ai.whisper' configuration section
+            registry: Model registry that owns the worker pool's lifetime
+        """
+        parallel_config = whisper_config.get("parallel", {}) or {}
+        self.executors = executors
+        self.registry = registry
+        self.whisper_config = {key: value for key, value in whisper_config.items() if key != "parallel"}
+        self.window_seconds = parallel_config.get("window_seconds", 300)
+        self.overlap_seconds = parallel_config.get("overlap_seconds", 5)
+        self.search_seconds = parallel_config.get("search_seconds", 15)
+        self.min_duration = parallel_config.get("min_duration_seconds", 600)
+        self.workers, self.threads = resolve_workers(parallel_config)
+
+        if self.window_seconds <= self.search_seconds:
+            raise ValueError(
+                f"ai.whisper.parallel.window_seconds ({self.window_seconds}) must exceed "
+                f"search_seconds ({self.search_seconds})"
+            )
+
+        # Everything the workers are started with, so a changed config gets its own pool
+        self.pool_key = f"parallel:{self.workers}x{self.threads}:{engine_key(self.whisper_config)}"
+
+    def _start_pool(self):
+        return self.executors.process_pool(
+            self.POOL_WORKLOAD,
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.whisper_config, self.threads)
+        )
+
+    def _stop_pool(self, pool):
+        # A transcriber with another config may have replaced the pool since; leave that one running
+        self.executors.shutdown_pool('process', self.POOL_WORKLOAD, pool=pool)
+
+    def should_split(self, audio: np.ndarray) -> bool:
+        """Short audio is faster on the already-loaded in-process model"""
+        return self.workers > 1 and len(audio) / SAMPLE_RATE >= self.min_duration
+
+    async def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Transcribe audio in parallel windows
+
+        Args:
+            audio: Mono float32 samples at 16 kHz
+            language: Language code, or None to detect it
+
+        Returns:
+            Dictionary with 'text', 'language' and 'segments'
+        """
+        windows = plan_windows(audio, self.window_seconds, self.overlap_seconds, self.search_seconds)
+        logger.info(f"🎙️ Transcribing {len(windows)} windows on {self.workers} worker processes")
+
+        loop = asyncio.get_running_loop()
+        with self.registry.lease(self.pool_key, self._start_pool, release=self._stop_pool) as pool:
+
+            def submit(window, window_language):
+                start, end = window[0], window[1]
+                chunk = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+                return loop.run_in_executor(pool, _transcribe_window, chunk, start, window_language)
+
+            results = []
+            if language is None:
+                # Detect once so every window decodes in the same language
+                first = await submit(windows[0], None)
+                language = first['language']
+                results.append(first)
+
+            results.extend(await asyncio.gather(*(submit(window, language) for window in windows[len(results):])))
+
+        segments = stitch_windows(results, windows)
+        return {
+            'text': ''.join(segment['text'] for segment in segments),
+            'language': language,
+            'segments': segments
+        }
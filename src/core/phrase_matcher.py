@@ -0,0 +1,90 @@
+"""
+Single-pass, word-boundary phrase matching for segment scoring
+"""
+
+import re
+from typing import Dict, Iterable, List, Set
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Regex alternation factored by common prefix, so each position is tried once per character"""
+    trie: Dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 and not terminal else f"(?:{'|'.join(branches)})"
+        return f"{body}?" if terminal else body
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """Finds every phrase of several categories in a text with one compiled regex
+
+    Phrases match on word boundaries only ("right" does not match "bright").
+    Every word position is examined with a zero-width lookahead, so phrases that
+    overlap or share a starting word are all found; each phrase counts once per
+    text, as with the substring checks this replaces.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Initialize matcher
+
+        Args:
+            categories: Category name to literal phrases (case-insensitive)
+        """
+        self.categories: List[str] = list(categories)
+
+        self._phrase_categories: Dict[str, Set[int]] = {}
+        for index, phrases in enumerate(categories.values()):
+            for phrase in phrases:
+                key = self.normalize(phrase).strip()
+                if key:
+                    self._phrase_categories.setdefault(key, set()).add(index)
+
+        # The lookahead captures the longest phrase at a position; shorter phrases
+        # that are word prefixes of it are recovered from this table
+        self._prefixes: Dict[str, List[str]] = {}
+        for phrase in self._phrase_categories:
+            words = phrase.split(' ')
+            self._prefixes[phrase] = [
+                prefix for prefix in (' '.join(words[:n]) for n in range(1, len(words) + 1))
+                if prefix in self._phrase_categories
+            ]
+
+        self._pattern = None
+        if self._phrase_categories:
+            # Trie alternation is greedy per character, so the longest phrase wins at each position
+            self._pattern = re.compile(rf"\b(?=({_trie_pattern(self._phrase_categories)})\b)")
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase and unify typographic apostrophes"""
+        return text.lower().replace('’', "'")
+
+    def phrases(self, text: str) -> Set[str]:
+        """Distinct phrases present in text"""
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+
+        for match in self._pattern.finditer(self.normalize(text)):
+            found.update(self._prefixes.get(match.group(1), ()))
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of distinct phrases found per category"""
+        counts = dict.fromkeys(self.categories, 0)
+        for phrase in self.phrases(text):
+            for index in self._phrase_categories[phrase]:
+                counts[self.categories[index]] += 1
+        return counts
@@ -0,0 +1,135 @@
+"""
+Per-source scene-cut index for snapping highlight boundaries to shot changes
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+
+def detect_scene_cuts(source_path: str, ffmpeg_binary: str = "ffmpeg", sample_fps: float = 10,
+                      threshold: float = 0.12, min_scene_seconds: float = 0.5,
+                      width: int = 64, height: int = 36) -> List[float]:
+    """
+    Find hard cuts in one pass over a tiny grayscale frame stream
+
+    ffmpeg downsamples and scales the video, and frame differences are computed
+    on whole blocks of frames at once.
+
+    Args:
+        source_path: Video file
+        ffmpeg_binary: ffmpeg executable
+        sample_fps: Frames per second analysed
+        threshold: Mean absolute frame difference (0-1) that counts as a cut
+        min_scene_seconds: Cuts closer than this to the previous one are ignored
+        width: Analysis frame width
+        height: Analysis frame height
+
+    Returns:
+        Cut times in seconds, ascending
+
+    Raises:
+        RuntimeError: ffmpeg failed, so the result would not be a real index
+    """
+    command = [
+        ffmpeg_binary, '-hide_banner', '-loglevel', 'error', '-nostdin',
+        '-i', str(source_path),
+        '-an', '-vf', f"fps={sample_fps},scale={width}:{height},format=gray",
+        '-f', 'rawvideo', '-'
+    ]
+
+    frame_bytes = width * height
+    frames_per_read = 512
+    scores = []
+    previous = None
+
+    # stderr goes to a file: a pipe nobody reads could fill up and stall ffmpeg
+    with tempfile.TemporaryFile() as errors:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors)
+        try:
+            while True:
+                data = process.stdout.read(frame_bytes * frames_per_read)
+                count = len(data) // frame_bytes
+                if count == 0:
+                    break
+
+                block = np.frombuffer(data[:count * frame_bytes], dtype=np.uint8).reshape(count, frame_bytes)
+                block = block.astype(np.int16)
+                if previous is not None:
+                    block = np.vstack((previous, block))
+
+                scores.append(np.abs(np.diff(block, axis=0)).mean(axis=1) / 255.0)
+                previous = block[-1:]
+        finally:
+            process.stdout.close()
+            return_code = process.wait()
+
+        if return_code != 0:
+            errors.seek(0)
+            lines = errors.read().decode('utf-8', errors='replace').strip().splitlines()
+            raise RuntimeError(f"ffmpeg exited with {return_code}: {lines[-1] if lines else 'no error output'}")
+
+    if not scores:
+        return []
+
+    # scores[i] compares frame i + 1 with frame i, so a cut lands at frame i + 1
+    score = np.concatenate(scores)
+    candidates = np.flatnonzero(score > threshold) + 1
+
+    cuts = []
+    min_gap = min_scene_seconds * sample_fps
+    for frame in candidates:
+        if not cuts or frame - cuts[-1] >= min_gap:
+            cuts.append(int(frame))
+
+    return [round(frame / sample_fps, 3) for frame in cuts]
+
+
+def snap_highlights(highlights: List[Dict[str, Any]], cuts: List[float], max_shift: float,
+                    min_duration: float, max_duration: float) -> int:
+    """
+    Move highlight start and end times onto nearby scene cuts, in place
+
+    A boundary moves to the closest cut within max_shift seconds. Snaps that
+    would push the clip outside the allowed duration are not applied.
+
+    Returns:
+        Number of boundaries moved
+    """
+    if not cuts:
+        return 0
+
+    cut_times = np.asarray(cuts)
+    moved = 0
+
+    def nearest(t: float) -> Optional[float]:
+        index = int(np.searchsorted(cut_times, t))
+        options = [cut_times[i] for i in (index - 1, index) if 0 <= i < len(cut_times)]
+        best = min(options, key=lambda c: abs(c - t))
+        return float(best) if abs(best - t) <= max_shift else None
+
+    for highlight in highlights:
+        start, end = highlight['start_time'], highlight['end_time']
+        new_start = nearest(start)
+        new_end = nearest(end)
+
+        for candidate_start, candidate_end in ((new_start, new_end), (new_start, None), (None, new_end)):
+            snapped_start = candidate_start if candidate_start is not None else start
+            snapped_end = candidate_end if candidate_end is not None else end
+            if (snapped_start, snapped_end) == (start, end):
+                continue
+            if min_duration <= snapped_end - snapped_start <= max_duration:
+                moved += (snapped_start != start) + (snapped_end != end)
+                highlight['start_time'], highlight['end_time'] = snapped_start, snapped_end
+                break
+
+    return moved
+
+
+def source_identity(path: str) -> List[Any]:
+    """Cache key parts identifying a file without hashing its contents"""
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
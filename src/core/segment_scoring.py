@@ -0,0 +1,207 @@
+"""
+Columnar transcript representation and vectorized segment scoring
+"""
+
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .phrase_matcher import PhraseMatcher
+
+
+class SegmentColumns:
+    """Transcript segments as parallel NumPy arrays
+
+    Building the columns runs the phrase matcher once per segment; scoring the
+    columns is pure array arithmetic, so rescoring with new weights is cheap.
+    """
+
+    def __init__(self, start: np.ndarray, end: np.ndarray, word_count: np.ndarray,
+                 hits: np.ndarray, categories: List[str]):
+        """
+        Initialize columns
+
+        Args:
+            start: Segment start times
+            end: Segment end times
+            word_count: Words per segment
+            hits: (segments, categories) distinct phrase hits
+            categories: Category name of each hits column
+        """
+        self.start = start
+        self.end = end
+        self.word_count = word_count
+        self.hits = hits
+        self.categories = categories
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict[str, Any]], matcher: PhraseMatcher) -> "SegmentColumns":
+        """Build columns from transcript segments"""
+        hits = np.zeros((len(segments), len(matcher.categories)), dtype=np.int32)
+        for i, segment in enumerate(segments):
+            hits[i] = list(matcher.count(segment['text']).values())
+
+        return cls(
+            start=np.fromiter((segment['start'] for segment in segments), dtype=np.float64, count=len(segments)),
+            end=np.fromiter((segment['end'] for segment in segments), dtype=np.float64, count=len(segments)),
+            word_count=np.fromiter((len(segment['text'].split()) for segment in segments),
+                                   dtype=np.int32, count=len(segments)),
+            hits=hits,
+            categories=list(matcher.categories)
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def column(self, category: str) -> np.ndarray:
+        """Hit counts for one category"""
+        return self.hits[:, self.categories.index(category)]
+
+
+def score_columns(columns: SegmentColumns, emotion_weights: Dict[str, float],
+                  hook_weight: float = 2.0, boost_weight: float = 1.5,
+                  audio_scores: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Score every segment at once
+
+    Phrase hits are weighted per category, audio scores are added, and then
+    the length penalty (under 5 words x0.5, over 100 words x0.7) and position
+    bonus (first 10% x1.2, last 10% x1.1) are applied.
+
+    Args:
+        columns: Segment columns
+        emotion_weights: Weight per emotion name (default 1.0)
+        hook_weight: Weight per hook phrase
+        boost_weight: Weight per boost keyword
+        audio_scores: Optional per-segment audio contribution
+
+    Returns:
+        Score per segment
+    """
+    weights = np.array([
+        hook_weight if category == 'hook' else
+        boost_weight if category == 'boost' else
+        emotion_weights.get(category.split(':', 1)[-1], 1.0)
+        for category in columns.categories
+    ], dtype=np.float64)
+
+    scores = columns.hits @ weights if len(weights) else np.zeros(len(columns))
+    if audio_scores is not None:
+        scores = scores + audio_scores
+
+    # Very short or very long segments are less viral
+    scores *= np.where(columns.word_count < 5, 0.5, np.where(columns.word_count > 100, 0.7, 1.0))
+
+    # Beginning and end segments often contain hooks
+    n = len(columns)
+    index = np.arange(n)
+    scores *= np.where(index < n * 0.1, 1.2, np.where(index > n * 0.9, 1.1, 1.0))
+
+    return scores
+
+
+def candidate_windows(columns: SegmentColumns, scores: np.ndarray, min_score: float,
+                      min_duration: float, max_duration: float,
+                      target_durations: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+    """
+    Enumerate contiguous segment windows that could become clips
+
+    For each target duration, every start segment is paired with the shortest
+    run of segments reaching that duration, cut back to fit max_duration.
+    Both window edges only move forward as the start advances, so every target
+    is served by two pointers and a monotonic deque (for the window's peak
+    segment) in a single pass. Window sums come from prefix sums.
+
+    Every window containing a segment scoring at least min_score is kept, once
+    however many targets produce it.
+
+    Args:
+        columns: Segment columns
+        scores: Score per segment
+        min_score: Seed threshold
+        min_duration: Shortest acceptable window
+        max_duration: Longest acceptable window
+        target_durations: Window lengths to aim for (default: min_duration)
+
+    Returns:
+        Windows as dicts with 'first' and 'last' segment index, 'peak' index
+        (highest-scoring segment), 'start_time', 'end_time', 'total_score' and
+        'mean_score', in start order
+    """
+    n = len(columns)
+    if n == 0:
+        return []
+
+    start, end = columns.start, columns.end
+    score_sum = np.concatenate(([0.0], np.cumsum(scores, dtype=np.float64)))
+    seed_sum = np.concatenate(([0], np.cumsum(scores >= min_score)))
+
+    targets = sorted(set(
+        min(max(t, min_duration), max_duration) for t in (target_durations or [min_duration])
+    ))
+
+    # (first, last) -> peak
+    found: Dict[tuple, int] = {}
+
+    def offer(first: int, last: int, peak: int):
+        if seed_sum[last + 1] - seed_sum[first] > 0:
+            found[(first, last)] = peak
+
+    # A transcript shorter than a clip can only yield itself
+    if end[-1] - start[0] < min_duration:
+        targets = []
+        offer(0, n - 1, int(np.argmax(scores)))
+
+    # Per target: reach pointer (first segment meeting the target), cap pointer
+    # (last segment within max_duration), right edge of the peak deque
+    reach = [0] * len(targets)
+    cap = [0] * len(targets)
+    pushed = [-1] * len(targets)
+    peaks = [deque() for _ in targets]
+
+    for first in range(n):
+        for k, target in enumerate(targets):
+            if reach[k] < first:
+                reach[k] = first
+            while reach[k] < n and end[reach[k]] - start[first] < target:
+                reach[k] += 1
+            if reach[k] == n:
+                # Every later start falls short as well
+                continue
+
+            if cap[k] < first:
+                cap[k] = first
+            while cap[k] + 1 < n and end[cap[k] + 1] - start[first] <= max_duration:
+                cap[k] += 1
+
+            last = min(reach[k], cap[k])
+            duration = end[last] - start[first]
+            # A single segment longer than max_duration cannot be cut further
+            if duration < min_duration or (duration > max_duration and last > first):
+                continue
+
+            window = peaks[k]
+            while pushed[k] < last:
+                pushed[k] += 1
+                while window and scores[window[-1]] <= scores[pushed[k]]:
+                    window.pop()
+                window.append(pushed[k])
+            while window[0] < first:
+                window.popleft()
+
+            offer(first, last, window[0])
+
+    windows = []
+    for first, last in sorted(found):
+        total = float(score_sum[last + 1] - score_sum[first])
+        windows.append({
+            'first': first,
+            'last': last,
+            'peak': found[(first, last)],
+            'start_time': float(start[first]),
+            'end_time': float(end[last]),
+            'total_score': total,
+            'mean_score': total / (last - first + 1)
+        })
+    return windows
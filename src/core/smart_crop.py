@@ -0,0 +1,197 @@
+"""
+Face-aware horizontal crop paths from sparse low-resolution frame sampling
+"""
+
+import subprocess
+from typing import Dict, Any, Optional, Tuple
+
+import cv2
+import numpy as np
+from scipy import ndimage
+from loguru import logger
+
+
+class CropPath:
+    """Left edge of a fixed-width crop window over time, in clip seconds"""
+
+    def __init__(self, times: np.ndarray, xs: np.ndarray, crop_width: int):
+        self.times = times
+        self.xs = xs
+        self.crop_width = crop_width
+
+    def x_at(self, t: float) -> int:
+        """Crop left edge at clip time t"""
+        return int(round(float(np.interp(t, self.times, self.xs))))
+
+    def ffmpeg_expr(self) -> str:
+        """
+        Piecewise-linear ffmpeg expression for the crop filter's x option
+
+        Written as a sum of clipped ramps rather than nested if() calls, so the
+        expression stays flat however many keyframes the path has.
+        """
+        terms = [f"{self.xs[0]:.1f}"]
+        for i in range(len(self.times) - 1):
+            span = self.times[i + 1] - self.times[i]
+            if span <= 0 or self.xs[i + 1] == self.xs[i]:
+                continue
+            slope = (self.xs[i + 1] - self.xs[i]) / span
+            terms.append(f"{slope:+.3f}*clip(t-{self.times[i]:.3f},0,{span:.3f})")
+        return "".join(terms)
+
+
+class SmartCropper:
+    """Finds where the subject is in a clip and builds a smoothed crop path
+
+    Frames are pulled from an ffmpeg pipe at a few per second and a few hundred
+    pixels wide. Faces come from OpenCV's Haar cascade; frames without a face
+    fall back to spectral-residual saliency, computed for a whole batch at once.
+    """
+
+    BATCH_FRAMES = 32
+
+    def __init__(self, crop_config: Dict[str, Any], ffmpeg_binary: str = "ffmpeg"):
+        """
+        Initialize cropper
+
+        Args:
+            crop_config: The 'video.smart_crop' configuration section
+            ffmpeg_binary: ffmpeg executable
+        """
+        self.ffmpeg_binary = ffmpeg_binary
+        self.sample_fps = crop_config.get("sample_fps", 2)
+        self.analysis_width = crop_config.get("analysis_width", 320)
+        self.smoothing_seconds = crop_config.get("smoothing_seconds", 1.5)
+        self._face_detector = None
+        self._face_detector_loaded = False
+
+    @property
+    def face_detector(self):
+        """Haar cascade, or None when it cannot be loaded (saliency is used alone)"""
+        if not self._face_detector_loaded:
+            self._face_detector_loaded = True
+            try:
+                classifier = cv2.CascadeClassifier(
+                    cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+                )
+            except (AttributeError, cv2.error):
+                classifier = None
+            # A missing or invalid cascade file still yields a classifier, just an empty one
+            if classifier is None or classifier.empty():
+                logger.warning("⚠️ OpenCV Haar cascade not available, smart crop uses saliency only")
+            else:
+                self._face_detector = classifier
+        return self._face_detector
+
+    def _read_batches(self, source_path: str, start_time: float, duration: float, size: Tuple[int, int]):
+        """Yield (n, h, w) uint8 grayscale frame batches"""
+        width, height = size
+        command = [
+            self.ffmpeg_binary, '-hide_banner', '-loglevel', 'error', '-nostdin',
+            '-ss', f"{start_time:.3f}", '-t', f"{duration:.3f}",
+            '-i', str(source_path),
+            '-an', '-vf', f"fps={self.sample_fps},scale={width}:{height},format=gray",
+            '-f', 'rawvideo', '-'
+        ]
+
+        frame_bytes = width * height
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                data = process.stdout.read(frame_bytes * self.BATCH_FRAMES)
+                count = len(data) // frame_bytes
+                if count == 0:
+                    break
+                yield np.frombuffer(data[:count * frame_bytes], dtype=np.uint8).reshape(count, height, width)
+        finally:
+            process.stdout.close()
+            process.wait()
+
+    def _face_centers(self, frames: np.ndarray) -> np.ndarray:
+        """Horizontal centre (0-1) of the largest face per frame, NaN where none"""
+        centers = np.full(len(frames), np.nan)
+        if self.face_detector is None:
+            return centers
+
+        min_size = max(16, frames.shape[2] // 20)
+
+        for i, frame in enumerate(frames):
+            faces = self.face_detector.detectMultiScale(frame, scaleFactor=1.15, minNeighbors=4,
+                                                        minSize=(min_size, min_size))
+            if len(faces):
+                x, _, w, _ = max(faces, key=lambda f: f[2] * f[3])
+                centers[i] = (x + w / 2) / frames.shape[2]
+
+        return centers
+
+    @staticmethod
+    def _saliency_centers(frames: np.ndarray) -> np.ndarray:
+        """Horizontal centre of mass (0-1) of spectral-residual saliency for a batch"""
+        spectrum = np.fft.fft2(frames.astype(np.float32), axes=(1, 2))
+        log_amplitude = np.log(np.abs(spectrum) + 1e-8)
+        residual = log_amplitude - ndimage.uniform_filter(log_amplitude, size=(1, 3, 3))
+        saliency = np.abs(np.fft.ifft2(np.exp(residual + 1j * np.angle(spectrum)), axes=(1, 2))) ** 2
+        saliency = ndimage.gaussian_filter(saliency, sigma=(0, 3, 3))
+
+        # Only clearly salient pixels count, otherwise background noise pulls everything to the middle
+        saliency = np.maximum(saliency - 3 * saliency.mean(axis=(1, 2), keepdims=True), 0)
+
+        profile = saliency.sum(axis=1)
+        columns = (np.arange(frames.shape[2]) + 0.5) / frames.shape[2]
+        total = profile.sum(axis=1)
+        centers = (profile * columns).sum(axis=1) / np.maximum(total, 1e-12)
+        # Flat frames (fades, black) have no subject; hold the centre
+        flat = frames.reshape(len(frames), -1).std(axis=1) < 2
+        return np.where((total > 0) & ~flat, centers, 0.5)
+
+    def _smooth(self, centers: np.ndarray) -> np.ndarray:
+        """Remove detector jitter: median filter for outliers, then a moving average"""
+        window = max(1, int(round(self.smoothing_seconds * self.sample_fps)))
+        if window > 1:
+            centers = ndimage.median_filter(centers, size=window, mode='nearest')
+            centers = ndimage.uniform_filter1d(centers, size=window, mode='nearest')
+        return centers
+
+    def analyze(self, source_path: str, start_time: float, end_time: float,
+                source_size: Tuple[int, int], target_aspect: float) -> Optional[CropPath]:
+        """
+        Build a crop path for one clip
+
+        Args:
+            source_path: Source video file
+            start_time: Clip start in file seconds
+            end_time: Clip end in file seconds
+            source_size: Source width and height
+            target_aspect: Output width / height
+
+        Returns:
+            Crop path, or None when the source needs no horizontal crop or analysis failed
+        """
+        source_width, source_height = source_size
+        crop_width = int(source_height * target_aspect)
+        if crop_width >= source_width:
+            return None
+
+        analysis_height = max(2, int(round(self.analysis_width * source_height / source_width / 2)) * 2)
+
+        try:
+            centers = []
+            for frames in self._read_batches(source_path, start_time, end_time - start_time,
+                                             (self.analysis_width, analysis_height)):
+                batch = self._face_centers(frames)
+                missing = np.isnan(batch)
+                if missing.any():
+                    batch[missing] = self._saliency_centers(frames[missing])
+                centers.append(batch)
+        except Exception as e:
+            logger.warning(f"⚠️ Smart crop analysis failed: {e}")
+            return None
+
+        if not centers:
+            return None
+
+        centers = self._smooth(np.concatenate(centers))
+        times = np.arange(len(centers)) / self.sample_fps
+        xs = np.clip(centers * source_width - crop_width / 2, 0, source_width - crop_width)
+
+        return CropPath(times, np.round(xs), crop_width)
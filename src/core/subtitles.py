@@ -0,0 +1,150 @@
+"""
+Parsing and quality checks for platform subtitle tracks used in place of transcription
+"""
+
+import re
+import html
+from typing import Dict, Any, List, Optional, Tuple
+
+
+TIMING_RE = re.compile(r'(\d+:)?(\d{1,2}):(\d{2})[.,](\d{3})\s*-->\s*(\d+:)?(\d{1,2}):(\d{2})[.,](\d{3})')
+INLINE_TIME_RE = re.compile(r'<(\d+:)?(\d{1,2}):(\d{2})\.(\d{3})>')
+TAG_RE = re.compile(r'<[^>]+>')
+# Non-speech annotations such as [Music] or (applause)
+ANNOTATION_RE = re.compile(r'^\s*[\[(♪].*[\])♪]\s*$')
+
+
+def _seconds(hours: Optional[str], minutes: str, seconds: str, millis: str) -> float:
+    return int(hours[:-1] if hours else 0) * 3600 + int(minutes) * 60 + int(seconds) + int(millis) / 1000
+
+
+def _clean(text: str) -> str:
+    return ' '.join(html.unescape(TAG_RE.sub('', text)).split())
+
+
+def _timed_words(line: str, cue_start: float, cue_end: float) -> List[Dict[str, Any]]:
+    """Split a line with inline <hh:mm:ss.mmm> word times (YouTube auto captions) into words"""
+    words = []
+    cursor = cue_start
+    position = 0
+
+    for match in INLINE_TIME_RE.finditer(line):
+        for token in _clean(line[position:match.start()]).split():
+            words.append({'word': token, 'start': cursor})
+        cursor = _seconds(*match.groups())
+        position = match.end()
+    for token in _clean(line[position:]).split():
+        words.append({'word': token, 'start': cursor})
+
+    # Words sharing a timestamp are spread up to the next known time
+    for i, word in enumerate(words):
+        word['end'] = words[i + 1]['start'] if i + 1 < len(words) else cue_end
+        word['end'] = max(word['end'], word['start'])
+
+    return words
+
+
+def parse_vtt(content: str, auto: bool = False) -> List[Dict[str, Any]]:
+    """
+    Parse a WebVTT document into transcript segments, one per cue
+
+    Args:
+        content: WebVTT text
+        auto: The track is a rolling auto-caption track, whose cues repeat the
+            previous line above the new one; repeated lines are dropped so that
+            every spoken line appears once. Manual tracks are kept verbatim.
+
+    Returns:
+        Segments shaped like Whisper output: 'start', 'end', 'text', 'words'
+    """
+    segments = []
+    last_line = None
+    lines = content.replace('\r\n', '\n').split('\n')
+    i = 0
+
+    while i < len(lines):
+        match = TIMING_RE.search(lines[i])
+        i += 1
+        if not match:
+            continue
+
+        groups = match.groups()
+        cue_start, cue_end = _seconds(*groups[:4]), _seconds(*groups[4:])
+
+        # Auto-caption cues can start with a whitespace-only line, so only a truly empty line ends a cue
+        cue_lines = []
+        while i < len(lines) and lines[i] != '' and not TIMING_RE.search(lines[i]):
+            cue_lines.append(lines[i])
+            i += 1
+
+        texts = []
+        words = []
+        for line in cue_lines:
+            text = _clean(line)
+            if not text:
+                continue
+            if auto:
+                if text == last_line:
+                    continue
+                last_line = text
+            texts.append(text)
+            if INLINE_TIME_RE.search(line):
+                words.extend(_timed_words(line, cue_start, cue_end))
+
+        if texts:
+            segments.append({
+                'start': words[0]['start'] if words else cue_start,
+                'end': cue_end,
+                'text': ' '.join(texts),
+                'words': words
+            })
+
+    return segments
+
+
+def check_quality(segments: List[Dict[str, Any]], duration: float, min_coverage: float = 0.3,
+                  min_wpm: float = 40, max_wpm: float = 300,
+                  max_annotation_ratio: float = 0.3) -> Tuple[bool, str]:
+    """
+    Decide whether a subtitle track is good enough to replace transcription
+
+    Args:
+        segments: Parsed segments
+        duration: Source duration in seconds (0 if unknown)
+        min_coverage: Minimum share of the duration the cues must span
+        min_wpm: Lowest plausible speech rate for a complete track
+        max_wpm: Highest plausible speech rate; above it cues are likely duplicated
+        max_annotation_ratio: Highest share of cues like [Music] or [Applause]
+
+    Returns:
+        (usable, reason)
+    """
+    if not segments:
+        return False, "no cues"
+
+    annotations = sum(1 for segment in segments if ANNOTATION_RE.match(segment['text']))
+    if annotations / len(segments) > max_annotation_ratio:
+        return False, f"{annotations}/{len(segments)} cues are non-speech annotations"
+
+    spanned = segments[-1]['end'] - segments[0]['start']
+    if duration > 0 and spanned / duration < min_coverage:
+        return False, f"cues span only {spanned / duration:.0%} of the video"
+
+    minutes = (duration or spanned) / 60
+    words = sum(len(segment['text'].split()) for segment in segments)
+    if minutes > 0:
+        wpm = words / minutes
+        if wpm < min_wpm or wpm > max_wpm:
+            return False, f"implausible speech rate of {wpm:.0f} words per minute"
+
+    return True, "ok"
+
+
+def build_transcript(segments: List[Dict[str, Any]], language: str) -> Dict[str, Any]:
+    """Wrap parsed segments in the structure transcribe_video returns"""
+    return {
+        'text': ' '.join(segment['text'] for segment in segments),
+        'language': language,
+        'segments': segments,
+        'duration': segments[-1]['end'] if segments else 0
+    }
@@ -0,0 +1,181 @@
+"""
+Speech-to-text engines behind a common interface, selected by ai.whisper.backend
+"""
+
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+import numpy as np
+from loguru import logger
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+
+class TranscriptionEngine(ABC):
+    """Base class for transcription backends
+
+    ``transcribe`` takes 16 kHz mono float32 audio and returns a dictionary
+    with 'text', 'language' and 'segments', where each segment has 'start',
+    'end', 'text' and 'words' ({'word', 'start', 'end', 'probability'}).
+    """
+
+    name = "base"
+
+    def __init__(self, whisper_config: Dict[str, Any]):
+        """
+        Initialize engine
+
+        Args:
+            whisper_config: The 'ai.whisper' configuration section
+        """
+        self.whisper_config = whisper_config
+        self.model_name = whisper_config.get("model", "base")
+        self.threads = int(whisper_config.get("threads") or os.cpu_count() or 4)
+        self.batch_size = int(whisper_config.get("batch_size", 1))
+        self.model = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    @abstractmethod
+    def load(self):
+        """Load the model; raises if the backend is unavailable"""
+
+    @abstractmethod
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> Dict[str, Any]:
+        """Transcribe audio with word timestamps"""
+
+
+class WhisperEngine(TranscriptionEngine):
+    """Reference openai-whisper backend running PyTorch in fp32 on CPU"""
+
+    name = "openai-whisper"
+
+    def load(self):
+        import torch
+        import whisper
+
+        torch.set_num_threads(self.threads)
+        self.model = whisper.load_model(self.model_name)
+
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> Dict[str, Any]:
+        # openai-whisper decodes one 30-second window at a time; batch_size does not apply
+        result = self.model.transcribe(audio, language=language, word_timestamps=True, verbose=False)
+
+        segments = [
+            {
+                'start': segment['start'],
+                'end': segment['end'],
+                'text': segment['text'],
+                'words': segment.get('words', []) or []
+            }
+            for segment in result.get('segments', [])
+        ]
+
+        return {'text': result.get('text', ''), 'language': result.get('language'), 'segments': segments}
+
+
+class FasterWhisperEngine(TranscriptionEngine):
+    """CTranslate2 backend with int8 quantized weights, several times faster on CPU"""
+
+    name = "faster-whisper"
+
+    def __init__(self, whisper_config: Dict[str, Any]):
+        super().__init__(whisper_config)
+        self.compute_type = whisper_config.get("compute_type", "int8")
+        self.beam_size = int(whisper_config.get("beam_size", 5))
+        self.pipeline = None
+
+    def load(self):
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper not available. Install with: pip install faster-whisper")
+
+        self.model = WhisperModel(
+            self.model_name,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.threads
+        )
+        if self.batch_size > 1:
+            # Decodes several VAD-split chunks of one file per forward pass
+            self.pipeline = BatchedInferencePipeline(model=self.model)
+
+    def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> Dict[str, Any]:
+        if self.pipeline:
+            segment_iter, info = self.pipeline.transcribe(
+                audio, language=language, word_timestamps=True,
+                beam_size=self.beam_size, batch_size=self.batch_size
+            )
+        else:
+            segment_iter, info = self.model.transcribe(
+                audio, language=language, word_timestamps=True, beam_size=self.beam_size
+            )
+
+        # Segments are generated lazily; decoding happens while iterating
+        segments = []
+        for segment in segment_iter:
+            segments.append({
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'words': [
+                    {'word': word.word, 'start': word.start, 'end': word.end, 'probability': word.probability}
+                    for word in segment.words or []
+                ]
+            })
+
+        return {
+            'text': ''.join(segment['text'] for segment in segments),
+            'language': info.language,
+            'segments': segments
+        }
+
+
+ENGINES = {
+    WhisperEngine.name: WhisperEngine,
+    FasterWhisperEngine.name: FasterWhisperEngine,
+}
+
+
+def create_engine(whisper_config: Dict[str, Any], load: bool = True) -> TranscriptionEngine:
+    """
+    Create the engine named by 'backend', optionally loading it
+
+    An unknown backend name falls back to openai-whisper.
+    """
+    backend = whisper_config.get("backend", WhisperEngine.name)
+    engine_class = ENGINES.get(backend)
+    if engine_class is None:
+        logger.warning(f"⚠️ Unknown transcription backend '{backend}', using {WhisperEngine.name}")
+        engine_class = WhisperEngine
+
+    engine = engine_class(whisper_config)
+    if load:
+        load_start = time.perf_counter()
+        engine.load()
+        logger.info(f"✅ {engine.name} model '{engine.model_name}' loaded in {time.perf_counter() - load_start:.1f}s")
+
+    return engine
+
+
+# Every setting that changes how an engine loads or decodes, with its default
+ENGINE_OPTIONS = (
+    ("backend", WhisperEngine.name),
+    ("model", "base"),
+    ("compute_type", "int8"),
+    ("threads", None),
+    ("batch_size", 1),
+    ("beam_size", 5),
+)
+
+
+def engine_key(whisper_config: Dict[str, Any]) -> str:
+    """Identity of an engine configuration, for sharing loaded engines"""
+    return ":".join(str(whisper_config.get(name, default)) for name, default in ENGINE_OPTIONS)
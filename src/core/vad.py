@@ -0,0 +1,145 @@
+"""
+Energy-based voice activity detection for trimming silence before transcription
+"""
+
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end indices (end exclusive) of True runs in a boolean array"""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    return edges[0::2], edges[1::2]
+
+
+def frame_energy_db(audio: np.ndarray, frame_length: int, chunk_frames: int = 8192) -> np.ndarray:
+    """Mean energy in dB of consecutive frames, computed in chunks to bound temporary memory"""
+    n_frames = len(audio) // frame_length
+    energy = np.empty(n_frames, dtype=np.float64)
+
+    for first in range(0, n_frames, chunk_frames):
+        last = min(n_frames, first + chunk_frames)
+        frames = np.asarray(audio[first * frame_length:last * frame_length], dtype=np.float32)
+        frames = frames.reshape(last - first, frame_length)
+        energy[first:last] = np.mean(frames * frames, axis=1)
+
+    return 10.0 * np.log10(energy + 1e-10)
+
+
+def detect_speech_regions(audio: np.ndarray, sample_rate: int = 16000, frame_ms: int = 30,
+                          margin_db: float = 10.0, min_speech_ms: int = 250,
+                          min_silence_ms: int = 500, pad_ms: int = 200) -> List[Tuple[float, float]]:
+    """
+    Find speech regions in mono PCM audio
+
+    Frame energy is compared against the recording's own noise floor (10th
+    percentile of frame energy), so the detector adapts to quiet and noisy
+    sources alike. All frame work is vectorized.
+
+    Args:
+        audio: Mono float32 samples in [-1, 1]
+        sample_rate: Sample rate of the audio
+        frame_ms: Analysis frame length
+        margin_db: How far above the noise floor a frame must be to count as speech
+        min_speech_ms: Shorter speech bursts are dropped
+        min_silence_ms: Shorter silences inside speech are bridged
+        pad_ms: Padding added around every region
+
+    Returns:
+        Sorted, non-overlapping (start, end) regions in seconds
+    """
+    frame_length = int(sample_rate * frame_ms / 1000)
+    n_frames = len(audio) // frame_length
+    if n_frames == 0:
+        return []
+
+    energy_db = frame_energy_db(audio, frame_length)
+
+    noise_floor = np.percentile(energy_db, 10)
+    # Never treat near-digital-silence as speech, whatever the floor
+    threshold = max(noise_floor + margin_db, -60.0)
+    speech = energy_db > threshold
+
+    # Bridge short silences between speech frames
+    min_silence_frames = max(1, int(min_silence_ms / frame_ms))
+    starts, ends = _runs(~speech)
+    for start, end in zip(starts, ends):
+        if start > 0 and end < n_frames and end - start < min_silence_frames:
+            speech[start:end] = True
+
+    # Drop speech bursts that are too short to be words
+    min_speech_frames = max(1, int(min_speech_ms / frame_ms))
+    starts, ends = _runs(speech)
+    keep = (ends - starts) >= min_speech_frames
+    starts, ends = starts[keep], ends[keep]
+
+    frame_seconds = frame_length / sample_rate
+    total_seconds = len(audio) / sample_rate
+    pad = pad_ms / 1000
+
+    regions: List[Tuple[float, float]] = []
+    for start, end in zip(starts * frame_seconds - pad, ends * frame_seconds + pad):
+        start, end = max(0.0, float(start)), min(total_seconds, float(end))
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], end))
+        else:
+            regions.append((start, end))
+
+    return regions
+
+
+class SpeechTimeline:
+    """Concatenates speech regions and maps gated-audio time back to source time"""
+
+    # Silence inserted between regions keeps Whisper from fusing words across cuts
+    GAP_SECONDS = 0.3
+
+    def __init__(self, regions: List[Tuple[float, float]], sample_rate: int = 16000):
+        """
+        Initialize timeline
+
+        Args:
+            regions: Speech regions in source seconds
+            sample_rate: Sample rate of the audio
+        """
+        self.regions = regions
+        self.sample_rate = sample_rate
+
+        lengths = np.array([end - start for start, end in regions], dtype=np.float64)
+        self.source_starts = np.array([start for start, _ in regions], dtype=np.float64)
+        self.lengths = lengths
+        self.gated_starts = np.concatenate(([0.0], np.cumsum(lengths + self.GAP_SECONDS)[:-1])) if regions else np.array([])
+
+    @property
+    def speech_seconds(self) -> float:
+        return float(self.lengths.sum())
+
+    def gate(self, audio: np.ndarray) -> np.ndarray:
+        """Build the gated audio: speech regions separated by short silences"""
+        gap = np.zeros(int(self.GAP_SECONDS * self.sample_rate), dtype=audio.dtype)
+        pieces = []
+        for start, end in self.regions:
+            pieces.append(audio[int(start * self.sample_rate):int(end * self.sample_rate)])
+            pieces.append(gap)
+        return np.concatenate(pieces[:-1]) if pieces else audio[:0]
+
+    def to_source(self, t: float) -> float:
+        """Map a time in the gated audio to source time"""
+        if not self.regions:
+            return t
+        index = max(0, int(np.searchsorted(self.gated_starts, t, side='right')) - 1)
+        # Times that fall inside an inserted gap clamp to the end of the region before it
+        offset = min(max(0.0, t - self.gated_starts[index]), self.lengths[index])
+        return float(self.source_starts[index] + offset)
+
+    def remap_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Remap segment and word timestamps of a Whisper result to source time"""
+        for segment in result.get('segments', []):
+            segment['start'] = self.to_source(segment['start'])
+            segment['end'] = self.to_source(segment['end'])
+            for word in segment.get('words', []) or []:
+                word['start'] = self.to_source(word['start'])
+                word['end'] = self.to_source(word['end'])
+        return result
@@ -12,14 +12,24 @@ import tempfile
 import hashlib
 
 import yt_dlp
-import whisper
-import ffmpeg
 from moviepy.editor import VideoFileClip, CompositeVideoClip, TextClip
-import cv2
 import numpy as np
 from loguru import logger
 
 from ..utils.config import Config
+from ..utils.cache import DiskCache
+from ..utils.executors import get_executor_manager
+from ..utils.model_registry import get_model_registry
+from .ffmpeg_renderer import FFmpegRenderer
+from .captions import CaptionTrackBuilder, subtitles_filter
+from .vad import detect_speech_regions, SpeechTimeline
+from .parallel_transcriber import ParallelTranscriber
+from .transcription import create_engine, engine_key
+from .subtitles import parse_vtt, check_quality, build_transcript
+from .audio import extract_pcm, hash_pcm
+from .media_probe import get_media_probe, MediaProbe
+from .scene_index import detect_scene_cuts, snap_highlights, source_identity
+from .smart_crop import SmartCropper
 
 # Configure ImageMagick for MoviePy
 from moviepy.config import change_settings
@@ -43,6 +53,7 @@ class VideoProcessor:
         self.config = config
         self.video_config = config.get_video_config()
         self.ai_config = config.get_ai_config()
+        self.executors = get_executor_manager(config)
         
         # Set up FFmpeg path if specified
         ffmpeg_path = self.video_config.get('ffmpeg_path')
@@ -52,14 +63,16 @@ class VideoProcessor:
         else:
             logger.info("Using system FFmpeg")
         
-        # Initialize Whisper model
-        whisper_model = self.ai_config.get("whisper", {}).get("model", "base")
-        try:
-            self.whisper_model = whisper.load_model(whisper_model)
-            logger.info(f"✅ Whisper model '{whisper_model}' loaded successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to load Whisper model: {e}")
-            self.whisper_model = None
+        # Transcription engine (backend chosen by ai.whisper.backend) is loaded on
+        # first use and shared with every other VideoProcessor in the process
+        whisper_config = self.ai_config.get("whisper", {}) or {}
+        self.model_registry = get_model_registry(config)
+        self.transcription_engine_key = engine_key(whisper_config)
+        
+        # Long audio can be split into windows transcribed by a pool of worker processes
+        self.parallel_transcriber = None
+        if (whisper_config.get("parallel", {}) or {}).get("enabled", False):
+            self.parallel_transcriber = ParallelTranscriber(self.executors, whisper_config, self.model_registry)
         
         # Ensure directories exist
         self.download_path = Path(self.video_config.get("download_path", "./downloads"))
@@ -68,6 +81,44 @@ class VideoProcessor:
         
         for path in [self.download_path, self.output_path, self.temp_path]:
             path.mkdir(parents=True, exist_ok=True)
+        
+        # Shared ffprobe layer; media facts are read from headers, never decoded
+        self.media_probe = get_media_probe(self.video_config.get("ffprobe_binary", "ffprobe"))
+        
+        # Render backend: "moviepy" composites frames in Python, "ffmpeg" runs one filter graph
+        self.render_engine = self.video_config.get("render_engine", "moviepy")
+        self.ffmpeg_renderer = FFmpegRenderer(config)
+        
+        # Face-aware framing instead of a fixed center crop
+        self.smart_cropper = None
+        if (self.video_config.get("smart_crop", {}) or {}).get("enabled", False):
+            self.smart_cropper = SmartCropper(
+                self.video_config["smart_crop"],
+                self.video_config.get("ffmpeg_binary", "ffmpeg")
+            )
+        
+        # Caption engine: "ass" burns a word-timed libass track during encode,
+        # "textclip" composites ImageMagick text clips
+        self.caption_engine = self.config.get("captions.engine", "ass")
+        
+        # Transcript cache keyed by audio content, model and language
+        storage_config = config.get_storage_config()
+        self.transcript_cache = None
+        self.scene_cache = None
+        if storage_config.get("cache_transcripts", False):
+            self.transcript_cache = DiskCache(
+                storage_config.get("cache_path", "./cache"),
+                "transcripts",
+                ttl_hours=storage_config.get("cache_duration_hours", 168),
+                max_size_mb=storage_config.get("cache_max_size_mb", 500)
+            )
+            # Scene-cut indexes live next to transcripts, keyed by source file identity
+            self.scene_cache = DiskCache(
+                storage_config.get("cache_path", "./cache"),
+                "scenes",
+                ttl_hours=storage_config.get("cache_duration_hours", 168),
+                max_size_mb=storage_config.get("cache_max_size_mb", 500)
+            )
     
     def _is_url(self, input_source: str) -> bool:
         """Check if input is a URL"""
@@ -95,14 +146,34 @@ class VideoProcessor:
             logger.info(f"📥 Downloading video from: {url}")
             
             video_id = self._generate_video_id(url)
-            output_template = str(self.download_path / f"{video_id}.%(ext)s")
+            
+            # Audio-first mode fetches only the soundtrack now; highlight ranges
+            # are pulled in video later by download_sections
+            audio_only = self.video_config.get("download_mode", "full") == "audio_first"
+            if audio_only:
+                file_stem = f"{video_id}_audio"
+                download_format = 'bestaudio/best'
+                extensions = ['m4a', 'webm', 'opus', 'mp3', 'ogg', 'mp4']
+            else:
+                file_stem = video_id
+                download_format = 'best[height<=1080]'
+                extensions = ['mp4', 'mkv', 'webm', 'avi']
+            
+            output_template = str(self.download_path / f"{file_stem}.%(ext)s")
+            
+            # Existing subtitle tracks can stand in for transcription
+            subtitle_config = self.ai_config.get("whisper", {}).get("subtitles", {}) or {}
+            use_subtitles = subtitle_config.get("enabled", False)
+            subtitle_languages = subtitle_config.get("languages", ["en"])
             
             ydl_opts = {
-                'format': 'best[height<=1080]',
+                'format': download_format,
                 'outtmpl': output_template,
                 'writeinfojson': True,
-                'writesubtitles': False,
-                'writeautomaticsub': False,
+                'writesubtitles': use_subtitles,
+                'writeautomaticsub': use_subtitles and subtitle_config.get("auto_captions", False),
+                'subtitleslangs': subtitle_languages,
+                'subtitlesformat': 'vtt',
                 'ignoreerrors': True,
                 'no_warnings': True,
             }
@@ -113,7 +184,7 @@ class VideoProcessor:
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 # Extract info first
-                info = ydl.extract_info(url, download=False)
+                info = await self.executors.run_in_thread('io', ydl.extract_info, url, download=False)
                 
                 if not info:
                     logger.error("❌ Failed to extract video information")
@@ -126,12 +197,12 @@ class VideoProcessor:
                     return None
                 
                 # Download the video
-                ydl.download([url])
+                await self.executors.run_in_thread('io', ydl.download, [url])
                 
                 # Find downloaded video file
                 video_file = None
-                for ext in ['mp4', 'mkv', 'webm', 'avi']:
-                    potential_file = self.download_path / f"{video_id}.{ext}"
+                for ext in extensions:
+                    potential_file = self.download_path / f"{file_stem}.{ext}"
                     if potential_file.exists():
                         video_file = potential_file
                         break
@@ -140,10 +211,27 @@ class VideoProcessor:
                     logger.error("❌ Downloaded video file not found")
                     return None
                 
-                logger.success(f"✅ Video downloaded: {video_file}")
+                if audio_only:
+                    logger.success(f"✅ Audio downloaded: {video_file}")
+                else:
+                    logger.success(f"✅ Video downloaded: {video_file}")
+                
+                # yt-dlp prefers creator-uploaded tracks over auto captions for each language
+                subtitle_file = None
+                subtitle_language = None
+                if use_subtitles:
+                    for language in subtitle_languages:
+                        candidate = self.download_path / f"{file_stem}.{language}.vtt"
+                        if candidate.exists():
+                            subtitle_file, subtitle_language = candidate, language
+                            break
                 
                 return {
                     'file_path': str(video_file),
+                    'subtitle_file': str(subtitle_file) if subtitle_file else None,
+                    'subtitle_language': subtitle_language,
+                    'subtitle_source': 'manual' if subtitle_language in (info.get('subtitles') or {}) else 'auto',
+                    'audio_only': audio_only,
                     'video_id': video_id,
                     'title': info.get('title', 'Unknown'),
                     'duration': duration,
@@ -160,50 +248,172 @@ class VideoProcessor:
             logger.error(f"❌ Error downloading video: {e}")
             return None
     
-    async def transcribe_video(self, video_path: str) -> Optional[Dict[str, Any]]:
+    def _plan_sections(self, highlights: List[Dict[str, Any]], duration: float) -> List[tuple]:
+        """Pad highlight ranges and merge the ones that overlap into download sections"""
+        padding = self.video_config.get("section_padding_seconds", 5)
+        
+        ranges = []
+        for highlight in highlights:
+            start = max(0.0, highlight['start_time'] - padding)
+            end = highlight['end_time'] + padding
+            if duration:
+                end = min(end, duration)
+            ranges.append((start, end))
+        
+        ranges.sort()
+        merged = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        
+        return merged
+    
+    async def download_sections(self, video_data: Dict[str, Any],
+                                highlights: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Download only the video ranges needed for the given highlights
+        
+        Args:
+            video_data: Video data from an audio-first download
+            highlights: Highlights that will be rendered
+            
+        Returns:
+            Per highlight, the section file path and its offset in source seconds
+        """
+        sections: List[Optional[Dict[str, Any]]] = [None] * len(highlights)
+        if not highlights:
+            return sections
+        
+        try:
+            from yt_dlp.utils import download_range_func
+            
+            video_id = video_data['video_id']
+            planned = self._plan_sections(highlights, video_data.get('duration', 0))
+            logger.info(f"📥 Downloading {len(planned)} video section(s) for {len(highlights)} highlight(s)")
+            
+            # Stream-copied sections may begin at the keyframe before the range
+            force_keyframes = self.video_config.get("section_force_keyframes", True)
+            
+            downloaded = []
+            for start, end in planned:
+                file_stem = f"{video_id}_section_{int(start)}_{int(end)}"
+                ydl_opts = {
+                    'format': 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+                    'outtmpl': str(self.temp_path / f"{file_stem}.%(ext)s"),
+                    'merge_output_format': 'mp4',
+                    'download_ranges': download_range_func(None, [(start, end)]),
+                    'force_keyframes_at_cuts': force_keyframes,
+                    'ignoreerrors': True,
+                    'no_warnings': True,
+                    'quiet': True,
+                }
+                
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    await self.executors.run_in_thread('io', ydl.download, [video_data['url']])
+                
+                section_file = next(
+                    (path for path in self.temp_path.glob(f"{file_stem}.*") if path.suffix != '.part'),
+                    None
+                )
+                if section_file:
+                    offset = start
+                    if not force_keyframes:
+                        # The cut at the end is close to exact, so the section really starts
+                        # at the end minus the duration actually written
+                        media = await self.executors.run_in_thread('io', self.media_probe.probe, str(section_file))
+                        if media and media.get('duration'):
+                            offset = min(start, max(0.0, end - media['duration']))
+                    downloaded.append((start, end, offset, str(section_file)))
+                else:
+                    logger.warning(f"⚠️ Section {start:.1f}s - {end:.1f}s was not downloaded")
+            
+            for i, highlight in enumerate(highlights):
+                for start, end, offset, path in downloaded:
+                    if start <= highlight['start_time'] and highlight['end_time'] <= end:
+                        sections[i] = {'file_path': path, 'offset': offset}
+                        break
+            
+        except Exception as e:
+            logger.error(f"❌ Error downloading video sections: {e}")
+        
+        return sections
+    
+    async def extract_audio(self, video_path: str, duration_hint: float = 0) -> np.ndarray:
+        """
+        Decode the soundtrack to 16 kHz mono PCM in memory
+        
+        Args:
+            video_path: Path to audio or video file
+            duration_hint: Expected duration, used to size the buffer
+            
+        Returns:
+            Float32 samples; memory-mapped for very long inputs
+        """
+        audio_config = self.video_config.get("audio_extraction", {}) or {}
+        return await self.executors.run_in_thread(
+            'io',
+            extract_pcm,
+            video_path,
+            self.video_config.get("ffmpeg_binary", "ffmpeg"),
+            duration_hint,
+            self.temp_path,
+            audio_config.get("memmap_min_seconds", 1800)
+        )
+    
+    async def transcribe_video(self, video_path: str, audio: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
         """
         Transcribe video using Whisper
         
         Args:
             video_path: Path to video file
+            audio: Already extracted 16 kHz mono PCM; extracted from the file if omitted
             
         Returns:
             Dictionary with transcript and segments
         """
-        if not self.whisper_model:
-            logger.error("❌ Whisper model not loaded")
-            return None
-        
         try:
             logger.info(f"🎙️ Transcribing video: {video_path}")
             
-            # Extract audio first for better performance
-            audio_file = self.temp_path / f"audio_{Path(video_path).stem}.wav"
-            
-            # Use ffmpeg to extract audio
-            (
-                ffmpeg
-                .input(video_path)
-                .output(str(audio_file), acodec='pcm_s16le', ac=1, ar='16k')
-                .overwrite_output()
-                .run(quiet=True, capture_stdout=True)
-            )
+            if audio is None:
+                audio = await self.extract_audio(video_path)
             
-            # Transcribe audio
             whisper_config = self.ai_config.get("whisper", {})
             language = whisper_config.get("language")
             if language == "auto":
                 language = None
+            vad_config = whisper_config.get("vad", {}) or {}
             
-            result = self.whisper_model.transcribe(
-                str(audio_file),
-                language=language,
-                word_timestamps=True,
-                verbose=False
-            )
+            # Reuse a previous transcript of identical audio
+            cache_key = None
+            if self.transcript_cache:
+                audio_hash = await self.executors.run_in_thread('io', hash_pcm, audio)
+                cache_key = DiskCache.make_key(
+                    audio_hash,
+                    whisper_config.get("backend", "openai-whisper"),
+                    whisper_config.get("model", "base"),
+                    language or "auto",
+                    vad_config.get("enabled", False)
+                )
+                cached = self.transcript_cache.get(cache_key)
+                if cached:
+                    logger.success(f"✅ Transcript loaded from cache: {len(cached['segments'])} segments")
+                    return cached
             
-            # Clean up audio file
-            audio_file.unlink(missing_ok=True)
+            # Only hand speech to Whisper; silence costs decode time and invites hallucinations
+            timeline = None
+            if vad_config.get("enabled", False):
+                audio, timeline = await self.executors.run_in_thread('io', self._gate_speech, audio, vad_config)
+            
+            # Transcribe audio
+            if self.parallel_transcriber and self.parallel_transcriber.should_split(audio):
+                result = await self.parallel_transcriber.transcribe(audio, language)
+            else:
+                result = await self.executors.run_in_thread('transcribe', self._transcribe_blocking, audio, language)
+            
+            if timeline:
+                result = timeline.remap_result(result)
             
             # Process segments for better structure
             segments = []
@@ -217,17 +427,56 @@ class VideoProcessor:
             
             logger.success(f"✅ Transcription complete: {len(segments)} segments")
             
-            return {
+            transcript = {
                 'text': result['text'],
                 'language': result.get('language', 'unknown'),
                 'segments': segments,
                 'duration': segments[-1]['end'] if segments else 0
             }
             
+            if cache_key:
+                self.transcript_cache.set(cache_key, transcript)
+            
+            return transcript
+            
         except Exception as e:
             logger.error(f"❌ Error transcribing video: {e}")
             return None
     
+    def _transcribe_blocking(self, audio: np.ndarray, language: Optional[str]) -> Dict[str, Any]:
+        """Run the shared engine, loading it on first use"""
+        whisper_config = self.ai_config.get("whisper", {}) or {}
+        with self.model_registry.lease(self.transcription_engine_key,
+                                       lambda: create_engine(whisper_config)) as engine:
+            return engine.transcribe(audio, language)
+    
+    def _gate_speech(self, audio: np.ndarray, vad_config: Dict[str, Any]) -> tuple:
+        """
+        Cut audio down to its speech regions
+        
+        Returns:
+            (audio to transcribe, timeline for remapping or None if gating was skipped)
+        """
+        sample_rate = 16000
+        regions = detect_speech_regions(
+            audio,
+            sample_rate,
+            margin_db=vad_config.get("margin_db", 10.0),
+            min_speech_ms=vad_config.get("min_speech_ms", 250),
+            min_silence_ms=vad_config.get("min_silence_ms", 500),
+            pad_ms=vad_config.get("pad_ms", 200)
+        )
+        
+        timeline = SpeechTimeline(regions, sample_rate)
+        total_seconds = len(audio) / sample_rate
+        
+        # Nothing detected usually means a bad threshold, not a silent video
+        if not regions or timeline.speech_seconds >= 0.95 * total_seconds:
+            return audio, None
+        
+        logger.info(f"🔇 VAD kept {timeline.speech_seconds:.0f}s of {total_seconds:.0f}s in {len(regions)} speech regions")
+        return timeline.gate(audio), timeline
+    
     async def process_input(self, input_source: str) -> Optional[Dict[str, Any]]:
         """
         Process input source (URL or file) and return video data with transcript
@@ -238,6 +487,22 @@ class VideoProcessor:
         Returns:
             Complete video data with transcript
         """
+        video_data = await self.prepare_input(input_source)
+        if not video_data:
+            return None
+        
+        return await self.transcribe_input(video_data)
+    
+    async def prepare_input(self, input_source: str) -> Optional[Dict[str, Any]]:
+        """
+        Download or locate the input source and collect its metadata
+        
+        Args:
+            input_source: YouTube URL or local file path
+            
+        Returns:
+            Video data without transcript
+        """
         try:
             if self._is_url(input_source):
                 # Download from URL
@@ -268,17 +533,47 @@ class VideoProcessor:
                     'url': input_source
                 }
             
-            # Get video info using moviepy
-            try:
-                with VideoFileClip(video_path) as clip:
-                    video_data['duration'] = clip.duration
-                    video_data['fps'] = clip.fps
-                    video_data['resolution'] = f"{clip.w}x{clip.h}"
-            except Exception as e:
-                logger.warning(f"⚠️ Could not get video info: {e}")
+            # Get media info from ffprobe
+            media = await self.executors.run_in_thread('io', self.media_probe.probe, video_path)
+            if media:
+                video_data['media'] = {key: value for key, value in media.items() if key != 'streams'}
+                if media['duration']:
+                    video_data['duration'] = media['duration']
+                if media['video'] and not video_data.get('audio_only'):
+                    video_data['fps'] = media['video']['fps']
+                    resolution = MediaProbe.resolution(media)
+                    if resolution:
+                        video_data['resolution'] = f"{resolution[0]}x{resolution[1]}"
+            else:
+                logger.warning(f"⚠️ Could not get video info: {video_path}")
+            
+            return video_data
+            
+        except Exception as e:
+            logger.error(f"❌ Error processing input: {e}")
+            return None
+    
+    async def transcribe_input(self, video_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Transcribe prepared video data and attach transcript and file metadata
+        
+        Args:
+            video_data: Video data from prepare_input
             
-            # Transcribe the video
-            transcript = await self.transcribe_video(video_path)
+        Returns:
+            Complete video data with transcript
+        """
+        try:
+            video_path = video_data['file_path']
+            
+            # Use the platform's subtitles when they pass quality checks, otherwise transcribe
+            transcript = None
+            if video_data.get('subtitle_file'):
+                transcript = self._load_subtitle_transcript(video_data)
+            if not transcript:
+                # Kept on video_data so later analysis can reuse the decoded PCM
+                video_data['audio'] = await self.extract_audio(video_path, video_data.get('duration', 0))
+                transcript = await self.transcribe_video(video_path, video_data['audio'])
             if not transcript:
                 logger.error("❌ Failed to transcribe video")
                 return None
@@ -297,6 +592,41 @@ class VideoProcessor:
             logger.error(f"❌ Error processing input: {e}")
             return None
     
+    def _load_subtitle_transcript(self, video_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build a transcript from a downloaded subtitle track
+        
+        Returns:
+            Transcript in the transcribe_video structure, or None if the track is unusable
+        """
+        subtitle_file = Path(video_data['subtitle_file'])
+        subtitle_config = self.ai_config.get("whisper", {}).get("subtitles", {}) or {}
+        
+        try:
+            segments = parse_vtt(
+                subtitle_file.read_text(encoding='utf-8', errors='replace'),
+                auto=video_data.get('subtitle_source') == 'auto'
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read subtitles {subtitle_file}: {e}")
+            return None
+        finally:
+            subtitle_file.unlink(missing_ok=True)
+        
+        usable, reason = check_quality(
+            segments,
+            video_data.get('duration', 0),
+            min_coverage=subtitle_config.get("min_coverage", 0.3),
+            min_wpm=subtitle_config.get("min_words_per_minute", 40),
+            max_wpm=subtitle_config.get("max_words_per_minute", 300)
+        )
+        if not usable:
+            logger.info(f"📝 Ignoring {video_data.get('subtitle_source')} subtitles ({reason}), transcribing instead")
+            return None
+        
+        logger.success(f"✅ Using {video_data.get('subtitle_source')} subtitles: {len(segments)} segments")
+        return build_transcript(segments, video_data.get('subtitle_language') or 'unknown')
+    
     async def create_clip(self, video_data: Dict[str, Any], highlight: Dict[str, Any], title_override: str = None) -> Optional[Dict[str, Any]]:
         """
         Create a short clip from video based on highlight data
@@ -309,6 +639,242 @@ class VideoProcessor:
         Returns:
             Clip data with file paths and metadata
         """
+        clips = await self.create_clips(video_data, [highlight], title_override=title_override)
+        return clips[0] if clips else None
+    
+    async def scene_cuts(self, video_path: str) -> List[float]:
+        """
+        Get the scene-cut index of a source, building it on first use
+        
+        Args:
+            video_path: Source video file
+            
+        Returns:
+            Cut times in seconds
+            
+        Raises:
+            RuntimeError: ffmpeg failed; nothing is cached, so the next call retries
+        """
+        scene_config = self.video_config.get("scene_snap", {}) or {}
+        sample_fps = scene_config.get("sample_fps", 10)
+        threshold = scene_config.get("threshold", 0.12)
+        
+        cache_key = None
+        if self.scene_cache:
+            cache_key = DiskCache.make_key(*source_identity(video_path), sample_fps, threshold)
+            cached = self.scene_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        cuts = await self.executors.run_in_thread(
+            'io',
+            detect_scene_cuts,
+            video_path,
+            self.video_config.get("ffmpeg_binary", "ffmpeg"),
+            sample_fps,
+            threshold
+        )
+        logger.info(f"🎞️ Scene index built: {len(cuts)} cuts")
+        
+        if cache_key:
+            self.scene_cache.set(cache_key, cuts)
+        
+        return cuts
+    
+    async def snap_to_scenes(self, video_data: Dict[str, Any], highlights: List[Dict[str, Any]]):
+        """Move highlight boundaries onto nearby scene cuts, in place"""
+        scene_config = self.video_config.get("scene_snap", {}) or {}
+        if not scene_config.get("enabled", False):
+            return
+        
+        try:
+            cuts = await self.scene_cuts(video_data['file_path'])
+        except Exception as e:
+            logger.warning(f"⚠️ Scene detection failed: {e}")
+            return
+        
+        moved = snap_highlights(
+            highlights,
+            cuts,
+            scene_config.get("max_shift_seconds", 1.5),
+            self.video_config.get("clip_duration_min", 25),
+            self.video_config.get("clip_duration_max", 65)
+        )
+        if moved:
+            logger.debug(f"🎞️ Snapped {moved} highlight boundaries to scene cuts")
+    
+    async def create_clips(self, video_data: Dict[str, Any], highlights: List[Dict[str, Any]],
+                           title_override: str = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create clips for several highlights while opening the source only once
+        
+        Highlight ranges are rendered in source order so the shared reader
+        only ever seeks forward.
+        
+        Args:
+            video_data: Original video data
+            highlights: Highlight information with timestamps
+            title_override: Optional title override
+            
+        Returns:
+            Clip data for each highlight in input order (None where rendering failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(highlights)
+        if not highlights:
+            return results
+        
+        # Start and end on shot changes where one is close; audio-only sources have no shots
+        if not video_data.get('audio_only'):
+            await self.snap_to_scenes(video_data, highlights)
+        
+        # Resolve which file each highlight is rendered from
+        if video_data.get('audio_only'):
+            sources = await self.download_sections(video_data, highlights)
+        else:
+            sources = [{'file_path': video_data['file_path'], 'offset': 0.0}] * len(highlights)
+        
+        # Plan all ranges up front, ordered by start time
+        render_order = sorted(
+            (i for i in range(len(highlights)) if sources[i]),
+            key=lambda i: highlights[i]['start_time']
+        )
+        
+        # Group ranges by the file they are rendered from, keeping start order
+        source_groups: Dict[str, List[int]] = {}
+        for index in render_order:
+            source_groups.setdefault(sources[index]['file_path'], []).append(index)
+        
+        if self.render_engine == "ffmpeg":
+            pending = []
+            
+            # Clips from one source share ffmpeg passes that decode each stretch once
+            for source_path, indices in source_groups.items():
+                media = await self.executors.run_in_thread('io', self.media_probe.probe, source_path)
+                rendered = await self._render_highlights_ffmpeg(
+                    video_data, [highlights[index] for index in indices], title_override,
+                    media, sources[indices[0]]
+                )
+                
+                for index, clip_data in zip(indices, rendered):
+                    if clip_data:
+                        results[index] = clip_data
+                    else:
+                        pending.append(index)
+            
+            if pending:
+                logger.warning(f"⚠️ Falling back to MoviePy for {len(pending)} clip(s)")
+            
+            source_groups = {}
+            for index in pending:
+                source_groups.setdefault(sources[index]['file_path'], []).append(index)
+        
+        # MoviePy opens each source file once but encodes every clip separately
+        for source_path, indices in source_groups.items():
+            try:
+                with VideoFileClip(source_path) as video:
+                    for index in indices:
+                        results[index] = await self._render_highlight(
+                            video, video_data, highlights[index], title_override,
+                            sources[index]['offset']
+                        )
+            except Exception as e:
+                logger.error(f"❌ Error opening source video: {e}")
+        
+        return results
+    
+    async def _analyze_crop(self, source_path: str, start_time: float, end_time: float,
+                            source_size: tuple):
+        """Smart-crop path for a clip range, or None to use the center crop"""
+        if not self.smart_cropper:
+            return None
+        
+        target_resolution = self.video_config.get("resolution", "1080x1920")
+        width, height = map(int, target_resolution.split('x'))
+        
+        return await self.executors.run_in_thread(
+            'io',
+            self.smart_cropper.analyze,
+            source_path,
+            start_time,
+            end_time,
+            source_size,
+            width / height
+        )
+    
+    async def _render_highlights_ffmpeg(self, video_data: Dict[str, Any], highlights: List[Dict[str, Any]],
+                                        title_override: Optional[str], media: Optional[Dict[str, Any]],
+                                        source: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Render every highlight held by one source file with shared ffmpeg passes
+        
+        Returns:
+            Clip data per highlight, None where rendering failed
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(highlights)
+        source_size = MediaProbe.resolution(media)
+        if not source_size:
+            return results
+        
+        jobs = []
+        subtitle_files = []
+        try:
+            for highlight in highlights:
+                start_time = highlight['start_time']
+                end_time = highlight['end_time']
+                clip_title = title_override or highlight.get('title', 'Untitled Clip')
+                
+                logger.info(f"🎞️ Creating clip (ffmpeg): {clip_title} ({start_time:.1f}s - {end_time:.1f}s)")
+                
+                clip_id = f"{video_data['video_id']}_{int(start_time)}_{int(end_time)}"
+                
+                captions = None
+                title = clip_title if self.config.get("captions.show_title", True) else None
+                subtitle_file = self._write_caption_track(video_data, highlight, clip_id, title)
+                
+                if subtitle_file:
+                    subtitle_files.append(subtitle_file)
+                    title = None
+                elif self.config.get("captions.enabled", True):
+                    captions = self._split_caption_text(highlight.get('text', ''))
+                
+                crop_path = await self._analyze_crop(source['file_path'], start_time - source['offset'],
+                                                     end_time - source['offset'], source_size)
+                
+                jobs.append({
+                    'clip_id': clip_id,
+                    'clip_title': clip_title,
+                    'output_file': self.output_path / f"{clip_id}.mp4",
+                    'start_time': start_time - source['offset'],
+                    'end_time': end_time - source['offset'],
+                    'captions': captions,
+                    'title': title,
+                    'subtitle_file': subtitle_file,
+                    'crop_x': crop_path.ffmpeg_expr() if crop_path else None
+                })
+            
+            rendered = await self.ffmpeg_renderer.render_many(
+                source['file_path'], jobs, source_size, has_audio=bool(media.get('audio'))
+            )
+            
+        except Exception as e:
+            logger.warning(f"⚠️ FFmpeg render error: {e}")
+            return results
+        
+        finally:
+            for subtitle_file in subtitle_files:
+                subtitle_file.unlink(missing_ok=True)
+        
+        for i, (highlight, job, ok) in enumerate(zip(highlights, jobs, rendered)):
+            if ok:
+                results[i] = self._build_clip_data(video_data, highlight, job['clip_id'],
+                                                   job['output_file'], job['clip_title'])
+                logger.success(f"✅ Clip created: {job['output_file']}")
+        
+        return results
+    
+    async def _render_highlight(self, video, video_data: Dict[str, Any], highlight: Dict[str, Any],
+                                title_override: str = None, offset: float = 0.0) -> Optional[Dict[str, Any]]:
+        """Render a single highlight from an already opened source clip"""
         try:
             start_time = highlight['start_time']
             end_time = highlight['end_time']
@@ -320,36 +886,55 @@ class VideoProcessor:
             clip_id = f"{video_data['video_id']}_{int(start_time)}_{int(end_time)}"
             output_file = self.output_path / f"{clip_id}.mp4"
             
-            # Load video
-            with VideoFileClip(video_data['file_path']) as video:
-                # Extract clip segment
-                clip = video.subclip(start_time, end_time)
-                
-                # Resize to vertical format (9:16)
-                target_resolution = self.video_config.get("resolution", "1080x1920")
-                width, height = map(int, target_resolution.split('x'))
-                
-                # Crop to vertical aspect ratio
-                original_width, original_height = clip.w, clip.h
-                target_aspect = width / height
-                original_aspect = original_width / original_height
-                
-                if original_aspect > target_aspect:
-                    # Video is wider than target - crop sides
-                    new_width = int(original_height * target_aspect)
-                    x_center = original_width // 2
-                    x1 = x_center - new_width // 2
-                    clip = clip.crop(x1=x1, x2=x1 + new_width)
-                else:
-                    # Video is taller than target - crop top/bottom
-                    new_height = int(original_width / target_aspect)
-                    y_center = original_height // 2
-                    y1 = y_center - new_height // 2
-                    clip = clip.crop(y1=y1, y2=y1 + new_height)
-                
-                # Resize to exact target resolution
-                clip = clip.resize((width, height))
-                
+            # Extract clip segment (offset is non-zero when rendering from a downloaded section)
+            clip = video.subclip(start_time - offset, end_time - offset)
+            
+            # Resize to vertical format (9:16)
+            target_resolution = self.video_config.get("resolution", "1080x1920")
+            width, height = map(int, target_resolution.split('x'))
+            
+            # Crop to vertical aspect ratio
+            original_width, original_height = clip.w, clip.h
+            target_aspect = width / height
+            original_aspect = original_width / original_height
+            
+            crop_path = None
+            if original_aspect > target_aspect:
+                crop_path = await self._analyze_crop(video.filename, start_time - offset, end_time - offset,
+                                                     (original_width, original_height))
+            
+            if crop_path:
+                # Follow the subject: slide the crop window along the smoothed path
+                crop_width = crop_path.crop_width
+                clip = clip.fl(
+                    lambda get_frame, t: get_frame(t)[:, crop_path.x_at(t):crop_path.x_at(t) + crop_width],
+                    apply_to=['mask']
+                )
+            elif original_aspect > target_aspect:
+                # Video is wider than target - crop sides
+                new_width = int(original_height * target_aspect)
+                x_center = original_width // 2
+                x1 = x_center - new_width // 2
+                clip = clip.crop(x1=x1, x2=x1 + new_width)
+            else:
+                # Video is taller than target - crop top/bottom
+                new_height = int(original_width / target_aspect)
+                y_center = original_height // 2
+                y1 = y_center - new_height // 2
+                clip = clip.crop(y1=y1, y2=y1 + new_height)
+            
+            # Resize to exact target resolution
+            clip = clip.resize((width, height))
+            
+            # Captions and title are burned in by libass during encode when possible
+            ffmpeg_params = None
+            subtitle_file = self._write_caption_track(
+                video_data, highlight, clip_id,
+                clip_title if self.config.get("captions.show_title", True) else None
+            )
+            if subtitle_file:
+                ffmpeg_params = ['-vf', subtitles_filter(subtitle_file)]
+            else:
                 # Add captions if enabled
                 if self.config.get("captions.enabled", True):
                     clip = await self._add_captions(clip, highlight)
@@ -357,56 +942,49 @@ class VideoProcessor:
                 # Add title overlay if needed
                 if self.config.get("captions.show_title", True):
                     clip = await self._add_title_overlay(clip, clip_title)
-                
-                # Set output parameters
-                fps = self.video_config.get("fps", 30)
-                bitrate = self.video_config.get("bitrate", "2M")
-                
-                # Write the video file
-                try:
-                    clip.write_videofile(
-                        str(output_file),
-                        fps=fps,
-                        bitrate=bitrate,
-                        audio_bitrate=self.video_config.get("audio_bitrate", "128k"),
-                        temp_audiofile=str(self.temp_path / f"temp_audio_{clip_id}.m4a"),
-                        remove_temp=True,
-                        verbose=False,
-                        logger=None,
-                        codec='libx264',
-                        audio_codec='aac'
-                    )
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed with temp audio file, trying without: {e}")
-                    # Fallback without temp audio file
-                    clip.write_videofile(
-                        str(output_file),
-                        fps=fps,
-                        bitrate=bitrate,
-                        audio_bitrate=self.video_config.get("audio_bitrate", "128k"),
-                        verbose=False,
-                        logger=None,
-                        codec='libx264',
-                        audio_codec='aac'
-                    )
-            
-            # Generate metadata
-            clip_data = {
-                'clip_id': clip_id,
-                'file_path': str(output_file),
-                'title': clip_title,
-                'description': highlight.get('description', ''),
-                'hashtags': highlight.get('hashtags', []),
-                'start_time': start_time,
-                'end_time': end_time,
-                'duration': end_time - start_time,
-                'emotion': highlight.get('emotion', 'neutral'),
-                'engagement_score': highlight.get('engagement_score', 0.0),
-                'source_video': video_data['video_id'],
-                'resolution': target_resolution,
-                'file_size': output_file.stat().st_size if output_file.exists() else 0,
-                'created_at': asyncio.get_event_loop().time()
-            }
+            
+            # Set output parameters
+            fps = self.video_config.get("fps", 30)
+            bitrate = self.video_config.get("bitrate", "2M")
+            
+            # Write the video file
+            try:
+                await self.executors.run_in_thread(
+                    'render',
+                    clip.write_videofile,
+                    str(output_file),
+                    fps=fps,
+                    bitrate=bitrate,
+                    audio_bitrate=self.video_config.get("audio_bitrate", "128k"),
+                    temp_audiofile=str(self.temp_path / f"temp_audio_{clip_id}.m4a"),
+                    remove_temp=True,
+                    verbose=False,
+                    logger=None,
+                    codec='libx264',
+                    audio_codec='aac',
+                    ffmpeg_params=ffmpeg_params
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed with temp audio file, trying without: {e}")
+                # Fallback without temp audio file
+                await self.executors.run_in_thread(
+                    'render',
+                    clip.write_videofile,
+                    str(output_file),
+                    fps=fps,
+                    bitrate=bitrate,
+                    audio_bitrate=self.video_config.get("audio_bitrate", "128k"),
+                    verbose=False,
+                    logger=None,
+                    codec='libx264',
+                    audio_codec='aac',
+                    ffmpeg_params=ffmpeg_params
+                )
+            finally:
+                if subtitle_file:
+                    subtitle_file.unlink(missing_ok=True)
+            
+            clip_data = self._build_clip_data(video_data, highlight, clip_id, output_file, clip_title)
             
             logger.success(f"✅ Clip created: {output_file}")
             return clip_data
@@ -415,6 +993,56 @@ class VideoProcessor:
             logger.error(f"❌ Error creating clip: {e}")
             return None
     
+    def _build_clip_data(self, video_data: Dict[str, Any], highlight: Dict[str, Any],
+                         clip_id: str, output_file: Path, clip_title: str) -> Dict[str, Any]:
+        """Generate metadata for a rendered clip"""
+        start_time = highlight['start_time']
+        end_time = highlight['end_time']
+        
+        return {
+            'clip_id': clip_id,
+            'file_path': str(output_file),
+            'title': clip_title,
+            'description': highlight.get('description', ''),
+            'hashtags': highlight.get('hashtags', []),
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration': end_time - start_time,
+            'emotion': highlight.get('emotion', 'neutral'),
+            'engagement_score': highlight.get('engagement_score', 0.0),
+            'source_video': video_data['video_id'],
+            'resolution': self.video_config.get("resolution", "1080x1920"),
+            'file_size': output_file.stat().st_size if output_file.exists() else 0,
+            'created_at': asyncio.get_event_loop().time()
+        }
+    
+    def _write_caption_track(self, video_data: Dict[str, Any], highlight: Dict[str, Any],
+                             clip_id: str, title: Optional[str]) -> Optional[Path]:
+        """Write the ASS caption track for a clip, or None when the ASS engine is not in use"""
+        captions_enabled = self.config.get("captions.enabled", True)
+        if self.caption_engine != "ass" or not (captions_enabled or title):
+            return None
+        
+        segments = []
+        if captions_enabled:
+            segments = video_data.get('transcript', {}).get('segments', [])
+            if not segments and highlight.get('text'):
+                segments = [{'start': highlight['start_time'], 'end': highlight['end_time'], 'text': highlight['text']}]
+        
+        target_resolution = self.video_config.get("resolution", "1080x1920")
+        builder = CaptionTrackBuilder(
+            self.config.get_caption_config(),
+            tuple(map(int, target_resolution.split('x')))
+        )
+        
+        return builder.write(
+            self.temp_path / f"captions_{clip_id}.ass",
+            segments,
+            highlight['start_time'],
+            highlight['end_time'],
+            title=title
+        )
+    
     async def _add_captions(self, clip, highlight: Dict[str, Any]):
         """Add captions to video clip"""
         try:
@@ -426,18 +1054,7 @@ class VideoProcessor:
                 return clip
             
             # Split into manageable chunks
-            words = caption_text.split()
-            chunks = []
-            current_chunk = []
-            
-            for word in words:
-                current_chunk.append(word)
-                if len(' '.join(current_chunk)) > 40:  # Max characters per line
-                    chunks.append(' '.join(current_chunk[:-1]))
-                    current_chunk = [word]
-            
-            if current_chunk:
-                chunks.append(' '.join(current_chunk))
+            chunks = self._split_caption_text(caption_text)
             
             # Create text clips
             text_clips = []
@@ -473,6 +1090,23 @@ class VideoProcessor:
             logger.warning(f"⚠️ Failed to add captions: {e}")
             return clip
     
+    def _split_caption_text(self, caption_text: str) -> List[str]:
+        """Split caption text into chunks of roughly one line each"""
+        words = caption_text.strip().split()
+        chunks = []
+        current_chunk = []
+        
+        for word in words:
+            current_chunk.append(word)
+            if len(' '.join(current_chunk)) > 40:  # Max characters per line
+                chunks.append(' '.join(current_chunk[:-1]))
+                current_chunk = [word]
+        
+        if current_chunk:
+            chunks.append(' '.join(current_chunk))
+        
+        return chunks
+    
     async def _add_title_overlay(self, clip, title: str):
         """Add title overlay to video"""
         try:
@@ -19,6 +19,7 @@ except ImportError:
     logger.warning("⚠️ Instagrapi not available. Install with: pip install instagrapi")
 
 from ..utils.config import Config
+from ..utils.executors import get_executor_manager
 
 
 class InstagramReelsPoster:
@@ -28,6 +29,7 @@ class InstagramReelsPoster:
         """Initialize Instagram Reels poster"""
         self.config = config
         self.instagram_config = config.get_platform_config('instagram')
+        self.executors = get_executor_manager(config)
         
         self.client = None
         self.is_logged_in = False
@@ -85,7 +87,9 @@ class InstagramReelsPoster:
                 pass
             
             # Attempt login
-            self.is_logged_in = self.client.login(self.username, self.password)
+            self.is_logged_in = await self.executors.run_in_thread(
+                'upload', self.client.login, self.username, self.password
+            )
             
             if self.is_logged_in:
                 # Save session
@@ -147,7 +151,9 @@ class InstagramReelsPoster:
             caption = await self._prepare_caption(title, description, hashtags)
             
             # Upload as Reel
-            reel = self.client.clip_upload(
+            reel = await self.executors.run_in_thread(
+                'upload',
+                self.client.clip_upload,
                 Path(video_path),
                 caption=caption,
                 extra_data={
@@ -24,6 +24,7 @@ except ImportError:
     logger.warning("⚠️ Google API libraries not available. Install with: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
 
 from ..utils.config import Config
+from ..utils.executors import get_executor_manager
 
 
 class YouTubeShortsManager:
@@ -39,6 +40,7 @@ class YouTubeShortsManager:
         """Initialize YouTube Shorts manager"""
         self.config = config
         self.youtube_config = config.get_platform_config('youtube')
+        self.executors = get_executor_manager(config)
         
         self.youtube_service = None
         self.credentials = None
@@ -250,7 +252,7 @@ class YouTubeShortsManager:
             
             while response is None and retry < max_retries:
                 try:
-                    status, response = insert_request.next_chunk()
+                    status, response = await self.executors.run_in_thread('upload', insert_request.next_chunk)
                     if response is not None:
                         if 'id' in response:
                             logger.info(f"📹 Video uploaded successfully: {response['id']}")
@@ -0,0 +1,68 @@
+"""
+Persistent on-disk cache for expensive pipeline results
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import diskcache
+from loguru import logger
+
+
+class DiskCache:
+    """Namespaced diskcache store with TTL expiry and a least-recently-used size cap
+
+    Each namespace is its own diskcache directory, so transcripts, LLM
+    responses and scene indexes are capped independently. Expiry and
+    eviction are handled by diskcache's SQLite index rather than by scanning
+    entry files.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], namespace: str,
+                 ttl_hours: float = 168, max_size_mb: float = 500):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Root cache directory
+            namespace: Subdirectory for this kind of entry
+            ttl_hours: Entries older than this are treated as missing (0 disables expiry)
+            max_size_mb: Total size cap for the namespace (0 disables the cap)
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_hours * 3600 or None
+        self.cache = diskcache.Cache(
+            str(Path(cache_dir) / namespace),
+            size_limit=int(max_size_mb * 1024 * 1024) or 2 ** 62,
+            eviction_policy='least-recently-used'
+        )
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable cache key from arbitrary parts"""
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(str(part).encode('utf-8'))
+            hasher.update(b'\0')
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None when missing or expired"""
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read {self.namespace} cache entry: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> bool:
+        """Store a value"""
+        try:
+            return self.cache.set(key, value, expire=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write {self.namespace} cache entry: {e}")
+            return False
+
+    def clear(self) -> int:
+        """Remove every entry in this namespace"""
+        return self.cache.clear()
@@ -179,6 +179,10 @@ class Config:
         if not ai_config.get('llm', {}).get('model'):
             issues.append("LLM model not configured")
         
+        parallel_config = ai_config.get('whisper', {}).get('parallel') or {}
+        if parallel_config.get('window_seconds', 300) <= parallel_config.get('search_seconds', 15):
+            issues.append("Parallel transcription window_seconds must exceed search_seconds")
+        
         # Check video settings
         video_config = self.get_video_config()
         if not video_config.get('resolution'):
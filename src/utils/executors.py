@@ -0,0 +1,190 @@
+"""
+Managed executor pools for running blocking work off the asyncio event loop
+"""
+
+import asyncio
+import atexit
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .config import Config
+
+
+class ExecutorManager:
+    """Keeps one thread pool or process pool per workload class
+
+    Workload classes are separated so that a long Whisper run cannot starve
+    uploads, and uploads to different platforms can overlap.
+    """
+
+    # Default worker counts per workload class
+    DEFAULT_THREAD_WORKERS = {
+        'transcribe': 1,  # One shared Whisper model per process
+        'llm': 1,         # Resized to one thread per loaded GPT4All instance
+        'upload': 4,      # Network bound platform uploads
+        'render': 2,      # MoviePy encodes
+        'io': 4,          # Downloads and ffmpeg extraction
+    }
+
+    def __init__(self, config: Optional[Config] = None):
+        """Initialize executor manager with configuration"""
+        self.thread_workers = self._thread_workers(config)
+
+        self._pools: Dict[Tuple[str, str], Executor] = {}
+        # Creation arguments of each process pool, to notice when a caller's config changes
+        self._pool_args: Dict[Tuple[str, str], tuple] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _thread_workers(cls, config: Optional[Config]) -> Dict[str, int]:
+        executor_config = config.get("app.executors", {}) if config else {}
+        executor_config = executor_config or {}
+        return {**cls.DEFAULT_THREAD_WORKERS, **(executor_config.get("threads") or {})}
+
+    def configure(self, config: Config):
+        """
+        Apply a new configuration
+
+        Thread pools whose worker count changed are replaced; work already
+        submitted to them still completes.
+        """
+        thread_workers = self._thread_workers(config)
+        with self._lock:
+            changed = {workload for workload in set(thread_workers) | set(self.thread_workers)
+                       if thread_workers.get(workload) != self.thread_workers.get(workload)}
+            self.thread_workers = thread_workers
+            stale = [self._pools.pop(('thread', workload)) for workload in changed
+                     if ('thread', workload) in self._pools]
+
+        for pool in stale:
+            pool.shutdown(wait=False)
+        if stale:
+            logger.debug(f"🔄 Replacing {len(stale)} thread pool(s) after a configuration change")
+
+    def thread_pool(self, workload: str, max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+        """
+        Get (creating on first use) the thread pool for a workload class
+
+        Args:
+            workload: Workload class name
+            max_workers: Overrides the configured worker count when the pool is created
+        """
+        key = ('thread', workload)
+        with self._lock:
+            if key not in self._pools:
+                workers = max(1, int(max_workers or self.thread_workers.get(workload, 2)))
+                self._pools[key] = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"clippy-{workload}"
+                )
+                logger.debug(f"🧵 Started '{workload}' thread pool with {workers} workers")
+            return self._pools[key]
+
+    def process_pool(self, workload: str, max_workers: int = 1,
+                     initializer: Optional[Callable] = None, initargs: tuple = ()) -> ProcessPoolExecutor:
+        """
+        Get (creating on first use) the process pool for a workload class
+
+        Workers are spawned rather than forked: by the time a pool starts, the
+        parent already runs executor threads and may hold torch state, which
+        a forked child would inherit mid-operation.
+
+        A request with different arguments than the running pool was created
+        with replaces it; work already submitted to the old pool still completes.
+
+        Args:
+            workload: Workload class name
+            max_workers: Worker processes when the pool is created
+            initializer: Per-process setup function, e.g. loading a model
+            initargs: Arguments for the initializer
+        """
+        key = ('process', workload)
+        workers = max(1, int(max_workers))
+        args = (workers, initializer, initargs)
+        stale = None
+        with self._lock:
+            if key in self._pools and self._pool_args[key] != args:
+                stale = self._pools.pop(key)
+            if key not in self._pools:
+                self._pools[key] = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=initializer,
+                    initargs=initargs
+                )
+                self._pool_args[key] = args
+                logger.debug(f"⚙️ Started '{workload}' process pool with {workers} workers")
+            pool = self._pools[key]
+
+        if stale:
+            stale.shutdown(wait=False)
+        return pool
+
+    async def run_in_thread(self, workload: str, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call in the workload's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.thread_pool(workload),
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown_pool(self, kind: str, workload: str, wait: bool = True,
+                      pool: Optional[Executor] = None) -> bool:
+        """
+        Shut down one pool; the next request for it starts a fresh one
+
+        Args:
+            kind: 'thread' or 'process'
+            workload: Workload class name
+            pool: Only shut down this pool, leaving a replacement started since alone
+
+        Returns:
+            True if a pool was shut down
+        """
+        with self._lock:
+            current = self._pools.get((kind, workload))
+            if pool is None or pool is current:
+                self._pools.pop((kind, workload), None)
+                pool = current
+
+        if pool is None:
+            return False
+        pool.shutdown(wait=wait)
+        logger.debug(f"⏹️ Stopped '{workload}' {kind} pool")
+        return True
+
+    def shutdown(self, wait: bool = True):
+        """Shut down every pool"""
+        with self._lock:
+            pools = list(self._pools.items())
+            self._pools.clear()
+
+        for (kind, workload), pool in pools:
+            pool.shutdown(wait=wait)
+            logger.debug(f"⏹️ Stopped '{workload}' {kind} pool")
+
+
+_executor_manager: Optional[ExecutorManager] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor_manager(config: Optional[Config] = None) -> ExecutorManager:
+    """Get the process-wide executor manager, creating it from config on first call
+
+    A later call with a config applies it, so components rebuilt with new
+    settings (e.g. by the GUI) get pools sized for them.
+    """
+    global _executor_manager
+    with _executor_lock:
+        if _executor_manager is None:
+            _executor_manager = ExecutorManager(config)
+            # Entry points shut down explicitly; this covers any other exit path
+            atexit.register(_executor_manager.shutdown)
+        elif config is not None:
+            _executor_manager.configure(config)
+        return _executor_manager
@@ -0,0 +1,125 @@
+"""
+Sorted-array index over timestamped spans
+"""
+
+import itertools
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+
+
+class IntervalIndex:
+    """Spans keyed by caller-chosen keys, kept ordered by start and by end
+
+    Stab, overlap and proximity queries are binary searches plus a scan of
+    the candidates found. Stab and overlap queries look back from the query
+    by the longest span indexed, which keeps them logarithmic for the
+    bounded-length segments and clips this pipeline deals with. Spans are
+    half-open: [start, end).
+    """
+
+    def __init__(self):
+        self._spans: Dict[Hashable, Tuple[float, float, int]] = {}
+        self._by_start: List[Tuple[float, int, Hashable]] = []
+        self._by_end: List[Tuple[float, int, Hashable]] = []
+        # Insertion sequence breaks ties, so equal times keep insertion order
+        self._sequence = itertools.count()
+        self._max_length = 0.0
+
+    @staticmethod
+    def _time(entry: Tuple[float, int, Hashable]) -> float:
+        return entry[0]
+
+    @staticmethod
+    def _position(entry: Tuple[float, int, Hashable]) -> Tuple[float, int]:
+        return entry[:2]
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[Tuple[Hashable, float, float]]) -> "IntervalIndex":
+        """Build an index from (key, start, end) triples with unique keys, sorting once"""
+        index = cls()
+        for key, start, end in spans:
+            sequence = next(index._sequence)
+            index._spans[key] = (start, end, sequence)
+            index._by_start.append((start, sequence, key))
+            index._by_end.append((end, sequence, key))
+            index._max_length = max(index._max_length, end - start)
+        index._by_start.sort(key=cls._position)
+        index._by_end.sort(key=cls._position)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._spans
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Keys in start order"""
+        return (key for _, _, key in self._by_start)
+
+    def span(self, key: Hashable) -> Tuple[float, float]:
+        """Start and end of a key's span"""
+        start, end, _ = self._spans[key]
+        return start, end
+
+    def add(self, key: Hashable, start: float, end: float):
+        """Index a span, replacing any span already stored under key"""
+        self.discard(key)
+        sequence = next(self._sequence)
+        self._spans[key] = (start, end, sequence)
+        insort(self._by_start, (start, sequence, key), key=self._position)
+        insort(self._by_end, (end, sequence, key), key=self._position)
+        self._max_length = max(self._max_length, end - start)
+
+    def discard(self, key: Hashable):
+        """Remove a key's span if present"""
+        if key not in self._spans:
+            return
+        start, end, sequence = self._spans.pop(key)
+        del self._by_start[bisect_left(self._by_start, (start, sequence), key=self._position)]
+        del self._by_end[bisect_left(self._by_end, (end, sequence), key=self._position)]
+
+    def _keys(self, entries: List[Tuple[float, int, Hashable]], first: int, last: int) -> List[Hashable]:
+        return [key for _, _, key in entries[first:last]]
+
+    def stab(self, t: float) -> List[Hashable]:
+        """Keys whose span contains t, in start order"""
+        first = bisect_left(self._by_start, t - self._max_length, key=self._time)
+        last = bisect_right(self._by_start, t, key=self._time)
+        return [key for key in self._keys(self._by_start, first, last) if self._spans[key][1] > t]
+
+    def overlapping(self, start: float, end: float) -> List[Hashable]:
+        """Keys whose span shares any time with [start, end), in start order"""
+        first = bisect_left(self._by_start, start - self._max_length, key=self._time)
+        last = bisect_left(self._by_start, end, key=self._time)
+        return [key for key in self._keys(self._by_start, first, last) if self._spans[key][1] > start]
+
+    def near(self, start: float, end: float, tolerance: float) -> List[Hashable]:
+        """
+        Keys whose start is within tolerance of start or whose end is within
+        tolerance of end (strictly), in start order
+        """
+        first = bisect_right(self._by_start, start - tolerance, key=self._time)
+        last = bisect_left(self._by_start, start + tolerance, key=self._time)
+        keys = set(self._keys(self._by_start, first, last))
+
+        first = bisect_right(self._by_end, end - tolerance, key=self._time)
+        last = bisect_left(self._by_end, end + tolerance, key=self._time)
+        keys.update(self._keys(self._by_end, first, last))
+
+        return sorted(keys, key=lambda key: (self._spans[key][0], self._spans[key][2]))
+
+    def count_ending_by(self, t: float) -> int:
+        """Number of spans with end <= t"""
+        return bisect_right(self._by_end, t, key=self._time)
+
+    def merged(self, gap: float = 0.0) -> List[Tuple[float, float]]:
+        """Union of all spans, joining spans separated by at most gap"""
+        merged: List[Tuple[float, float]] = []
+        for key in self:
+            start, end, _ = self._spans[key]
+            if merged and start <= merged[-1][1] + gap:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
@@ -0,0 +1,171 @@
+"""
+Process-wide registry of lazily loaded models shared between components
+"""
+
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from .config import Config
+
+
+def _rss_mb() -> float:
+    """Resident memory of this process in MB, or 0 if psutil is missing"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return 0.0
+
+
+class _Entry:
+    """A loaded model with its bookkeeping"""
+
+    def __init__(self, model: Any, load_seconds: float, memory_mb: float,
+                 release: Optional[Callable[[Any], None]] = None):
+        self.model = model
+        self.release = release
+        self.load_seconds = load_seconds
+        self.memory_mb = memory_mb
+        self.last_used = time.monotonic()
+        self.in_use = 0
+
+
+class ModelRegistry:
+    """Loads models on first use, shares them by key and unloads idle ones
+
+    Callers borrow a model with ``lease`` so that an idle sweep never unloads a
+    model that is still running.
+    """
+
+    def __init__(self, idle_unload_minutes: float = 0):
+        """
+        Initialize registry
+
+        Args:
+            idle_unload_minutes: Unload models unused for this long; 0 keeps them loaded
+        """
+        self.idle_timeout = idle_unload_minutes * 60
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        # One lock per key so two callers never load the same model twice
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    def _load(self, key: str, loader: Callable[[], Any],
+              release: Optional[Callable[[Any], None]] = None) -> _Entry:
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry:
+                return entry
+
+            memory_before = _rss_mb()
+            load_start = time.perf_counter()
+            model = loader()
+            entry = _Entry(model, time.perf_counter() - load_start, max(0.0, _rss_mb() - memory_before), release)
+
+            with self._lock:
+                self._entries[key] = entry
+            logger.info(f"📦 Loaded model '{key}' in {entry.load_seconds:.1f}s (+{entry.memory_mb:.0f} MB)")
+
+            self._start_reaper()
+            return entry
+
+    @contextmanager
+    def lease(self, key: str, loader: Callable[[], Any], release: Optional[Callable[[Any], None]] = None):
+        """
+        Borrow a model, loading it first if needed
+
+        Args:
+            key: Identity of the model, e.g. backend and model size
+            loader: Called without arguments to load the model on a miss
+            release: Called with the model when it is unloaded, for models
+                that hold resources garbage collection does not free (e.g.
+                worker processes)
+        """
+        entry = self._load(key, loader, release)
+        with self._lock:
+            entry.in_use += 1
+        try:
+            yield entry.model
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def unload(self, key: str) -> bool:
+        """Drop a model that is not in use; returns True if it was unloaded"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or entry.in_use:
+                return False
+            del self._entries[key]
+
+        if entry.release:
+            entry.release(entry.model)
+        del entry
+        gc.collect()
+        logger.info(f"📤 Unloaded idle model '{key}'")
+        return True
+
+    def unload_idle(self) -> int:
+        """Unload every model idle for longer than the timeout; returns how many"""
+        if not self.idle_timeout:
+            return 0
+
+        now = time.monotonic()
+        with self._lock:
+            idle = [key for key, entry in self._entries.items()
+                    if not entry.in_use and now - entry.last_used > self.idle_timeout]
+
+        return sum(1 for key in idle if self.unload(key))
+
+    def configure(self, idle_unload_minutes: float):
+        """Change the idle timeout; models already loaded follow the new value"""
+        self.idle_timeout = idle_unload_minutes * 60
+        with self._lock:
+            loaded = bool(self._entries)
+        if loaded:
+            self._start_reaper()
+
+    def _start_reaper(self):
+        """Start the background idle sweep on first load; it runs for the registry's lifetime"""
+        with self._lock:
+            if not self.idle_timeout or self._reaper:
+                return
+            self._reaper = threading.Thread(target=self._sweep, name="clippy-model-reaper", daemon=True)
+            self._reaper.start()
+
+    def _sweep(self):
+        while True:
+            # Read on every pass so a reconfigured timeout takes effect
+            time.sleep(min(60.0, self.idle_timeout / 2 or 60.0))
+            self.unload_idle()
+
+
+_model_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry(config: Optional[Config] = None) -> ModelRegistry:
+    """Get the process-wide model registry, creating it from config on first call
+
+    A later call with a config applies its idle timeout. Models themselves are
+    keyed by their settings, so a changed model config loads a new model.
+    """
+    global _model_registry
+    with _registry_lock:
+        idle_minutes = (config.get("ai.models.idle_unload_minutes", 0) or 0) if config else 0
+        if _model_registry is None:
+            _model_registry = ModelRegistry(idle_minutes)
+        elif config is not None:
+            _model_registry.configure(idle_minutes)
+        return _model_registry
@@ -0,0 +1,82 @@
+"""
+Tests for in-memory PCM extraction
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from src.core.audio import SAMPLE_RATE, extract_pcm, hash_pcm
+
+
+def fake_ffmpeg(tmp_path, samples, exit_code=0):
+    """Executable that writes the given int16 samples as s16le in odd-sized pieces, then exits"""
+    raw = tmp_path / "samples.raw"
+    np.asarray(samples, dtype=np.int16).tofile(raw)
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"data = open({str(raw)!r}, 'rb').read()\n"
+        "for i in range(0, len(data), 100001):\n"
+        "    sys.stdout.buffer.write(data[i:i + 100001])\n"
+        "sys.stdout.flush()\n"
+        "sys.stderr.write('decode error\\n')\n"
+        f"sys.exit({exit_code})\n"
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def ramp(count):
+    return (np.arange(count) % 65536 - 32768).astype(np.int16)
+
+
+def test_decodes_samples_to_float(tmp_path):
+    samples = ramp(50_000)
+    audio = extract_pcm('in.mp4', fake_ffmpeg(tmp_path, samples), duration_hint=10)
+
+    assert audio.dtype == np.float32
+    np.testing.assert_array_equal(audio, samples / 32768.0)
+
+
+def test_grows_past_a_short_hint(tmp_path):
+    samples = ramp(SAMPLE_RATE * 20)
+    audio = extract_pcm('in.mp4', fake_ffmpeg(tmp_path, samples), duration_hint=1)
+
+    assert len(audio) == len(samples)
+    assert not isinstance(audio, np.memmap)
+    np.testing.assert_array_equal(audio, samples / 32768.0)
+
+
+def test_memmap_buffer_stays_memmap_when_grown(tmp_path):
+    samples = ramp(SAMPLE_RATE * 20)
+    audio = extract_pcm('in.mp4', fake_ffmpeg(tmp_path, samples), duration_hint=1,
+                        memmap_dir=tmp_path, memmap_min_seconds=1)
+
+    assert isinstance(audio, np.memmap)
+    np.testing.assert_array_equal(audio, samples / 32768.0)
+
+
+def test_growing_past_the_memmap_threshold_moves_to_disk(tmp_path):
+    samples = ramp(SAMPLE_RATE * 20)
+    audio = extract_pcm('in.mp4', fake_ffmpeg(tmp_path, samples), duration_hint=1,
+                        memmap_dir=tmp_path, memmap_min_seconds=10)
+
+    assert isinstance(audio, np.memmap)
+    assert len(audio) == len(samples)
+
+
+def test_failed_decode_raises(tmp_path):
+    with pytest.raises(RuntimeError, match="decode error"):
+        extract_pcm('in.mp4', fake_ffmpeg(tmp_path, ramp(1000), exit_code=1))
+
+
+def test_hash_depends_on_samples_not_storage(tmp_path):
+    audio = np.linspace(-1, 1, 3_000_000, dtype=np.float32)
+    mapped = np.memmap(tmp_path / "audio.f32", dtype=np.float32, mode='w+', shape=audio.shape)
+    mapped[:] = audio
+
+    assert hash_pcm(audio) == hash_pcm(mapped)
+    assert hash_pcm(audio) != hash_pcm(audio[:-1])
@@ -0,0 +1,88 @@
+"""
+Tests for per-segment audio features
+"""
+
+import numpy as np
+import pytest
+
+from src.core.audio_features import SAMPLE_RATE, segment_audio_features
+
+
+def tone(seconds, amplitude, frequency=220.0):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def segments(count, length=2.0):
+    return [{'start': i * length, 'end': (i + 1) * length} for i in range(count)]
+
+
+def test_matches_per_segment_computation():
+    audio = np.random.default_rng(0).normal(0, 0.1, SAMPLE_RATE * 6).astype(np.float32)
+    spans = [{'start': 0.0, 'end': 1.5}, {'start': 1.5, 'end': 4.0}, {'start': 4.0, 'end': 6.0}]
+
+    features = segment_audio_features(audio, spans)
+
+    frames = audio.reshape(-1, 400)
+    for i, span in enumerate(spans):
+        window = frames[int(span['start'] / 0.025):int(span['end'] / 0.025)]
+        expected = 10 * np.log10(np.mean(window * window) + 1e-10)
+        assert features['rms_db'][i] == pytest.approx(expected, abs=1e-3)
+
+
+def test_loud_segment_scores_highest():
+    audio = np.concatenate([tone(2, 0.05), tone(2, 0.05), tone(2, 0.5), tone(2, 0.05)])
+
+    features = segment_audio_features(audio, segments(4))
+
+    assert np.argmax(features['loudness_score']) == 2
+    assert features['loudness'][2] == pytest.approx(20, abs=0.5)
+    assert features['loudness_score'][[0, 1, 3]].tolist() == [0, 0, 0]
+
+
+def test_bursts_are_counted_against_the_median_level():
+    audio = np.concatenate([tone(2, 0.02), tone(2, 0.02), tone(1, 0.02), tone(1, 0.5)])
+
+    features = segment_audio_features(audio, segments(3))
+
+    assert features['burst_ratio'].tolist() == pytest.approx([0, 0, 0.5], abs=0.02)
+    assert np.argmax(features['burst_score']) == 2
+
+
+def test_varied_intonation_raises_pitch_variance():
+    # Silence keeps the median level low, so both tones count as voiced
+    silence = np.zeros(4 * SAMPLE_RATE, dtype=np.float32)
+    varied = np.concatenate([tone(0.5, 0.3, frequency) for frequency in (150, 400, 200, 600)])
+    audio = np.concatenate([silence, tone(2, 0.3, 200), varied, silence])
+
+    features = segment_audio_features(audio, segments(6))
+
+    assert features['pitch_variance'][3] > 100 * features['pitch_variance'][2]
+    assert np.argmax(features['pitch_score']) == 3
+
+
+def test_equal_loudness_with_rounding_noise_scores_zero():
+    # Same level at different frequencies differs only by float rounding
+    audio = np.concatenate([tone(2, 0.3, frequency) for frequency in (200, 310, 200)])
+
+    assert not segment_audio_features(audio, segments(3))['loudness_score'].any()
+
+
+def test_uniform_audio_scores_zero():
+    features = segment_audio_features(tone(6, 0.2), segments(3))
+
+    for name in ('loudness_score', 'pitch_score', 'burst_score'):
+        assert not features[name].any()
+
+
+def test_empty_inputs():
+    assert segment_audio_features(tone(2, 0.2), [])['loudness'].shape == (0,)
+
+    features = segment_audio_features(np.zeros(10, dtype=np.float32), segments(2))
+    assert features['loudness_score'].tolist() == [0, 0]
+
+
+def test_segments_past_the_audio_are_clamped():
+    features = segment_audio_features(tone(2, 0.2), [{'start': 1.0, 'end': 5.0}, {'start': 7.0, 'end': 8.0}])
+
+    assert np.isfinite(features['rms_db']).all()
@@ -0,0 +1,89 @@
+"""
+Tests for the staged batch pipeline
+"""
+
+import asyncio
+
+from src.core.batch_pipeline import BatchPipeline
+
+
+def stage(log, name, delay=0.0, fail_on=None, stop_on=None):
+    async def handler(job):
+        await asyncio.sleep(delay)
+        if job['source'] == fail_on:
+            raise RuntimeError("boom")
+        log.append((name, job['source']))
+        return job['source'] != stop_on
+    return handler
+
+
+def make_jobs(count):
+    return [{'source': f"video{i}"} for i in range(count)]
+
+
+class TestBatchPipeline:
+    def test_returns_jobs_in_input_order(self):
+        log = []
+
+        async def slow_first(job):
+            # Earlier jobs take longer so they finish after later ones
+            await asyncio.sleep(0.05 if job['source'] == 'video0' else 0.0)
+            return True
+
+        jobs = make_jobs(4)
+        pipeline = BatchPipeline([('download', slow_first, 4), ('render', stage(log, 'render'), 4)],
+                                 max_in_flight=4)
+        result = asyncio.run(pipeline.run(jobs))
+
+        assert result is jobs
+        assert [job['source'] for job in result] == [f"video{i}" for i in range(4)]
+        assert all(job['completed'] for job in result)
+        assert log[-1] == ('render', 'video0')
+
+    def test_jobs_in_flight_are_bounded(self):
+        active = 0
+        peak = 0
+
+        async def tracked(job):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            return True
+
+        async def release(job):
+            nonlocal active
+            active -= 1
+            return True
+
+        pipeline = BatchPipeline([('download', tracked, 8), ('render', release, 8)],
+                                 queue_size=8, max_in_flight=2)
+        asyncio.run(pipeline.run(make_jobs(6)))
+
+        assert peak == 2
+
+    def test_failure_stops_only_the_failing_job(self):
+        log = []
+        pipeline = BatchPipeline([
+            ('download', stage(log, 'download', fail_on='video1'), 2),
+            ('render', stage(log, 'render'), 1),
+        ])
+        jobs = asyncio.run(pipeline.run(make_jobs(3)))
+
+        assert jobs[1]['failed_stage'] == 'download'
+        assert jobs[1]['completed'] is False
+        assert ('render', 'video1') not in log
+        assert [job['completed'] for job in (jobs[0], jobs[2])] == [True, True]
+
+    def test_stage_can_finish_a_job_early(self):
+        log = []
+        pipeline = BatchPipeline([
+            ('download', stage(log, 'download', stop_on='video0'), 1),
+            ('render', stage(log, 'render'), 1),
+        ])
+        jobs = asyncio.run(pipeline.run(make_jobs(2)))
+
+        assert jobs[0]['completed'] is False
+        assert 'failed_stage' not in jobs[0]
+        assert log.count(('render', 'video0')) == 0
+        assert jobs[1]['completed'] is True
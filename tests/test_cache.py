@@ -0,0 +1,43 @@
+"""
+Tests for the namespaced disk cache
+"""
+
+import time
+
+from src.utils.cache import DiskCache
+
+
+class TestDiskCache:
+    def test_round_trip_and_miss(self, tmp_path):
+        cache = DiskCache(tmp_path, "transcripts")
+
+        assert cache.get("missing") is None
+        assert cache.set("key", {"segments": [1, 2, 3]})
+        assert cache.get("key") == {"segments": [1, 2, 3]}
+
+    def test_namespaces_are_separate(self, tmp_path):
+        DiskCache(tmp_path, "a").set("key", 1)
+
+        assert DiskCache(tmp_path, "b").get("key") is None
+        assert DiskCache(tmp_path, "a").get("key") == 1
+
+    def test_entries_expire(self, tmp_path):
+        cache = DiskCache(tmp_path, "llm", ttl_hours=0.1 / 3600)
+        cache.set("key", "value")
+
+        time.sleep(0.2)
+
+        assert cache.get("key") is None
+
+    def test_clear(self, tmp_path):
+        cache = DiskCache(tmp_path, "scenes")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+
+    def test_make_key_is_stable_and_order_sensitive(self):
+        assert DiskCache.make_key("a", 1) == DiskCache.make_key("a", 1)
+        assert DiskCache.make_key("a", 1) != DiskCache.make_key(1, "a")
+        assert DiskCache.make_key("ab", "c") != DiskCache.make_key("a", "bc")
@@ -0,0 +1,52 @@
+"""
+Tests for ASS caption track building
+"""
+
+from src.core.captions import CaptionTrackBuilder, format_ass_time, subtitles_filter, to_ass_color
+
+
+def dialogue(document):
+    return [line.split(',', 9) for line in document.splitlines() if line.startswith('Dialogue: 0,')]
+
+
+def words(*spans):
+    return [{'word': word, 'start': start, 'end': end} for word, start, end in spans]
+
+
+def test_color_conversion():
+    assert to_ass_color('#FF8000') == '&H000080FF'
+    assert to_ass_color('yellow') == '&H0000FFFF'
+    assert to_ass_color('bogus', '000000') == '&H00000000'
+
+
+def test_time_format():
+    assert format_ass_time(3725.456) == '1:02:05.46'
+
+
+def test_only_the_spoken_word_is_highlighted():
+    builder = CaptionTrackBuilder({'highlight_color': '#FFFF00'}, (1080, 1920))
+    events = dialogue(builder.build(words(('one', 0.0, 0.4), ('two', 0.6, 1.0)), duration=5))
+
+    assert [(event[1], event[2], event[9]) for event in events] == [
+        ('0:00:00.00', '0:00:00.40', '{\\1c&H00FFFF&}one{\\r} two'),
+        ('0:00:00.40', '0:00:00.60', 'one two'),
+        ('0:00:00.60', '0:00:01.00', 'one {\\1c&H00FFFF&}two{\\r}'),
+        ('0:00:01.00', '0:00:02.00', 'one two'),
+    ]
+
+
+def test_plain_lines_without_highlighting():
+    builder = CaptionTrackBuilder({'keyword_highlighting': False}, (1080, 1920))
+    events = dialogue(builder.build(words(('one', 0.0, 0.4), ('two', 0.6, 1.0)), duration=5))
+    assert [(event[1], event[2], event[9]) for event in events] == [('0:00:00.00', '0:00:02.00', 'one two')]
+
+
+def test_long_pause_starts_new_line():
+    builder = CaptionTrackBuilder({'keyword_highlighting': False}, (1080, 1920))
+    events = dialogue(builder.build(words(('one', 0.0, 0.4), ('two', 3.0, 3.4)), duration=5))
+    assert [event[9] for event in events] == ['one', 'two']
+    assert events[0][2] == '0:00:01.40'
+
+
+def test_subtitles_filter_escapes_quotes_and_colons():
+    assert subtitles_filter("C:\\clips\\it's: here.ass") == r"subtitles=filename=C\\:/clips/it\\\'s\\: here.ass"
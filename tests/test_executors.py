@@ -0,0 +1,80 @@
+"""
+Tests for managed executor pools
+"""
+
+import asyncio
+import os
+
+import yaml
+
+from src.utils import executors
+from src.utils.config import Config
+from src.utils.executors import ExecutorManager
+
+
+class TestExecutorManager:
+    def test_process_pool_spawns_workers(self):
+        manager = ExecutorManager()
+        try:
+            pool = manager.process_pool('test', max_workers=1)
+            assert pool._mp_context.get_start_method() == 'spawn'
+            assert pool.submit(os.getpid).result(timeout=60) != os.getpid()
+        finally:
+            manager.shutdown()
+
+    def test_shutdown_releases_pools(self):
+        manager = ExecutorManager()
+        first = manager.thread_pool('io')
+
+        manager.shutdown()
+
+        assert manager._pools == {}
+        assert manager.thread_pool('io') is not first
+        manager.shutdown()
+
+    def test_run_in_thread(self):
+        manager = ExecutorManager()
+        try:
+            assert asyncio.run(manager.run_in_thread('io', sum, [1, 2, 3])) == 6
+        finally:
+            manager.shutdown()
+
+    def test_configure_replaces_only_resized_thread_pools(self, tmp_path):
+        manager = ExecutorManager()
+        io_pool, upload_pool = manager.thread_pool('io'), manager.thread_pool('upload')
+
+        manager.configure(make_config(tmp_path, io=8))
+
+        assert manager.thread_pool('io') is not io_pool
+        assert manager.thread_pool('io')._max_workers == 8
+        assert manager.thread_pool('upload') is upload_pool
+        manager.shutdown()
+
+    def test_process_pool_rebuilt_when_arguments_change(self):
+        manager = ExecutorManager()
+        first = manager.process_pool('test', max_workers=1, initargs=({'model': 'base'},))
+
+        assert manager.process_pool('test', max_workers=1, initargs=({'model': 'base'},)) is first
+        second = manager.process_pool('test', max_workers=1, initargs=({'model': 'small'},))
+        assert second is not first
+
+        # Releasing the old pool leaves its replacement running
+        assert manager.shutdown_pool('process', 'test', pool=first)
+        assert manager.process_pool('test', max_workers=1, initargs=({'model': 'small'},)) is second
+        manager.shutdown()
+
+
+def make_config(tmp_path, **threads):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({'app': {'executors': {'threads': threads}}}))
+    return Config(str(path))
+
+
+def test_get_executor_manager_applies_later_configs(tmp_path, monkeypatch):
+    monkeypatch.setattr(executors, '_executor_manager', None)
+    monkeypatch.setattr(executors.atexit, 'register', lambda func: None)
+
+    manager = executors.get_executor_manager(make_config(tmp_path, render=1))
+    assert executors.get_executor_manager(make_config(tmp_path, render=3)) is manager
+    assert manager.thread_workers['render'] == 3
+    manager.shutdown()
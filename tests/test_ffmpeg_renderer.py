@@ -0,0 +1,122 @@
+"""
+Tests for ffmpeg filter graph text escaping and multi-clip commands
+"""
+
+import pytest
+import yaml
+
+from src.core.ffmpeg_renderer import FFmpegRenderer
+from src.utils.config import Config
+
+
+def get_token(buf, terminators):
+    """Python port of ffmpeg's av_get_token: returns (token, rest)"""
+    out, i = [], 0
+    while i < len(buf) and buf[i] not in terminators:
+        if buf[i] == '\\' and i + 1 < len(buf):
+            out.append(buf[i + 1])
+            i += 2
+        elif buf[i] == "'":
+            end = buf.index("'", i + 1)
+            out.append(buf[i + 1:end])
+            i = end + 1
+        else:
+            out.append(buf[i])
+            i += 1
+    return ''.join(out), buf[i:]
+
+
+def expand_text(text):
+    """drawtext's default expansion for text without %{...} sequences"""
+    out, i = [], 0
+    while i < len(text):
+        if text[i] == '\\' and i + 1 < len(text):
+            out.append(text[i + 1])
+            i += 2
+        else:
+            assert text[i] != '%', "unescaped % would start an expansion"
+            out.append(text[i])
+            i += 1
+    return ''.join(out)
+
+
+def parse_options(args):
+    """Split filter arguments into options the way the filter option parser does"""
+    options = {}
+    while args:
+        key, args = get_token(args, '=:')
+        value, args = get_token(args[1:], ':')
+        options[key] = value
+        args = args[1:]
+    return options
+
+
+class TestEscapeText:
+    @pytest.mark.parametrize("text", [
+        "Part 2: the reveal",
+        "at 12:30, then; later",
+        "it's 100% real",
+        "back\\slash [and] brackets",
+        "plain words",
+    ])
+    def test_round_trips_through_graph_option_and_text_parsing(self, text):
+        graph = f"drawtext=text={FFmpegRenderer._escape_text(text)}:fontsize=36,scale=2:2"
+
+        args, rest = get_token(graph[len("drawtext="):], '[],;')
+        options = parse_options(args)
+
+        assert rest == ",scale=2:2"
+        assert options['fontsize'] == '36'
+        assert expand_text(options['text']) == text
+
+    def test_option_value_keeps_colons_and_commas(self):
+        value = FFmpegRenderer._escape_option("C:/Fonts/My, Font")
+        args, _ = get_token(f"font={value}:x=1", '[],;')
+
+        assert parse_options(args) == {'font': "C:/Fonts/My, Font", 'x': '1'}
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({'video': {'resolution': '1080x1920', 'ffmpeg_max_decode_gap': 30}}))
+    return FFmpegRenderer(Config(str(path)))
+
+
+def clip(start, end, name):
+    return {'start_time': start, 'end_time': end, 'output_file': f"{name}.mp4"}
+
+
+class TestBatchRender:
+    def test_nearby_clips_share_a_pass(self, renderer):
+        clips = [clip(111, 130, 'c'), clip(0, 30, 'a'), clip(50, 80, 'b'), clip(20, 40, 'overlap')]
+        assert renderer.plan_passes(clips) == [[1, 3, 2], [0]]
+
+    def test_one_input_many_outputs(self, renderer):
+        clips = [clip(10, 40, 'a'), clip(45, 70, 'b')]
+        command = renderer.build_batch_command('source.mp4', clips, (1920, 1080))
+
+        assert command.count('-i') == 1
+        assert command[command.index('-ss') + 1] == '10.000'
+        assert command[command.index('-to') + 1] == '70.000'
+        assert [arg for arg in command if arg.endswith('.mp4')] == ['source.mp4', 'a.mp4', 'b.mp4']
+        maps = [command[i + 1] for i, arg in enumerate(command) if arg == '-map']
+        assert maps == ['[vout0]', '[aout0]', '[vout1]', '[aout1]']
+
+    def test_graph_trims_each_clip_relative_to_the_seek(self, renderer):
+        graph = renderer.build_batch_filter_graph((1920, 1080), 10, [clip(10, 40, 'a'), clip(45, 70, 'b')])
+        chains = graph.split(';')
+
+        assert chains[0] == '[0:v]split=2[v0][v1]'
+        assert chains[1] == '[0:a]asplit=2[a0][a1]'
+        assert chains[2].startswith('[v0]trim=start=0.000:end=30.000,setpts=PTS-STARTPTS,crop=')
+        assert chains[2].endswith('[vout0]')
+        assert chains[5] == '[a1]atrim=start=35.000:end=60.000,asetpts=PTS-STARTPTS[aout1]'
+
+    def test_silent_source_has_no_audio_chains(self, renderer):
+        clips = [clip(0, 30, 'a')]
+        graph = renderer.build_batch_filter_graph((1920, 1080), 0, clips, has_audio=False)
+        command = renderer.build_batch_command('source.mp4', clips, (1920, 1080), has_audio=False)
+
+        assert 'asplit' not in graph
+        assert '[aout0]' not in command
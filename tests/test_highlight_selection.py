@@ -0,0 +1,53 @@
+"""
+Tests for weighted-interval highlight selection
+"""
+
+from src.core.highlight_selection import select_highlights
+
+
+def clip(start, end, confidence):
+    return {'start_time': start, 'end_time': end, 'confidence': confidence}
+
+
+class TestSelectHighlights:
+    def test_nested_clip_is_not_selected_with_its_container(self):
+        outer = clip(0, 60, 0.9)
+        inner = clip(10, 20, 0.8)
+
+        assert select_highlights([outer, inner], 5) == [outer]
+
+    def test_overlap_limited_by_shorter_clip(self):
+        # 10s overlap is under half of the 60s clip but over half of the 15s one
+        long_clip = clip(0, 60, 0.9)
+        short_clip = clip(50, 65, 0.8)
+
+        assert select_highlights([long_clip, short_clip], 5) == [long_clip]
+
+    def test_prefers_better_combination_over_greedy_choice(self):
+        # Greedy would keep the 0.9 clip and lose both neighbours
+        middle = clip(10, 80, 0.9)
+        left = clip(0, 30, 0.7)
+        right = clip(50, 90, 0.7)
+
+        assert select_highlights([middle, left, right], 5) == [left, right]
+
+    def test_respects_max_count_and_orders_by_confidence(self):
+        clips = [clip(i * 100, i * 100 + 30, 0.4 + i * 0.1) for i in range(5)]
+
+        selected = select_highlights(clips, 3)
+
+        assert [h['confidence'] for h in selected] == [clips[4]['confidence'], clips[3]['confidence'],
+                                                       clips[2]['confidence']]
+
+    def test_drops_low_confidence_and_empty_clips(self):
+        assert select_highlights([clip(0, 30, 0.2), clip(40, 40, 0.9)], 5) == []
+
+    def test_full_overlap_allowance_never_repeats_a_clip(self):
+        only = clip(0, 30, 0.9)
+
+        assert select_highlights([only], 5, max_overlap=1.0) == [only]
+
+    def test_full_overlap_allowance_selects_identical_spans_once_each(self):
+        first, second = clip(0, 30, 0.9), clip(0, 30, 0.8)
+
+        assert select_highlights([first, second], 5, max_overlap=1.0) == [first, second]
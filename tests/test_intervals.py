@@ -0,0 +1,64 @@
+"""
+Tests for the sorted-array interval index
+"""
+
+import random
+
+from src.utils.intervals import IntervalIndex
+
+
+def random_spans(seed, count=60):
+    rng = random.Random(seed)
+    spans = []
+    for key in range(count):
+        start = round(rng.uniform(0, 100), 1)
+        spans.append((key, start, start + round(rng.uniform(0.1, 15), 1)))
+    return spans
+
+
+def test_queries_match_brute_force():
+    for seed in range(20):
+        spans = random_spans(seed)
+        index = IntervalIndex.from_spans(spans)
+        by_start = [key for key, _, _ in sorted(spans, key=lambda s: (s[1], s[0]))]
+        rng = random.Random(seed)
+
+        for _ in range(30):
+            t = rng.uniform(-5, 120)
+            a, b = sorted((rng.uniform(-5, 120), rng.uniform(-5, 120)))
+            tolerance = rng.uniform(0, 5)
+
+            assert index.stab(t) == [k for k in by_start if spans[k][1] <= t < spans[k][2]]
+            assert index.overlapping(a, b) == [k for k in by_start if spans[k][1] < b and spans[k][2] > a]
+            assert index.near(a, b, tolerance) == [
+                k for k in by_start
+                if abs(spans[k][1] - a) < tolerance or abs(spans[k][2] - b) < tolerance
+            ]
+            assert index.count_ending_by(t) == sum(1 for _, _, end in spans if end <= t)
+
+
+def test_add_replaces_and_discard_removes():
+    index = IntervalIndex()
+    index.add('a', 0, 10)
+    index.add('b', 5, 6)
+    index.add('a', 20, 30)
+
+    assert index.span('a') == (20, 30)
+    assert list(index) == ['b', 'a']
+    assert index.stab(7) == []
+
+    index.discard('b')
+    index.discard('missing')
+    assert len(index) == 1 and 'b' not in index
+    assert index.overlapping(0, 25) == ['a']
+
+
+def test_equal_starts_keep_insertion_order():
+    index = IntervalIndex.from_spans([('x', 1, 2), ('y', 1, 3), ('z', 1, 2)])
+    assert list(index) == ['x', 'y', 'z']
+
+
+def test_merged_joins_touching_and_close_spans():
+    index = IntervalIndex.from_spans([(0, 0, 2), (1, 2, 4), (2, 5, 6), (3, 1, 3), (4, 9, 10)])
+    assert index.merged() == [(0, 4), (5, 6), (9, 10)]
+    assert index.merged(gap=1) == [(0, 6), (9, 10)]
@@ -0,0 +1,163 @@
+"""
+Tests for LLM transcript chunking, model loading, response caching and quote matching
+"""
+
+import asyncio
+import json
+
+import pytest
+import yaml
+
+from src.ai import llm_analyzer
+from src.ai.llm_analyzer import LLMAnalyzer
+from src.utils.config import Config
+
+
+def make_config(tmp_path, storage=None, **llm):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({
+        'ai': {'llm': {'workers': 1, 'threads_per_worker': 1, **llm}},
+        'video': {'clip_duration_min': 20, 'clip_duration_max': 40},
+        'storage': storage or {'cache_analysis': False},
+    }))
+    return Config(str(path))
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(llm_analyzer, 'GPT4ALL_AVAILABLE', False)
+    return LLMAnalyzer(make_config(tmp_path, context_window=2048))
+
+
+def segments(texts, length=5.0):
+    return [{'start': i * length, 'end': (i + 1) * length, 'text': text} for i, text in enumerate(texts)]
+
+
+class TestChunking:
+    def test_chunks_fit_the_context_window(self, analyzer):
+        segs = segments([f"sentence number {i} with a few more words in it" for i in range(400)])
+        budget = analyzer._chunk_token_budget({})
+        prompt_tokens = analyzer._count_tokens(analyzer._create_analysis_prompt("", {}))
+
+        assert budget + prompt_tokens + 500 <= 2048
+        chunks = analyzer._split_transcript(' '.join(s['text'] for s in segs), segs)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert sum(analyzer._count_tokens(s['text']) + 1 for s in chunk['segments']) <= budget
+
+    def test_chunks_cover_every_segment_and_advance(self, analyzer):
+        segs = segments([f"words {i} " * 8 for i in range(300)])
+        chunks = analyzer._split_transcript('', segs)
+
+        starts = [chunk['segments'][0]['start'] for chunk in chunks]
+        assert starts == sorted(set(starts))
+        covered = {s['start'] for chunk in chunks for s in chunk['segments']}
+        assert covered == {s['start'] for s in segs}
+
+    def test_oversized_segment_gets_its_own_chunk(self, analyzer):
+        segs = segments(["short", "word " * 5000, "short again"])
+        chunks = analyzer._split_transcript('', segs)
+        assert [len(chunk['segments']) for chunk in chunks] == [1, 1, 1]
+
+
+def test_model_is_loaded_with_the_packing_context(tmp_path, monkeypatch):
+    loaded = []
+
+    class FakeGPT4All:
+        def __init__(self, **kwargs):
+            loaded.append(kwargs)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(llm_analyzer, 'GPT4ALL_AVAILABLE', True)
+    monkeypatch.setattr(llm_analyzer, 'GPT4All', FakeGPT4All, raising=False)
+    analyzer = LLMAnalyzer(make_config(tmp_path, context_window=8192))
+
+    assert analyzer.model is not None
+    assert loaded[0]['n_ctx'] == 8192
+
+
+class CountingPool:
+    def __init__(self):
+        self.prompts = []
+
+    async def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return f"response {len(self.prompts)}"
+
+
+class TestResponseCache:
+    def make_analyzer(self, tmp_path, monkeypatch, enabled=True, model='first.gguf'):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(llm_analyzer, 'GPT4ALL_AVAILABLE', False)
+        storage = {'cache_analysis': enabled, 'cache_path': str(tmp_path / "cache")}
+        analyzer = LLMAnalyzer(make_config(tmp_path, storage=storage, model=model))
+        analyzer.model_pool = CountingPool()
+        return analyzer
+
+    def test_identical_request_is_served_from_cache(self, tmp_path, monkeypatch):
+        analyzer = self.make_analyzer(tmp_path, monkeypatch)
+
+        first = asyncio.run(analyzer._generate("prompt", max_tokens=100, temp=0.7))
+        second = asyncio.run(analyzer._generate("prompt", max_tokens=100, temp=0.7))
+
+        assert first == second == "response 1"
+        assert analyzer.model_pool.prompts == ["prompt"]
+
+    def test_cache_survives_a_new_analyzer(self, tmp_path, monkeypatch):
+        asyncio.run(self.make_analyzer(tmp_path, monkeypatch)._generate("prompt", 100, 0.7))
+
+        analyzer = self.make_analyzer(tmp_path, monkeypatch)
+        assert asyncio.run(analyzer._generate("prompt", 100, 0.7)) == "response 1"
+        assert analyzer.model_pool.prompts == []
+
+    def test_sampling_settings_and_model_are_part_of_the_key(self, tmp_path, monkeypatch):
+        analyzer = self.make_analyzer(tmp_path, monkeypatch)
+        asyncio.run(analyzer._generate("prompt", 100, 0.7))
+        asyncio.run(analyzer._generate("prompt", 100, 0.8))
+        asyncio.run(analyzer._generate("prompt", 200, 0.7))
+        assert len(analyzer.model_pool.prompts) == 3
+
+        other = self.make_analyzer(tmp_path, monkeypatch, model='second.gguf')
+        asyncio.run(other._generate("prompt", 100, 0.7))
+        assert other.model_pool.prompts == ["prompt"]
+
+    def test_disabled_cache_always_generates(self, tmp_path, monkeypatch):
+        analyzer = self.make_analyzer(tmp_path, monkeypatch, enabled=False)
+        assert analyzer.response_cache is None
+
+        for _ in range(2):
+            asyncio.run(analyzer._generate("prompt", 100, 0.7))
+        assert len(analyzer.model_pool.prompts) == 2
+
+
+class TestQuoteMatching:
+    TEXTS = [
+        "so the thing is",
+        "you will not believe what happened next",
+        "and the dog ran off",
+        "then we went home",
+        "the end",
+    ]
+
+    def test_shared_common_word_does_not_match(self, analyzer):
+        matches = analyzer._find_matching_segments(["the dog ran off"], segments(self.TEXTS))
+        assert [m['text'] for m in matches] == ["and the dog ran off"]
+
+    def test_matches_are_deduped_in_time_order(self, analyzer):
+        quotes = ["then we went home", "you will not believe", "went home"]
+        matches = analyzer._find_matching_segments(quotes, segments(self.TEXTS))
+        assert [m['text'] for m in matches] == [self.TEXTS[1], self.TEXTS[3]]
+
+    def test_word_overlap_fallback(self, analyzer):
+        matches = analyzer._find_matching_segments(["dog went"], segments(self.TEXTS))
+        assert {m['text'] for m in matches} == {self.TEXTS[2], self.TEXTS[3]}
+
+    def test_long_spread_is_trimmed_from_the_first_quote(self, analyzer):
+        segs = segments([f"line {i}" for i in range(40)] + ["closing words"])
+        chunk = {'segments': segs, 'start_time': 0.0, 'end_time': segs[-1]['end']}
+        response = json.dumps({'highlights': [{'key_quotes': ["line 3", "closing words"]}]})
+
+        [highlight] = analyzer._parse_llm_response(response, chunk)
+        assert (highlight['start_time'], highlight['end_time']) == (15.0, 55.0)
+        assert highlight['text'] == "line 3"
@@ -0,0 +1,92 @@
+"""
+Tests for the offline LLM worker pool
+"""
+
+import asyncio
+import time
+
+from src.ai import llm_pool
+from src.ai.llm_pool import LLMWorkerPool, resolve_pool_size
+from src.utils.executors import ExecutorManager
+
+
+class FakeModel:
+    def __init__(self, n_threads):
+        self.n_threads = n_threads
+        self.active = 0
+
+    def generate(self, prompt, **kwargs):
+        self.active += 1
+        assert self.active == 1, "model instance shared between threads"
+        time.sleep(0.02)
+        self.active -= 1
+        return f"{prompt}:{id(self)}"
+
+
+class TestResolvePoolSize:
+    def test_auto_splits_cores_between_workers(self, monkeypatch):
+        monkeypatch.setattr(llm_pool.os, 'cpu_count', lambda: 16)
+        assert resolve_pool_size({}) == (4, 4)
+
+    def test_auto_keeps_one_worker_on_small_machines(self, monkeypatch):
+        monkeypatch.setattr(llm_pool.os, 'cpu_count', lambda: 2)
+        assert resolve_pool_size({}) == (1, 2)
+
+    def test_explicit_values_are_clamped(self):
+        assert resolve_pool_size({'workers': 0, 'threads_per_worker': 0}) == (1, 1)
+        assert resolve_pool_size({'workers': '3', 'threads_per_worker': 2}) == (3, 2)
+
+
+class TestLLMWorkerPool:
+    def test_load_passes_threads_and_sizes_executor(self):
+        executors = ExecutorManager()
+        try:
+            pool = LLMWorkerPool(FakeModel, executors, workers=3, threads_per_worker=2)
+            assert pool.load()
+            assert [model.n_threads for model in pool.models] == [2, 2, 2]
+            assert pool.primary is pool.models[0]
+            assert executors.thread_pool('llm')._max_workers == 3
+        finally:
+            executors.shutdown()
+
+    def test_keeps_models_loaded_before_a_failure(self):
+        loaded = []
+
+        def factory(n_threads):
+            if loaded:
+                raise RuntimeError("out of memory")
+            loaded.append(FakeModel(n_threads))
+            return loaded[-1]
+
+        executors = ExecutorManager()
+        try:
+            pool = LLMWorkerPool(factory, executors, workers=3)
+            assert pool.load()
+            assert pool.models == loaded
+        finally:
+            executors.shutdown()
+
+    def test_nothing_loaded(self):
+        def factory(n_threads):
+            raise RuntimeError("missing model file")
+
+        pool = LLMWorkerPool(factory, ExecutorManager(), workers=2)
+        assert not pool.load()
+        assert pool.primary is None
+
+    def test_concurrent_calls_use_separate_instances(self):
+        executors = ExecutorManager()
+        try:
+            pool = LLMWorkerPool(FakeModel, executors, workers=2)
+            pool.load()
+
+            async def generate_all():
+                return await asyncio.gather(*(pool.generate(f"p{i}") for i in range(6)))
+
+            results = asyncio.run(generate_all())
+
+            assert [result.split(':')[0] for result in results] == [f"p{i}" for i in range(6)]
+            assert {result.split(':')[1] for result in results} == {str(id(model)) for model in pool.models}
+            assert pool._idle.qsize() == 2
+        finally:
+            executors.shutdown()
@@ -0,0 +1,35 @@
+"""
+Tests for media probe helpers
+"""
+
+from src.core.media_probe import MediaProbe, _rotation
+
+
+def info(width, height, rotation=0):
+    return {'video': {'width': width, 'height': height, 'rotation': rotation}}
+
+
+class TestResolution:
+    def test_landscape_unrotated(self):
+        assert MediaProbe.resolution(info(1920, 1080)) == (1920, 1080)
+
+    def test_rotated_portrait_swaps_dimensions(self):
+        assert MediaProbe.resolution(info(1920, 1080, 90)) == (1080, 1920)
+        assert MediaProbe.resolution(info(1920, 1080, 270)) == (1080, 1920)
+        assert MediaProbe.resolution(info(1920, 1080, 180)) == (1920, 1080)
+
+    def test_missing_video(self):
+        assert MediaProbe.resolution({'video': None}) is None
+        assert MediaProbe.resolution(info(0, 0)) is None
+
+
+class TestRotation:
+    def test_display_matrix_side_data(self):
+        stream = {'side_data_list': [{'side_data_type': 'Display Matrix', 'rotation': -90}]}
+        assert _rotation(stream) == 90
+
+    def test_legacy_rotate_tag(self):
+        assert _rotation({'tags': {'rotate': '270'}}) == 270
+
+    def test_no_rotation(self):
+        assert _rotation({}) == 0
@@ -0,0 +1,72 @@
+"""
+Tests for the shared model registry
+"""
+
+import time
+
+import yaml
+
+from src.utils import model_registry
+from src.utils.config import Config
+from src.utils.model_registry import ModelRegistry
+
+
+class TestModelRegistry:
+    def test_loads_once_per_key(self):
+        registry = ModelRegistry()
+        loads = []
+
+        for _ in range(3):
+            with registry.lease("engine", lambda: loads.append(1) or object()):
+                pass
+
+        assert len(loads) == 1
+
+    def test_unload_calls_release_and_skips_models_in_use(self):
+        registry = ModelRegistry()
+        released = []
+
+        with registry.lease("pool", lambda: "workers", release=released.append):
+            assert not registry.unload("pool")
+
+        assert registry.unload("pool")
+        assert released == ["workers"]
+
+    def test_idle_models_are_reaped_after_registry_empties(self):
+        registry = ModelRegistry(idle_unload_minutes=0.1 / 60)
+
+        for key in ("first", "second"):
+            with registry.lease(key, object):
+                pass
+            deadline = time.monotonic() + 5
+            while key in registry._entries and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert key not in registry._entries
+
+        assert registry._reaper.is_alive()
+
+    def test_configure_enables_reaping_of_loaded_models(self):
+        registry = ModelRegistry()
+        with registry.lease("engine", object):
+            pass
+        assert registry._reaper is None
+
+        registry.configure(0.1 / 60)
+
+        deadline = time.monotonic() + 5
+        while "engine" in registry._entries and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert "engine" not in registry._entries
+
+
+def test_get_model_registry_applies_later_configs(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_registry, '_model_registry', None)
+
+    def config(minutes):
+        path = tmp_path / f"config_{minutes}.yaml"
+        path.write_text(yaml.safe_dump({'ai': {'models': {'idle_unload_minutes': minutes}}}))
+        return Config(str(path))
+
+    registry = model_registry.get_model_registry(config(0))
+    assert model_registry.get_model_registry(config(5)) is registry
+    assert registry.idle_timeout == 300
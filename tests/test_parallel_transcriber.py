@@ -0,0 +1,92 @@
+"""
+Tests for window planning, stitching and the worker pool in parallel transcription
+"""
+
+import numpy as np
+import pytest
+
+from src.core.parallel_transcriber import SAMPLE_RATE, ParallelTranscriber, plan_windows, stitch_windows
+from src.utils.executors import ExecutorManager
+from src.utils.model_registry import ModelRegistry
+
+
+def noise(seconds, seed=0):
+    return np.random.default_rng(seed).normal(0, 0.1, int(seconds * SAMPLE_RATE)).astype(np.float32)
+
+
+class TestPlanWindows:
+    def test_short_audio_is_one_window(self):
+        assert plan_windows(noise(10), window_seconds=300) == [(0.0, 10.0, 0.0, 10.0)]
+
+    def test_windows_cover_audio_with_increasing_cuts(self):
+        windows = plan_windows(noise(100), window_seconds=20, overlap_seconds=2, search_seconds=5)
+
+        keeps = [(keep_start, keep_end) for _, _, keep_start, keep_end in windows]
+        assert keeps[0][0] == 0.0 and keeps[-1][1] == 100.0
+        assert all(a[1] == b[0] for a, b in zip(keeps, keeps[1:]))
+        assert all(start < end for start, end in keeps)
+
+    def test_cut_prefers_silence(self):
+        audio = noise(40)
+        audio[int(22 * SAMPLE_RATE):int(23 * SAMPLE_RATE)] = 0
+
+        windows = plan_windows(audio, window_seconds=20, search_seconds=5)
+
+        assert 22.0 <= windows[0][3] <= 23.0
+
+    def test_window_barely_longer_than_search_terminates(self):
+        audio = noise(60)
+        # Silence right at the start pulls every search towards the previous cut
+        audio[:SAMPLE_RATE] = 0
+
+        windows = plan_windows(audio, window_seconds=15.05, search_seconds=15)
+
+        cuts = [window[2] for window in windows] + [windows[-1][3]]
+        assert all(a < b for a, b in zip(cuts, cuts[1:]))
+
+    def test_rejects_window_not_longer_than_search(self):
+        with pytest.raises(ValueError):
+            plan_windows(noise(60), window_seconds=10, search_seconds=15)
+
+
+class TestStitchWindows:
+    def test_overlap_segments_kept_once(self):
+        windows = [(0.0, 12.0, 0.0, 10.0), (8.0, 20.0, 10.0, 20.0)]
+        shared = {'start': 9.0, 'end': 10.5, 'text': 'shared'}
+        results = [
+            {'segments': [{'start': 1.0, 'end': 2.0, 'text': 'a'}, shared]},
+            {'segments': [dict(shared), {'start': 15.0, 'end': 16.0, 'text': 'b'}]},
+        ]
+
+        segments = stitch_windows(results, windows)
+
+        assert [segment['text'] for segment in segments] == ['a', 'shared', 'b']
+
+
+class TestWorkerPool:
+    def config(self, workers, model='base'):
+        return {'model': model, 'parallel': {'enabled': True, 'workers': workers}}
+
+    def test_pool_identity_follows_config(self):
+        executors, registry = ExecutorManager(), ModelRegistry()
+        keys = {
+            ParallelTranscriber(executors, self.config(workers), registry).pool_key
+            for workers in (2, 2, 3)
+        } | {ParallelTranscriber(executors, self.config(2, 'small'), registry).pool_key}
+        assert len(keys) == 3
+
+    def test_old_pool_release_leaves_new_pool_running(self):
+        executors, registry = ExecutorManager(), ModelRegistry()
+        old = ParallelTranscriber(executors, self.config(2), registry)
+        new = ParallelTranscriber(executors, self.config(3), registry)
+        try:
+            with registry.lease(old.pool_key, old._start_pool, release=old._stop_pool) as old_pool:
+                pass
+            with registry.lease(new.pool_key, new._start_pool, release=new._stop_pool) as new_pool:
+                pass
+            assert new_pool is not old_pool
+
+            registry.unload(old.pool_key)
+            assert new._start_pool() is new_pool
+        finally:
+            executors.shutdown()
@@ -0,0 +1,41 @@
+"""
+Tests for word-boundary phrase matching
+"""
+
+from src.core.phrase_matcher import PhraseMatcher
+
+
+def matcher():
+    return PhraseMatcher({
+        'hook': ['you won\'t believe', 'wait for it', 'wait'],
+        'boost': ['secret', 'right now'],
+        'emotion:joy': ['amazing', 'so happy', 'happy'],
+    })
+
+
+def test_matches_on_word_boundaries_only():
+    assert matcher().phrases('a bright secretary') == set()
+    assert matcher().phrases('the secret is out') == {'secret'}
+
+
+def test_finds_phrases_sharing_a_prefix_or_overlapping():
+    assert matcher().phrases('Wait for it... so happy!') == {'wait for it', 'wait', 'so happy', 'happy'}
+
+
+def test_case_and_typographic_apostrophes_are_normalized():
+    assert matcher().phrases('YOU WON’T BELIEVE this') == {"you won't believe"}
+
+
+def test_count_counts_each_phrase_once_per_text():
+    assert matcher().count('amazing, amazing, right now, wait') == {'hook': 1, 'boost': 1, 'emotion:joy': 1}
+
+
+def test_phrase_in_several_categories_counts_in_each():
+    shared = PhraseMatcher({'hook': ['insane'], 'boost': ['insane', 'crazy']})
+    assert shared.count('insane and crazy') == {'hook': 1, 'boost': 2}
+
+
+def test_empty_matcher():
+    empty = PhraseMatcher({'hook': [], 'boost': ['  ']})
+    assert empty.phrases('anything') == set()
+    assert empty.count('anything') == {'hook': 0, 'boost': 0}
@@ -0,0 +1,74 @@
+"""
+Tests for scene-cut detection and highlight snapping
+"""
+
+import sys
+
+import pytest
+
+from src.core.scene_index import detect_scene_cuts, snap_highlights
+
+
+def fake_ffmpeg(tmp_path, frames, exit_code=0):
+    """Executable that writes 64x36 gray frames of the given brightness, then exits"""
+    script = tmp_path / "ffmpeg"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"for value in {frames!r}:\n"
+        "    sys.stdout.buffer.write(bytes([value]) * 64 * 36)\n"
+        "sys.stdout.flush()\n"
+        f"sys.stderr.write('decode error\\n')\n"
+        f"sys.exit({exit_code})\n"
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+class TestDetectSceneCuts:
+    def test_finds_hard_cuts(self, tmp_path):
+        frames = [10] * 20 + [200] * 20 + [10] * 20
+        ffmpeg = fake_ffmpeg(tmp_path, frames)
+
+        assert detect_scene_cuts("video.mp4", ffmpeg, sample_fps=10) == [2.0, 4.0]
+
+    def test_failed_decode_raises_instead_of_returning_no_cuts(self, tmp_path):
+        ffmpeg = fake_ffmpeg(tmp_path, [], exit_code=1)
+
+        with pytest.raises(RuntimeError, match="decode error"):
+            detect_scene_cuts("video.mp4", ffmpeg)
+
+    def test_missing_ffmpeg_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            detect_scene_cuts("video.mp4", str(tmp_path / "missing"))
+
+
+def highlight(start, end):
+    return {'start_time': start, 'end_time': end}
+
+
+class TestSnapHighlights:
+    def test_snaps_both_edges_to_nearby_cuts(self):
+        highlights = [highlight(10.4, 40.8)]
+
+        moved = snap_highlights(highlights, [10.0, 41.5], 1.5, 25, 65)
+
+        assert moved == 2
+        assert highlights[0] == highlight(10.0, 41.5)
+
+    def test_ignores_far_cuts(self):
+        highlights = [highlight(10.0, 40.0)]
+
+        assert snap_highlights(highlights, [5.0, 45.0], 1.5, 25, 65) == 0
+        assert highlights[0] == highlight(10.0, 40.0)
+
+    def test_keeps_duration_within_limits(self):
+        # Snapping both edges would make the clip 24s, below the minimum
+        highlights = [highlight(10.0, 35.0)]
+
+        snap_highlights(highlights, [11.0, 35.0], 1.5, 25, 65)
+
+        assert highlights[0] == highlight(10.0, 35.0)
+
+    def test_no_cuts(self):
+        assert snap_highlights([highlight(0, 30)], [], 1.5, 25, 65) == 0
@@ -0,0 +1,110 @@
+"""
+Tests for columnar segment scoring and clip window enumeration
+"""
+
+import numpy as np
+import pytest
+
+from src.core.phrase_matcher import PhraseMatcher
+from src.core.segment_scoring import SegmentColumns, candidate_windows, score_columns
+
+
+def columns_for(durations, word_count=10, hits=None):
+    end = np.cumsum(durations, dtype=np.float64)
+    start = end - np.asarray(durations, dtype=np.float64)
+    n = len(durations)
+    return SegmentColumns(
+        start=start,
+        end=end,
+        word_count=np.full(n, word_count, dtype=np.int32),
+        hits=np.zeros((n, 0), dtype=np.int32) if hits is None else np.asarray(hits, dtype=np.int32),
+        categories=[] if hits is None else ['hook', 'boost', 'emotion:joy']
+    )
+
+
+class TestScoreColumns:
+    def test_columns_from_segments(self):
+        matcher = PhraseMatcher({'hook': ['wait'], 'boost': ['secret']})
+        columns = SegmentColumns.from_segments([
+            {'start': 0.0, 'end': 2.0, 'text': 'wait the secret'},
+            {'start': 2.0, 'end': 5.0, 'text': 'nothing here'},
+        ], matcher)
+
+        assert columns.start.tolist() == [0.0, 2.0]
+        assert columns.word_count.tolist() == [3, 2]
+        assert columns.column('boost').tolist() == [1, 0]
+
+    def test_weights_length_penalty_and_position_bonus(self):
+        hits = [[1, 0, 0]] + [[0, 1, 2]] * 18 + [[0, 0, 1]]
+        columns = columns_for([1.0] * 20, hits=hits)
+        columns.word_count[1] = 3
+        columns.word_count[2] = 120
+
+        scores = score_columns(columns, {'joy': 0.5}, hook_weight=2.0, boost_weight=1.5,
+                               audio_scores=np.full(20, 0.25))
+
+        base = 1.5 + 2 * 0.5 + 0.25
+        assert scores[0] == pytest.approx((2.0 + 0.25) * 1.2)
+        assert scores[1] == pytest.approx(base * 0.5 * 1.2)
+        assert scores[2] == pytest.approx(base * 0.7)
+        assert scores[10] == pytest.approx(base)
+        assert scores[19] == pytest.approx((0.5 + 0.25) * 1.1)
+
+    def test_no_categories(self):
+        assert score_columns(columns_for([1.0, 1.0]), {}).tolist() == [0.0, 0.0]
+
+
+class TestCandidateWindows:
+    def test_short_transcript_yields_itself(self):
+        columns = columns_for([2.0, 3.0])
+        windows = candidate_windows(columns, np.array([1.0, 3.0]), 2.0, 10, 60)
+        assert [(w['first'], w['last'], w['peak']) for w in windows] == [(0, 1, 1)]
+
+    def test_no_seed_no_windows(self):
+        columns = columns_for([5.0] * 10)
+        assert candidate_windows(columns, np.ones(10), 2.0, 10, 30) == []
+
+    def test_windows_sharing_a_peak_are_all_kept(self):
+        scores = np.array([0, 0, 5, 0, 0, 0, 0, 0, 4, 3, 0, 0], dtype=np.float64)
+        windows = candidate_windows(columns_for([5.0] * 12), scores, 3.0, 10, 15)
+
+        spans = [(w['first'], w['last'], w['peak']) for w in windows]
+        assert spans == [(1, 2, 2), (2, 3, 2), (7, 8, 8), (8, 9, 8), (9, 10, 9)]
+        assert windows[3]['total_score'] == 7.0 and windows[3]['mean_score'] == 3.5
+
+    def test_targets_producing_the_same_window_emit_it_once(self):
+        scores = np.full(6, 5.0)
+        windows = candidate_windows(columns_for([20.0] * 6), scores, 1.0, 10, 30, target_durations=[10, 15])
+        assert [(w['first'], w['last']) for w in windows] == [(i, i) for i in range(6)]
+
+    @pytest.mark.parametrize('seed', range(10))
+    def test_windows_satisfy_constraints(self, seed):
+        rng = np.random.default_rng(seed)
+        durations = rng.uniform(1, 12, 80)
+        scores = rng.uniform(0, 3, 80)
+        columns = columns_for(durations)
+
+        targets = [20, 30, 60]
+        windows = candidate_windows(columns, scores, 2.5, 15, 45, target_durations=targets)
+
+        # Brute force: per clamped target and start, the shortest window reaching it, cut to fit
+        expected = set()
+        for target in {min(max(t, 15), 45) for t in targets}:
+            for first in range(80):
+                reach = next((j for j in range(first, 80) if columns.end[j] - columns.start[first] >= target), None)
+                if reach is None:
+                    continue
+                last = min(reach, max(j for j in range(first, 80)
+                                      if j == first or columns.end[j] - columns.start[first] <= 45))
+                duration = columns.end[last] - columns.start[first]
+                if duration >= 15 and (duration <= 45 or last == first) and scores[first:last + 1].max() >= 2.5:
+                    expected.add((first, last))
+
+        assert [(w['first'], w['last']) for w in windows] == sorted(expected)
+        for w in windows:
+            duration = w['end_time'] - w['start_time']
+            assert 15 <= duration <= 45 or w['first'] == w['last']
+            segment_scores = scores[w['first']:w['last'] + 1]
+            assert scores[w['peak']] == segment_scores.max() >= 2.5
+            assert w['total_score'] == pytest.approx(segment_scores.sum())
+            assert w['mean_score'] == pytest.approx(segment_scores.mean())
@@ -0,0 +1,47 @@
+"""
+Tests for smart crop subject tracking
+"""
+
+import cv2
+import numpy as np
+
+from src.core.smart_crop import CropPath, SmartCropper
+
+
+def cropper():
+    return SmartCropper({"sample_fps": 2, "smoothing_seconds": 1.5})
+
+
+class TestFaceDetector:
+    def test_missing_cascade_falls_back_to_saliency(self, monkeypatch):
+        monkeypatch.setattr(cv2.data, "haarcascades", "/nonexistent/", raising=False)
+        smart_cropper = cropper()
+        frames = np.zeros((3, 36, 64), dtype=np.uint8)
+
+        assert smart_cropper.face_detector is None
+        assert np.isnan(smart_cropper._face_centers(frames)).all()
+
+
+class TestSaliency:
+    def test_centre_follows_bright_subject(self):
+        rng = np.random.default_rng(0)
+        frames = rng.integers(90, 110, size=(2, 90, 160)).astype(np.uint8)
+        frames[0, 30:60, 10:40] = 255
+        frames[1, 30:60, 120:150] = 255
+
+        centers = SmartCropper._saliency_centers(frames)
+
+        assert centers[0] < 0.35 and centers[1] > 0.65
+
+    def test_flat_frame_holds_centre(self):
+        frames = np.full((1, 90, 160), 16, dtype=np.uint8)
+
+        assert SmartCropper._saliency_centers(frames)[0] == 0.5
+
+
+class TestCropPath:
+    def test_expression_matches_interpolation(self):
+        path = CropPath(np.array([0.0, 1.0, 2.0]), np.array([0.0, 100.0, 100.0]), 608)
+
+        assert path.x_at(0.5) == 50
+        assert path.ffmpeg_expr() == "0.0+100.000*clip(t-0.000,0,1.000)"
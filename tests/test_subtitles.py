@@ -0,0 +1,102 @@
+"""
+Tests for WebVTT parsing and subtitle quality checks
+"""
+
+import pytest
+
+from src.core.subtitles import check_quality, parse_vtt
+
+
+MANUAL = """WEBVTT
+
+1
+00:00:01.000 --> 00:00:04.000
+So I said to him,
+<i>"Don't do it."</i>
+
+2
+00:00:04.500 --> 00:00:06.000
+No.
+
+3
+00:00:06.000 --> 00:00:07.500
+No.
+
+4
+00:01:02,250 --> 00:01:03,000
+Tom &amp; Jerry
+"""
+
+# YouTube rolling captions: each cue repeats the previous line above the new,
+# word-timed one, and a 10 ms cue holds the finished line between them
+AUTO = """WEBVTT
+Kind: captions
+Language: en
+
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+ 
+hello<00:00:00.500><c> there</c><00:00:01.000><c> friend</c>
+
+00:00:02.000 --> 00:00:02.010 align:start position:0%
+hello there friend
+ 
+
+00:00:02.010 --> 00:00:04.000 align:start position:0%
+hello there friend
+how<00:00:02.500><c> are</c><00:00:03.000><c> you</c>
+
+00:00:04.000 --> 00:00:04.010 align:start position:0%
+how are you
+ 
+"""
+
+
+class TestParseVtt:
+    def test_manual_cue_lines_join_into_one_segment(self):
+        segments = parse_vtt(MANUAL)
+        assert segments[0] == {
+            'start': 1.0, 'end': 4.0, 'text': 'So I said to him, "Don\'t do it."', 'words': []
+        }
+
+    def test_manual_repeated_speech_is_kept(self):
+        texts = [segment['text'] for segment in parse_vtt(MANUAL)]
+        assert texts == ['So I said to him, "Don\'t do it."', 'No.', 'No.', 'Tom & Jerry']
+
+    def test_hours_optional_and_comma_millis(self):
+        last = parse_vtt(MANUAL)[-1]
+        assert (last['start'], last['end']) == (62.25, 63.0)
+
+    def test_auto_rolling_overlap_is_collapsed(self):
+        segments = parse_vtt(AUTO, auto=True)
+        assert [segment['text'] for segment in segments] == ['hello there friend', 'how are you']
+
+    def test_auto_words_carry_inline_times(self):
+        segments = parse_vtt(AUTO, auto=True)
+        assert [(w['word'], w['start'], w['end']) for w in segments[1]['words']] == [
+            ('how', 2.01, 2.5), ('are', 2.5, 3.0), ('you', 3.0, 4.0)
+        ]
+        assert segments[1]['start'] == pytest.approx(2.01)
+
+    def test_auto_track_parsed_as_manual_keeps_repeats(self):
+        texts = [segment['text'] for segment in parse_vtt(AUTO)]
+        assert texts == ['hello there friend', 'hello there friend', 'hello there friend how are you', 'how are you']
+
+
+class TestCheckQuality:
+    def test_rejects_empty_track(self):
+        assert check_quality([], 60) == (False, "no cues")
+
+    def test_rejects_mostly_annotations(self):
+        segments = [{'start': i, 'end': i + 1, 'text': '[Music]'} for i in range(5)]
+        usable, reason = check_quality(segments, 5)
+        assert not usable and 'annotations' in reason
+
+    def test_rejects_low_coverage(self):
+        segments = [{'start': 0, 'end': 10, 'text': 'word ' * 20}]
+        usable, reason = check_quality(segments, 100)
+        assert not usable and 'span' in reason
+
+    def test_accepts_plausible_track(self):
+        segments = [{'start': i * 5, 'end': i * 5 + 5, 'text': 'one two three four five six seven'}
+                    for i in range(12)]
+        assert check_quality(segments, 60) == (True, "ok")
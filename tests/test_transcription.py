@@ -0,0 +1,34 @@
+"""
+Tests for transcription engine construction and identity
+"""
+
+import pytest
+
+from src.core.transcription import TranscriptionEngine, create_engine, engine_key
+
+
+def test_base_engine_is_abstract():
+    with pytest.raises(TypeError):
+        TranscriptionEngine({})
+
+
+def test_engine_key_defaults_match_explicit_values():
+    assert engine_key({}) == engine_key({'backend': 'openai-whisper', 'model': 'base', 'beam_size': 5})
+
+
+@pytest.mark.parametrize('option, value', [
+    ('backend', 'faster-whisper'),
+    ('model', 'small'),
+    ('compute_type', 'float32'),
+    ('threads', 2),
+    ('batch_size', 8),
+    ('beam_size', 1),
+])
+def test_engine_key_changes_with_every_decode_option(option, value):
+    assert engine_key({option: value}) != engine_key({})
+
+
+def test_unknown_backend_falls_back_without_loading():
+    engine = create_engine({'backend': 'missing'}, load=False)
+    assert engine.name == 'openai-whisper'
+    assert not engine.loaded
@@ -0,0 +1,96 @@
+"""
+Tests for energy-based voice activity detection and the speech timeline
+"""
+
+import numpy as np
+import pytest
+
+from src.core.vad import SpeechTimeline, detect_speech_regions, frame_energy_db
+
+SAMPLE_RATE = 16000
+
+
+def synthetic_audio(seconds, bursts):
+    """Low noise with loud tone bursts at the given (start, end) seconds"""
+    rng = np.random.default_rng(1)
+    audio = rng.normal(0, 0.001, int(seconds * SAMPLE_RATE)).astype(np.float32)
+    t = np.arange(len(audio)) / SAMPLE_RATE
+    for start, end in bursts:
+        inside = (t >= start) & (t < end)
+        audio[inside] += 0.3 * np.sin(2 * np.pi * 220 * t[inside]).astype(np.float32)
+    return audio
+
+
+def test_frame_energy_matches_unchunked_computation():
+    audio = np.random.default_rng(0).normal(0, 0.1, 16000 * 7 + 123).astype(np.float32)
+    frames = audio[:len(audio) // 480 * 480].reshape(-1, 480)
+    expected = 10.0 * np.log10(np.mean(frames * frames, axis=1) + 1e-10)
+
+    np.testing.assert_allclose(frame_energy_db(audio, 480, chunk_frames=7), expected, rtol=1e-6)
+
+
+def test_frame_energy_of_memmap_audio(tmp_path):
+    mapped = np.memmap(tmp_path / "audio.f32", dtype=np.float32, mode='w+', shape=(48000,))
+    mapped[:] = 0.5
+    np.testing.assert_allclose(frame_energy_db(mapped, 480, chunk_frames=10), 10 * np.log10(0.25 + 1e-10))
+
+
+class TestDetectSpeechRegions:
+    def test_finds_padded_bursts(self):
+        regions = detect_speech_regions(synthetic_audio(10, [(1, 3), (5, 6)]), SAMPLE_RATE)
+
+        assert len(regions) == 2
+        for (start, end), (expected_start, expected_end) in zip(regions, [(0.8, 3.2), (4.8, 6.2)]):
+            assert start == pytest.approx(expected_start, abs=0.05)
+            assert end == pytest.approx(expected_end, abs=0.05)
+
+    def test_short_silence_is_bridged_and_short_burst_dropped(self):
+        audio = synthetic_audio(10, [(1, 3), (3.3, 4), (7, 7.1)])
+        regions = detect_speech_regions(audio, SAMPLE_RATE, pad_ms=0)
+
+        assert len(regions) == 1
+        assert regions[0][0] == pytest.approx(1, abs=0.05)
+        assert regions[0][1] == pytest.approx(4, abs=0.05)
+
+    def test_silence_and_short_audio(self):
+        assert detect_speech_regions(np.zeros(SAMPLE_RATE * 5, dtype=np.float32), SAMPLE_RATE) == []
+        assert detect_speech_regions(np.zeros(100, dtype=np.float32), SAMPLE_RATE) == []
+
+
+class TestSpeechTimeline:
+    def test_gate_concatenates_regions_with_gaps(self):
+        audio = np.arange(10 * SAMPLE_RATE, dtype=np.float32)
+        timeline = SpeechTimeline([(1, 3), (5, 6)], SAMPLE_RATE)
+        gated = timeline.gate(audio)
+
+        gap = int(SpeechTimeline.GAP_SECONDS * SAMPLE_RATE)
+        assert len(gated) == 3 * SAMPLE_RATE + gap
+        assert gated[0] == SAMPLE_RATE
+        assert not gated[2 * SAMPLE_RATE:2 * SAMPLE_RATE + gap].any()
+        assert gated[2 * SAMPLE_RATE + gap] == 5 * SAMPLE_RATE
+        assert timeline.speech_seconds == pytest.approx(3)
+
+    def test_to_source_maps_each_region_and_clamps_gaps(self):
+        timeline = SpeechTimeline([(1, 3), (5, 6)], SAMPLE_RATE)
+
+        assert timeline.to_source(0.5) == pytest.approx(1.5)
+        assert timeline.to_source(2.15) == pytest.approx(3.0)
+        assert timeline.to_source(2.3) == pytest.approx(5.0)
+        assert timeline.to_source(2.8) == pytest.approx(5.5)
+
+    def test_remap_result_moves_segments_and_words(self):
+        timeline = SpeechTimeline([(1, 3), (5, 6)], SAMPLE_RATE)
+        result = {'segments': [
+            {'start': 0.0, 'end': 2.0, 'words': [{'start': 0.0, 'end': 0.5}]},
+            {'start': 2.3, 'end': 3.3, 'words': None},
+        ]}
+
+        timeline.remap_result(result)
+
+        assert [(s['start'], s['end']) for s in result['segments']] == [(1.0, 3.0), (5.0, 6.0)]
+        assert result['segments'][0]['words'][0] == {'start': 1.0, 'end': 1.5}
+
+    def test_empty_timeline_is_identity(self):
+        timeline = SpeechTimeline([], SAMPLE_RATE)
+        assert timeline.to_source(4.2) == 4.2
+        assert len(timeline.gate(np.ones(100, dtype=np.float32))) == 0